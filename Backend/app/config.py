@@ -7,6 +7,68 @@ class Settings(BaseSettings):
     APP_VERSION: str = "0.1.0"
     DEBUG: bool = True
 
+    # How primary/foreign keys are stored: "text" (36-char UUID strings) or
+    # "binary" (16-byte UUIDs). Convert existing databases with migrate_ids.py.
+    ID_STORAGE: str = "text"
+
+    # Connection pool for server databases (PostgreSQL via asyncpg)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SEC: float = 30.0
+    DB_POOL_RECYCLE_SEC: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # 0 disables prepared statement caching (pgbouncer)
+
+    # SQLite: one serialized writer connection plus a read-only pool
+    SQLITE_WRITE_TIMEOUT_SEC: float = 30.0  # Wait for the writer before failing
+    SQLITE_READ_POOL_SIZE: int = 4
+    SQLITE_READ_POOL_OVERFLOW: int = 4
+    SQLITE_CACHE_SIZE_KB: int = 65536  # Page cache per connection
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB memory-mapped reads
+
+    # Cached AdminConfig: re-check its version after this long (other workers' writes)
+    CONFIG_CACHE_TTL_SEC: float = 1.0
+
+    # Materialized market summary (/api/market/state): full rebuild after this long
+    MARKET_SUMMARY_MAX_AGE_SEC: float = 30.0
+
+    # Background auction clock (ticks active auctions every tick_interval_sec)
+    AUCTION_CLOCK_ENABLED: bool = False
+    AUCTION_CLOCK_BATCH_SIZE: int = 500
+    AUCTION_CLOCK_REFRESH_SEC: float = 5.0
+    AUCTION_CLOCK_MAX_SLEEP_SEC: float = 1.0
+
+    # Live event stream (/api/market/stream)
+    EVENT_STREAM_QUEUE_SIZE: int = 256  # Per subscriber; oldest events dropped beyond this
+    EVENT_STREAM_HEARTBEAT_SEC: float = 15.0
+
+    # Patriot AI upstream (/api/student/chat, /api/student/parse-syllabus)
+    PATRIOT_AI_URL: str | None = None  # Defaults to the hosted endpoint; point at a stub for testing
+    PATRIOT_AI_TOKEN: str | None = None
+    PATRIOT_AI_CONNECT_TIMEOUT_SEC: float = 5.0
+    PATRIOT_AI_READ_TIMEOUT_SEC: float = 90.0
+    PATRIOT_AI_MAX_CONCURRENCY: int = 4  # Requests in flight; the rest queue
+    PATRIOT_AI_MAX_RETRIES: int = 2
+    PATRIOT_AI_RETRY_BACKOFF_SEC: float = 0.5  # Base of the jittered exponential backoff
+    PATRIOT_AI_RETRY_MAX_DELAY_SEC: float = 10.0  # Cap on any retry wait, Retry-After included
+
+    # Gemini market analyst (/api/student/chat, /api/admin/market-analysis)
+    GEMINI_BACKEND: str = "gemini"  # "stub" answers locally without the API
+    GEMINI_CACHE_TTL_SEC: float = 300.0
+    GEMINI_CACHE_MAX_ENTRIES: int = 256
+
+    # PettingZoo grid search (/api/pz-simulation/run): worker processes
+    # (0 = one per CPU, 1 = serial) and runs per task (0 = automatic)
+    PZ_GRID_WORKERS: int = 0
+    PZ_GRID_CHUNKSIZE: int = 0
+
+    # Background room imports (/api/admin/import-jobs): finished jobs, and the
+    # upload copies of failed or cancelled ones, are dropped after this long
+    IMPORT_JOB_RETENTION_SEC: float = 3600.0
+
+    # Named database snapshots (/api/admin/snapshots), SQLite only
+    SNAPSHOT_DIR: str = "snapshots"
+
     model_config = {"env_prefix": "MARKET_"}
 
 
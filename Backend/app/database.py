@@ -1,37 +1,143 @@
+import os
+
 from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
-_is_sqlite = "sqlite" in settings.DATABASE_URL
-
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    # SQLite needs single-connection pool + relaxed thread check for async
-    connect_args={"check_same_thread": False} if _is_sqlite else {},
-    poolclass=StaticPool if _is_sqlite else None,
-)
 
-
-@event.listens_for(engine.sync_engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA journal_mode=WAL")
+def database_url(url: str) -> str:
+    """Plain postgres:// URLs (as most hosts hand them out) get the asyncpg driver."""
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def engine_options(url: str) -> dict:
+    """Pool profile for the backend in `url`.
+
+    SQLite allows one writer at a time, so the write engine holds exactly
+    one connection and sessions queue for it (see `read_engine` for reads).
+    Server databases get a real pool sized by the DB_POOL_* settings,
+    pre-pinged so connections dropped by the server or a proxy are replaced
+    transparently.
+    """
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        return {
+            # Relaxed thread check: aiosqlite runs each connection on its own thread
+            "connect_args": {"check_same_thread": False},
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_timeout": settings.SQLITE_WRITE_TIMEOUT_SEC,
+        }
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SEC,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SEC,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            # SQLAlchemy's prepared-statement LRU and asyncpg's own cache;
+            # set DB_STATEMENT_CACHE_SIZE=0 behind pgbouncer in transaction mode
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def sqlite_read_url(url: str) -> str | None:
+    """Read-only URI for the SQLite file in `url`; None for in-memory databases."""
+    parsed = make_url(url)
+    if not parsed.database or parsed.database == ":memory:" or parsed.database.startswith("file:"):
+        return None
+    return f"{parsed.drivername}:///file:{os.path.abspath(parsed.database)}?mode=ro&uri=true"
+
+
+def _tune_sqlite(cursor) -> None:
     cursor.execute("PRAGMA busy_timeout=5000")
-    cursor.execute("PRAGMA synchronous=NORMAL")
-    cursor.close()
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+
+
+_url = database_url(settings.DATABASE_URL)
+_is_sqlite = make_url(_url).get_backend_name() == "sqlite"
+
+engine = create_async_engine(_url, echo=False, **engine_options(_url))
+
+# Reads go to their own engine. For SQLite that is a pool of read-only
+# connections: in WAL mode they read the last committed state while the
+# single writer is busy, so dashboards keep serving during imports and
+# resets. Elsewhere the main pool already serves reads concurrently.
+_read_url = sqlite_read_url(_url) if _is_sqlite else None
+read_engine = engine
+if _read_url:
+    read_engine = create_async_engine(
+        _read_url,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.SQLITE_READ_POOL_SIZE,
+        max_overflow=settings.SQLITE_READ_POOL_OVERFLOW,
+    )
+
+    @event.listens_for(read_engine.sync_engine, "connect")
+    def set_sqlite_read_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        _tune_sqlite(cursor)
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+if _is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        _tune_sqlite(cursor)
+        cursor.close()
 
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+async_read_session = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
     pass
 
 
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def run_after_commit(db: AsyncSession, fn, *args) -> None:
+    """Call `fn(*args)` once `db` commits; dropped if it rolls back instead.
+
+    For keeping in-process state (order book, event stream) in step with
+    what is actually durable.
+    """
+    db.info.setdefault(_AFTER_COMMIT_KEY, []).append((fn, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for fn, args in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        fn(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
 async def get_db() -> AsyncSession:
     async with async_session() as session:
         try:
@@ -41,6 +147,12 @@ async def get_db() -> AsyncSession:
             raise
 
 
+async def get_read_db() -> AsyncSession:
+    """Session for endpoints that only read; never commit through it."""
+    async with async_read_session() as session:
+        yield session
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
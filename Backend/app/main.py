@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from app.config import settings
-from app.database import init_db
+from app.database import async_session, init_db
 import app.models  # noqa: F401 — register all models with SQLAlchemy
 from app.routers import (
     admin,
@@ -22,13 +22,25 @@ from app.routers import (
     bookings,
     student,  # New
 )
+from app.services.auction_clock import auction_clock
+from app.services.import_jobs import import_jobs
+from app.services.order_book import order_book
+from app.services.patriot_ai_client import patriot_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Safe to ignore if tables exist, but ensures data integrity
     await init_db()
+    # Recover the in-memory limit order book from the table
+    async with async_session() as db:
+        await order_book.rebuild(db)
+    if settings.AUCTION_CLOCK_ENABLED:
+        auction_clock.start()
     yield
+    await auction_clock.stop()
+    await import_jobs.shutdown()
+    await patriot_client.aclose()
 
 
 app = FastAPI(
@@ -44,6 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Routers
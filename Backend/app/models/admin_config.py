@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, JSON, String
+from sqlalchemy import DateTime, Float, Integer, JSON, String, literal_column
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -8,6 +8,8 @@ from app.database import Base
 
 class AdminConfig(Base):
     __tablename__ = "admin_config"
+    # Read back the bumped `version` on flush (RETURNING) instead of expiring it
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
     token_starting_amount: Mapped[float] = mapped_column(Float, default=100.0) # User starting balance
@@ -37,3 +39,8 @@ class AdminConfig(Base):
     # Simulation State
     current_simulation_date: Mapped[datetime] = mapped_column(DateTime, default=datetime(2026, 2, 14, 9, 0))
     pricing_model_version: Mapped[int] = mapped_column(Integer, default=1)
+
+    # Bumped by every UPDATE of this row; keys the config cache (see config_cache)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version + 1")
+    )
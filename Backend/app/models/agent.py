@@ -4,13 +4,13 @@ from sqlalchemy import Boolean, DateTime, Float, Integer, String, ForeignKey, fu
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.utils import generate_uuid
+from app.utils import IdType, generate_uuid
 
 
 class Agent(Base):
     __tablename__ = "agents"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     name: Mapped[str] = mapped_column(String, nullable=False)
     token_balance: Mapped[float] = mapped_column(Float, default=0.0)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -43,7 +43,7 @@ class Agent(Base):
 class AgentPreference(Base):
     __tablename__ = "agent_preferences"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     agent_id: Mapped[str] = mapped_column(ForeignKey("agents.id"), nullable=False)
     preference_type: Mapped[str] = mapped_column(String, nullable=False)
     preference_value: Mapped[str] = mapped_column(String, nullable=False)
@@ -1,11 +1,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.utils import generate_uuid
+from app.utils import IdType, generate_uuid
 
 
 class AuctionStatus(str, enum.Enum):
@@ -23,8 +23,12 @@ class BidStatus(str, enum.Enum):
 
 class Auction(Base):
     __tablename__ = "auctions"
+    __table_args__ = (
+        Index("ix_auctions_time_slot_id", "time_slot_id"),
+        Index("ix_auctions_status", "status"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     time_slot_id: Mapped[str] = mapped_column(ForeignKey("time_slots.id"), nullable=False)
     auction_type: Mapped[str] = mapped_column(String, default="dutch")
     status: Mapped[AuctionStatus] = mapped_column(
@@ -38,6 +42,9 @@ class Auction(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Unix time of the last price tick; the clock skips auctions ticked within
+    # their interval, so several worker processes tick each auction once
+    last_ticked_at: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     time_slot: Mapped["TimeSlot"] = relationship(back_populates="auctions")  # noqa: F821
     bids: Mapped[list["Bid"]] = relationship(back_populates="auction", cascade="all, delete-orphan")
@@ -49,7 +56,7 @@ class Auction(Base):
 class Bid(Base):
     __tablename__ = "bids"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     auction_id: Mapped[str] = mapped_column(ForeignKey("auctions.id"), nullable=False)
     agent_id: Mapped[str] = mapped_column(ForeignKey("agents.id"), nullable=False)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
@@ -68,8 +75,11 @@ class Bid(Base):
 
 class GroupBidMember(Base):
     __tablename__ = "group_bid_members"
+    __table_args__ = (
+        Index("ix_group_bid_members_bid_id", "bid_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     bid_id: Mapped[str] = mapped_column(ForeignKey("bids.id"), nullable=False)
     agent_id: Mapped[str] = mapped_column(ForeignKey("agents.id"), nullable=False)
     contribution: Mapped[float] = mapped_column(Float, nullable=False)
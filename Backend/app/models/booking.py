@@ -1,16 +1,22 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.utils import generate_uuid
+from app.utils import IdType, generate_uuid
 
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Capacity count and duplicate check in create_booking_from_bid
+        Index("ix_bookings_time_slot_id_agent_id", "time_slot_id", "agent_id"),
+        # Overlap and max-bookings checks per agent
+        Index("ix_bookings_agent_id", "agent_id"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     time_slot_id: Mapped[str] = mapped_column(ForeignKey("time_slots.id"), nullable=False)
     agent_id: Mapped[str] = mapped_column(ForeignKey("agents.id"), nullable=False)
     bid_id: Mapped[str] = mapped_column(ForeignKey("bids.id"), nullable=False)
@@ -1,11 +1,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, String, func
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.utils import generate_uuid
+from app.utils import IdType, generate_uuid
 
 
 class LimitOrderStatus(str, enum.Enum):
@@ -17,8 +17,13 @@ class LimitOrderStatus(str, enum.Enum):
 
 class LimitOrder(Base):
     __tablename__ = "limit_orders"
+    __table_args__ = (
+        # DutchAuctionEngine.tick: pending orders for a slot at or above the price
+        Index("ix_limit_orders_time_slot_id_status_max_price", "time_slot_id", "status", "max_price"),
+        Index("ix_limit_orders_agent_id_created_at", "agent_id", "created_at"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     agent_id: Mapped[str] = mapped_column(ForeignKey("agents.id"), nullable=False)
     time_slot_id: Mapped[str] = mapped_column(ForeignKey("time_slots.id"), nullable=False)
     max_price: Mapped[float] = mapped_column(Float, nullable=False)
@@ -1,16 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.utils import generate_uuid
+from app.utils import IdType, generate_uuid
 
 
 class PriceHistory(Base):
     __tablename__ = "price_history"
+    __table_args__ = (
+        Index("ix_price_history_auction_id_recorded_at", "auction_id", "recorded_at"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     auction_id: Mapped[str | None] = mapped_column(ForeignKey("auctions.id"), nullable=True)
     time_slot_id: Mapped[str | None] = mapped_column(ForeignKey("time_slots.id"), nullable=True)
     price: Mapped[float] = mapped_column(Float, nullable=False)
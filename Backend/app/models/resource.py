@@ -1,11 +1,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, JSON, String, func
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.utils import generate_uuid
+from app.utils import IdType, generate_uuid
 
 
 class TimeSlotStatus(str, enum.Enum):
@@ -17,7 +17,7 @@ class TimeSlotStatus(str, enum.Enum):
 class Resource(Base):
     __tablename__ = "resources"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     name: Mapped[str] = mapped_column(String, nullable=False)
     resource_type: Mapped[str] = mapped_column(String, nullable=False, default="room")
     location: Mapped[str] = mapped_column(String, nullable=False)
@@ -31,8 +31,14 @@ class Resource(Base):
 
 class TimeSlot(Base):
     __tablename__ = "time_slots"
+    __table_args__ = (
+        # recalculate_prices / trigger_agent_actions: window scans filtered by status
+        Index("ix_time_slots_start_time_status", "start_time", "status"),
+        # Per-resource schedules and timeslot listings, ordered by start time
+        Index("ix_time_slots_resource_id_start_time", "resource_id", "start_time"),
+    )
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_uuid)
     resource_id: Mapped[str] = mapped_column(ForeignKey("resources.id"), nullable=False)
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -40,6 +46,11 @@ class TimeSlot(Base):
         Enum(TimeSlotStatus), default=TimeSlotStatus.AVAILABLE
     )
 
+    # Pricing inputs this slot was last priced with (see pricing_service).
+    # NULL means "reprice on the next incremental pass".
+    priced_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    priced_lead_bucket: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     resource: Mapped["Resource"] = relationship(back_populates="time_slots")
     auctions: Mapped[list["Auction"]] = relationship(back_populates="time_slot")  # noqa: F821
     bookings: Mapped[list["Booking"]] = relationship(back_populates="time_slot")  # noqa: F821
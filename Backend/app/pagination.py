@@ -0,0 +1,119 @@
+"""Keyset pagination and field projection for list endpoints.
+
+A page is requested with `limit` (and `cursor` for every page after the
+first). Rows are ordered by a unique key such as `(start_time, id)` and the
+next page seeks past the last key seen, so a deep page costs the same as the
+first. The opaque cursor for the next page is returned in the
+`X-Next-Cursor` response header, which keeps the body a plain list for
+existing clients; no header means there are no more rows. Without `limit`
+the endpoints return everything, as before.
+
+`fields=id,current_price,...` limits each item to the named response
+fields; relationships that are not asked for are never loaded.
+"""
+import base64
+import json
+from datetime import datetime
+from functools import lru_cache
+
+from fastapi import HTTPException, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, create_model
+from sqlalchemy import Select, String, literal, tuple_, type_coerce
+
+from app.utils import IdType
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 1000
+_KEY_PREFIX = "_page_key_"
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError
+        return [datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v for v in values]
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _as_stored(col):
+    # Ids keep their own type: it converts binary storage losslessly
+    return col if isinstance(col.type, IdType) else type_coerce(col, String)
+
+
+def keyset_page(
+    query: Select,
+    key: list,
+    limit: int | None,
+    cursor: str | None,
+    descending: bool = False,
+) -> Select:
+    """Order `query` by `key` columns and, when paging, seek past `cursor`.
+
+    The key columns are also selected as-stored (no type conversion), so
+    the cursor compares against exactly what ORDER BY sorted on; SQLite
+    keeps server-default timestamps in a different text form than bound
+    datetimes. Fetches one extra row so `finish_page` can tell whether a
+    next page exists; read entities with `row[0]`.
+    """
+    query = query.add_columns(
+        *(_as_stored(col).label(f"{_KEY_PREFIX}{i}") for i, col in enumerate(key))
+    ).order_by(*(col.desc() if descending else col for col in key))
+    if cursor:
+        after = tuple_(*(
+            literal(v, col.type) if isinstance(col.type, IdType) else literal(v)
+            for v, col in zip(decode_cursor(cursor, len(key)), key)
+        ))
+        query = query.where(tuple_(*key) < after if descending else tuple_(*key) > after)
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def finish_page(rows: list, limit: int | None, response: Response) -> list:
+    """Trim the look-ahead row and set the next-page cursor header."""
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, name) for name in last._fields if name.startswith(_KEY_PREFIX)]
+        )
+    return rows
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [n for n in names if n not in schema.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(schema.model_fields)}",
+        )
+    return names
+
+
+@lru_cache(maxsize=128)
+def _projection(schema: type[BaseModel], names: tuple[str, ...]) -> type[BaseModel]:
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__={"from_attributes": True},
+        **{n: (schema.model_fields[n].annotation, schema.model_fields[n]) for n in names},
+    )
+
+
+def project(items: list, schema: type[BaseModel], names: tuple[str, ...], response: Response) -> JSONResponse:
+    """Serialize only `names` of each item; other attributes are never touched."""
+    model = _projection(schema, names)
+    return JSONResponse(
+        content=[model.model_validate(item).model_dump(mode="json") for item in items],
+        headers=dict(response.headers),
+    )
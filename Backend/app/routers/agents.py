@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.pagination import MAX_PAGE_SIZE, finish_page, keyset_page, parse_fields, project
 from app.models import Agent, AgentPreference, Booking, LimitOrder, Transaction
 from app.models.resource import Resource, TimeSlot
 from app.schemas.agent import (
@@ -54,18 +55,28 @@ async def create_agents_bulk(data: BulkAgentCreate, db: AsyncSession = Depends(g
 
 @router.get("/", response_model=list[AgentResponse])
 async def list_agents(
+    response: Response,
     is_active: bool | None = None,
-    db: AsyncSession = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """Agents in creation order; page with `limit`/`cursor` (see app.pagination)."""
+    names = parse_fields(fields, AgentResponse)
     query = select(Agent)
     if is_active is not None:
         query = query.where(Agent.is_active == is_active)
-    result = await db.execute(query)
-    return result.scalars().all()
+    query = keyset_page(query, [Agent.created_at, Agent.id], limit, cursor)
+    rows = finish_page((await db.execute(query)).all(), limit, response)
+    agents = [row[0] for row in rows]
+    if names:
+        return project(agents, AgentResponse, names, response)
+    return agents
 
 
 @router.get("/{agent_id}", response_model=AgentResponse)
-async def get_agent(agent_id: str, db: AsyncSession = Depends(get_db)):
+async def get_agent(agent_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Agent).where(Agent.id == agent_id))
     agent = result.scalar_one_or_none()
     if not agent:
@@ -89,7 +100,7 @@ async def update_agent(agent_id: str, data: AgentCreate, db: AsyncSession = Depe
 
 
 @router.get("/{agent_id}/preferences", response_model=list[AgentPreferenceResponse])
-async def get_preferences(agent_id: str, db: AsyncSession = Depends(get_db)):
+async def get_preferences(agent_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(AgentPreference).where(AgentPreference.agent_id == agent_id)
     )
@@ -128,7 +139,7 @@ async def set_preferences(
 
 
 @router.get("/{agent_id}/bookings", response_model=list[BookingDetailResponse])
-async def get_agent_bookings(agent_id: str, db: AsyncSession = Depends(get_db)):
+async def get_agent_bookings(agent_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(Booking)
         .where(Booking.agent_id == agent_id)
@@ -159,17 +170,29 @@ async def get_agent_bookings(agent_id: str, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{agent_id}/transactions", response_model=list[TransactionResponse])
-async def get_agent_transactions(agent_id: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Transaction)
-        .where(Transaction.agent_id == agent_id)
-        .order_by(Transaction.created_at.desc())
+async def get_agent_transactions(
+    agent_id: str,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Newest first; page with `limit`/`cursor` (see app.pagination)."""
+    names = parse_fields(fields, TransactionResponse)
+    query = keyset_page(
+        select(Transaction).where(Transaction.agent_id == agent_id),
+        [Transaction.created_at, Transaction.id], limit, cursor, descending=True,
     )
-    return result.scalars().all()
+    rows = finish_page((await db.execute(query)).all(), limit, response)
+    transactions = [row[0] for row in rows]
+    if names:
+        return project(transactions, TransactionResponse, names, response)
+    return transactions
 
 
 @router.get("/{agent_id}/limit-orders", response_model=list[LimitOrderDetailResponse])
-async def get_agent_limit_orders(agent_id: str, db: AsyncSession = Depends(get_db)):
+async def get_agent_limit_orders(agent_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(LimitOrder)
         .where(LimitOrder.agent_id == agent_id)
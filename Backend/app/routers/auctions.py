@@ -1,13 +1,13 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.pagination import MAX_PAGE_SIZE, finish_page, keyset_page, parse_fields, project
 from app.models import (
-    AdminConfig,
     Agent,
     Auction,
     AuctionStatus,
@@ -31,6 +31,8 @@ from app.schemas.auction import (
 )
 from app.services.auction_engine import get_auction_engine
 from app.services.booking_service import create_booking_from_bid
+from app.services.config_cache import config_cache
+from app.services.order_book import order_book
 
 router = APIRouter(prefix="/api/auctions", tags=["auctions"])
 
@@ -46,8 +48,7 @@ async def create_auction(data: AuctionCreate, db: AsyncSession = Depends(get_db)
         raise HTTPException(status_code=400, detail="Time slot is not available")
 
     # Get defaults from admin config
-    cfg_result = await db.execute(select(AdminConfig).where(AdminConfig.id == 1))
-    config = cfg_result.scalar_one_or_none()
+    config = await config_cache.get(db)
 
     auction = Auction(
         time_slot_id=data.time_slot_id,
@@ -61,6 +62,7 @@ async def create_auction(data: AuctionCreate, db: AsyncSession = Depends(get_db)
     db.add(auction)
 
     slot.status = TimeSlotStatus.IN_AUCTION
+    slot.priced_version = None  # Let the next repricing pass take over this auction
     await db.commit()
     await db.refresh(auction)
     return auction
@@ -68,16 +70,23 @@ async def create_auction(data: AuctionCreate, db: AsyncSession = Depends(get_db)
 
 @router.get("/", response_model=list[AuctionResponse])
 async def list_auctions(
+    response: Response,
     status: str | None = None,
     resource_id: str | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-    db: AsyncSession = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    query = select(Auction).options(
-        joinedload(Auction.time_slot).joinedload(TimeSlot.bookings)
-    ).join(TimeSlot)
-    
+    """Auctions ordered by slot start time; page with `limit`/`cursor` (see app.pagination)."""
+    names = parse_fields(fields, AuctionResponse)
+    query = select(Auction).join(TimeSlot)
+    if names is None or "time_slot" in names:
+        # The join above already carries the slot; only bookings need a second query
+        query = query.options(contains_eager(Auction.time_slot).selectinload(TimeSlot.bookings))
+
     if status:
         query = query.where(Auction.status == status)
     if resource_id:
@@ -86,13 +95,17 @@ async def list_auctions(
         query = query.where(TimeSlot.start_time >= start_date)
     if end_date:
         query = query.where(TimeSlot.end_time <= end_date)
-        
-    result = await db.execute(query)
-    return result.scalars().unique().all()
+
+    query = keyset_page(query, [TimeSlot.start_time, Auction.id], limit, cursor)
+    rows = finish_page((await db.execute(query)).all(), limit, response)
+    auctions = [row[0] for row in rows]
+    if names:
+        return project(auctions, AuctionResponse, names, response)
+    return auctions
 
 
 @router.get("/{auction_id}", response_model=AuctionResponse)
-async def get_auction(auction_id: str, db: AsyncSession = Depends(get_db)):
+async def get_auction(auction_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(Auction).options(
             joinedload(Auction.time_slot).joinedload(TimeSlot.bookings)
@@ -176,7 +189,7 @@ async def place_bid(
 
 
 @router.get("/{auction_id}/price-history", response_model=list[PriceHistoryResponse])
-async def get_price_history(auction_id: str, db: AsyncSession = Depends(get_db)):
+async def get_price_history(auction_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(
         select(PriceHistory)
         .where(PriceHistory.auction_id == auction_id)
@@ -211,6 +224,8 @@ async def create_limit_order(
         max_price=data.max_price,
     )
     db.add(order)
+    await db.flush()
+    order_book.stage_add(db, order)
     await db.commit()
     await db.refresh(order)
     return order
@@ -226,5 +241,6 @@ async def cancel_limit_order(order_id: str, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Only pending orders can be cancelled")
 
     order.status = LimitOrderStatus.CANCELLED
+    order_book.stage_discard(db, order.id)
     await db.commit()
     return None
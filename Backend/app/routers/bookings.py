@@ -6,6 +6,7 @@ from pydantic import BaseModel
 from app.database import get_db
 from app.models import Booking, Agent, Bid, Transaction
 from app.schemas.auction import BookingResponse
+from app.services.event_bus import event_bus
 
 router = APIRouter(prefix="/api/bookings", tags=["bookings"])
 
@@ -121,6 +122,7 @@ async def sell_back_booking(booking_id: str, action: SellBackAction, db: AsyncSe
     slot = slot_res.scalar_one_or_none()
     if slot:
         slot.status = TimeSlotStatus.IN_AUCTION
+        slot.priced_version = None  # Back on the market: reprice on the next pass
         
         # Reset Auction if exists
         auc_res = await db.execute(select(Auction).where(Auction.time_slot_id == slot.id))
@@ -133,6 +135,11 @@ async def sell_back_booking(booking_id: str, action: SellBackAction, db: AsyncSe
     
     # 6. Update Booking
     booking.status = "cancelled"
+    event_bus.publish_after_commit(db, {
+        "type": "booking_cancelled", "booking_id": booking.id,
+        "auction_id": auction.id if slot and auction else None,
+        "time_slot_id": booking.time_slot_id, "agent_id": booking.agent_id,
+    })
     
     await db.commit()
     return {"message": "Booking sold back", "refund_amount": refund_amount}
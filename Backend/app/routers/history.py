@@ -5,7 +5,7 @@ from typing import List
 import pandas as pd
 import io
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models import Resource
 from app.services.historical_analyst import HistoricalAnalyst
 from app.services.market_simulator import RoomMarketSimulator
@@ -45,7 +45,7 @@ async def analyze_history(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @router.post("/simulate", response_model=List[SimulationResult])
-async def run_simulation(config: SimulationConfig, db: AsyncSession = Depends(get_db)):
+async def run_simulation(config: SimulationConfig, db: AsyncSession = Depends(get_read_db)):
     """
     Run an in-memory market simulation based on the provided configuration.
     Returns a list of all bookings made during the simulation.
@@ -76,7 +76,7 @@ async def run_simulation(config: SimulationConfig, db: AsyncSession = Depends(ge
         raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
 
 @router.post("/optimize", response_model=OptimizationResponse)
-async def optimize_price(config: OptimizationRequest, db: AsyncSession = Depends(get_db)):
+async def optimize_price(config: OptimizationRequest, db: AsyncSession = Depends(get_read_db)):
     """
     Run multiple simulations to find the base price that maximizes revenue.
     """
@@ -1,52 +1,98 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import select, func
+import asyncio
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
-from app.database import get_db
-from app.models import (
-    Auction,
-    AuctionStatus,
-    Booking,
-    PriceHistory,
-    Resource,
-    TimeSlot,
-    TimeSlotStatus,
-)
-from app.schemas.auction import AuctionResponse, BookingResponse, PriceHistoryResponse
+from app.config import settings
+from app.database import get_read_db
+from app.models import PriceHistory, Resource, TimeSlot
+from app.schemas.auction import BookingResponse, PriceHistoryResponse
 from app.schemas.resource import ResourceResponse, TimeSlotResponse
+from app.services.auction_clock import auction_clock
+from app.services.event_bus import event_bus
+from app.services.market_summary import market_summary
 
 router = APIRouter(prefix="/api/market", tags=["market"])
 
 
 @router.get("/state")
-async def get_market_state(db: AsyncSession = Depends(get_db)):
-    # Active auctions
-    active_result = await db.execute(
-        select(Auction).where(Auction.status == AuctionStatus.ACTIVE)
-    )
-    active_auctions = active_result.scalars().all()
-
-    # Counts
-    total_resources = await db.execute(select(func.count()).select_from(Resource))
-    available_slots = await db.execute(
-        select(func.count())
-        .select_from(TimeSlot)
-        .where(TimeSlot.status == TimeSlotStatus.AVAILABLE)
+async def get_market_state(db: AsyncSession = Depends(get_read_db)):
+    """Market-wide totals from the materialized summary; no table scans.
+    List the active auctions themselves with /api/auctions/?status=active."""
+    return await market_summary.get(db)
+
+
+@router.get("/clock")
+async def get_auction_clock():
+    """Background auction clock health: lag, backlog and tick counters."""
+    return auction_clock.metrics()
+
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/stream")
+async def stream_market_events(
+    request: Request,
+    resource_id: str | None = None,
+    auction_id: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Server-sent events: price ticks, bookings and simulation clock changes.
+
+    Narrow with `resource_id` (slots that exist when the stream opens) and/or
+    `auction_id`. A client that falls behind gets a `dropped` event with the
+    number of events it missed, and should re-fetch what it displays.
+    """
+    time_slot_ids = None
+    if resource_id:
+        slots = await db.execute(select(TimeSlot.id).where(TimeSlot.resource_id == resource_id))
+        time_slot_ids = set(slots.scalars().all())
+    sub = event_bus.subscribe(auction_id=auction_id, time_slot_ids=time_slot_ids)
+
+    async def events():
+        reported = 0
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        sub.queue.get(), timeout=settings.EVENT_STREAM_HEARTBEAT_SEC
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                if sub.dropped > reported:
+                    yield _sse({"type": "dropped", "count": sub.dropped - reported})
+                    reported = sub.dropped
+                yield _sse(event)
+        finally:
+            event_bus.unsubscribe(sub)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    total_bookings = await db.execute(select(func.count()).select_from(Booking))
 
-    return {
-        "active_auctions": [AuctionResponse.model_validate(a) for a in active_auctions],
-        "total_resources": total_resources.scalar(),
-        "available_slots": available_slots.scalar(),
-        "total_bookings": total_bookings.scalar(),
-    }
+
+@router.get("/stream/stats")
+async def get_stream_stats():
+    return event_bus.metrics()
 
 
 @router.get("/price-history", response_model=list[PriceHistoryResponse])
 async def get_all_price_history(
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     result = await db.execute(
         select(PriceHistory)
@@ -57,28 +103,48 @@ async def get_all_price_history(
 
 
 @router.get("/resources", response_model=list[ResourceResponse])
-async def get_resources_with_availability(db: AsyncSession = Depends(get_db)):
+async def get_resources_with_availability(db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Resource).where(Resource.is_active == True))
     return result.scalars().all()
 
 
 @router.get("/resources/{resource_id}/schedule")
-async def get_resource_schedule(resource_id: str, db: AsyncSession = Depends(get_db)):
+async def get_resource_schedule(
+    resource_id: str,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    limit: int | None = Query(None, ge=1, le=5000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Slots for a resource in start order, each with its bookings.
+
+    One query however many slots match: the page of slots is picked in a
+    subquery and outer-joined to its bookings, which fill `slot.bookings`
+    directly. Narrow with `start_date`/`end_date` (on slot start) and page
+    with `limit`/`offset`.
+    """
+    page = select(TimeSlot.id).where(TimeSlot.resource_id == resource_id)
+    if start_date:
+        page = page.where(TimeSlot.start_time >= start_date)
+    if end_date:
+        page = page.where(TimeSlot.start_time <= end_date)
+    if limit is not None or offset:
+        page = page.order_by(TimeSlot.start_time, TimeSlot.id).limit(limit).offset(offset)
+    page = page.subquery()
+
     slots_result = await db.execute(
         select(TimeSlot)
-        .where(TimeSlot.resource_id == resource_id)
-        .order_by(TimeSlot.start_time)
+        .join(page, page.c.id == TimeSlot.id)
+        .outerjoin(TimeSlot.bookings)
+        .options(contains_eager(TimeSlot.bookings))
+        .order_by(TimeSlot.start_time, TimeSlot.id)
     )
-    slots = slots_result.scalars().all()
-
-    schedule = []
-    for slot in slots:
-        bookings_result = await db.execute(
-            select(Booking).where(Booking.time_slot_id == slot.id)
-        )
-        bookings = bookings_result.scalars().all()
-        schedule.append({
+
+    return [
+        {
             "slot": TimeSlotResponse.model_validate(slot),
-            "bookings": [BookingResponse.model_validate(b) for b in bookings],
-        })
-    return schedule
+            "bookings": [BookingResponse.model_validate(b) for b in slot.bookings],
+        }
+        for slot in slots_result.unique().scalars().all()
+    ]
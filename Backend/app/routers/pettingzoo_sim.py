@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models.admin_config import AdminConfig
 from app.schemas.pettingzoo_sim import (
@@ -72,6 +73,7 @@ def _sim_config_from_request(req: PZSimConfig) -> SimulationConfig:
         auction_price_step=req.auction_price_step,
         max_ticks=req.max_ticks,
         high_demand_days=[(d[0], d[1]) for d in req.high_demand_days if len(d) == 2],
+        engine=req.engine,
     )
     if profiles:
         kwargs["agent_profiles"] = profiles
@@ -115,6 +117,8 @@ async def start_grid_search(request: PZGridSearchRequest):
         token_amounts=request.token_amounts,
         token_frequencies=request.token_frequencies,
         num_seeds=request.num_seeds,
+        workers=settings.PZ_GRID_WORKERS,
+        chunksize=settings.PZ_GRID_CHUNKSIZE,
     )
 
     def _run():
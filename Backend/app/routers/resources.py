@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.pagination import MAX_PAGE_SIZE, finish_page, keyset_page, parse_fields, project
 from app.models import Resource, TimeSlot
 from app.schemas.resource import (
     ResourceCreate,
@@ -30,7 +32,7 @@ async def create_resource(data: ResourceCreate, db: AsyncSession = Depends(get_d
 async def list_resources(
     resource_type: str | None = None,
     location: str | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     query = select(Resource).where(Resource.is_active == True)
     if resource_type:
@@ -42,7 +44,7 @@ async def list_resources(
 
 
 @router.get("/{resource_id}", response_model=ResourceResponse)
-async def get_resource(resource_id: str, db: AsyncSession = Depends(get_db)):
+async def get_resource(resource_id: str, db: AsyncSession = Depends(get_read_db)):
     result = await db.execute(select(Resource).where(Resource.id == resource_id))
     resource = result.scalar_one_or_none()
     if not resource:
@@ -60,8 +62,18 @@ async def update_resource(
     resource = result.scalar_one_or_none()
     if not resource:
         raise HTTPException(status_code=404, detail="Resource not found")
-    for field, value in updates.model_dump(exclude_unset=True).items():
+    update_data = updates.model_dump(exclude_unset=True)
+    reprice = any(
+        field in ("capacity", "location") and getattr(resource, field) != value
+        for field, value in update_data.items()
+    )
+    for field, value in update_data.items():
         setattr(resource, field, value)
+    if reprice:
+        # Capacity and location feed the price model; reprice this room's slots
+        await db.execute(
+            update(TimeSlot).where(TimeSlot.resource_id == resource.id).values(priced_version=None)
+        )
     await db.commit()
     await db.refresh(resource)
     return resource
@@ -129,21 +141,32 @@ async def generate_time_slots(
 @router.get("/{resource_id}/timeslots", response_model=list[TimeSlotResponse])
 async def list_time_slots(
     resource_id: str,
+    response: Response,
     status: str | None = None,
-    db: AsyncSession = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """Slots in start order; page with `limit`/`cursor` (see app.pagination)."""
+    names = parse_fields(fields, TimeSlotResponse)
     query = select(TimeSlot).where(TimeSlot.resource_id == resource_id)
     if status:
         query = query.where(TimeSlot.status == status)
-    query = query.order_by(TimeSlot.start_time)
-    result = await db.execute(query)
-    return result.scalars().all()
+    if names is None or "booked_agent_ids" in names:
+        query = query.options(selectinload(TimeSlot.bookings))
+    query = keyset_page(query, [TimeSlot.start_time, TimeSlot.id], limit, cursor)
+    rows = finish_page((await db.execute(query)).all(), limit, response)
+    slots = [row[0] for row in rows]
+    if names:
+        return project(slots, TimeSlotResponse, names, response)
+    return slots
 
 
 @router.get("/{resource_id}/price-history")
 async def get_resource_price_history(
     resource_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get aggregated price history for a resource's time slots."""
     from app.models import PriceHistory
@@ -1,11 +1,11 @@
 from datetime import datetime, timedelta
-import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, literal, select, text, update
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import (
     AdminConfig,
     Agent,
@@ -23,6 +23,8 @@ from app.models import (
 from app.models.limit_order import LimitOrder
 from app.schemas.agent import AgentResponse, BulkAgentCreate
 from app.services.auction_engine import get_auction_engine
+from app.services.event_bus import event_bus
+from app.services.order_book import order_book
 from app.services.preference_generator import generate_preferences_for_agent
 from app.services.pricing_service import recalculate_prices
 from app.services.simulation_service import (
@@ -31,9 +33,23 @@ from app.services.simulation_service import (
     simulate_semester,
     trigger_agent_actions,
 )
+from app.utils import sql_uuid
 
 router = APIRouter(prefix="/api/simulation", tags=["simulation"])
 
+
+def _publish_clock(db: AsyncSession, config: AdminConfig) -> None:
+    event_bus.publish_after_commit(db, {
+        "type": "clock",
+        "current_simulation_date": config.current_simulation_date.isoformat(),
+    })
+
+
+@router.get("/results")
+async def simulation_results(db: AsyncSession = Depends(get_read_db)):
+    return await get_simulation_results(db)
+
+
 @router.post("/time/advance-day")
 async def advance_day(db: AsyncSession = Depends(get_db)):
     import traceback
@@ -56,7 +72,7 @@ async def advance_day(db: AsyncSession = Depends(get_db)):
         config.current_simulation_date += timedelta(days=1)
         
         # 2. Recalculate Prices
-        await recalculate_prices(db, config.current_simulation_date)
+        await recalculate_prices(db, config.current_simulation_date, incremental=True)
         
         # 3. Trigger Agent Actions (Simulate activity for the day passed)
         # We might want to simulate hour by hour, but for speed just trigger once?
@@ -66,6 +82,7 @@ async def advance_day(db: AsyncSession = Depends(get_db)):
             sim_time = current_date.replace(hour=h, minute=0)
             actions += await trigger_agent_actions(db, sim_time)
         
+        _publish_clock(db, config)
         await db.commit()
         return {"current_date": config.current_simulation_date.isoformat(), "message": "Advanced 1 day", "actions_triggered": actions}
     except Exception as e:
@@ -89,11 +106,12 @@ async def advance_hour(db: AsyncSession = Depends(get_db)):
     new_date = config.current_simulation_date
     
     # 2. Recalculate Prices (Dynamic Pricing reaction)
-    await recalculate_prices(db, new_date)
+    await recalculate_prices(db, new_date, incremental=True)
     
     # 3. Agent Actions
     actions = await trigger_agent_actions(db, current_date) # Act on the hour that just finished/ongoing
     
+    _publish_clock(db, config)
     await db.commit()
     return {"current_date": new_date.isoformat(), "message": "Advanced 1 hour", "actions_triggered": actions}
 
@@ -108,14 +126,25 @@ async def reset_time(db: AsyncSession = Depends(get_db)):
         config = AdminConfig(id=1, current_simulation_date=datetime(2026, 2, 15, 9, 0))
         db.add(config)
     
+    _publish_clock(db, config)
     await db.commit()
     return {"current_date": "2026-02-15T09:00:00", "message": "Time reset"}
 
 
+# Everything a reset wipes, children before parents. Auctions are kept
+# and reopened in place below.
+_RESET_TABLES = (GroupBidMember, LimitOrder, Booking, PriceHistory, Transaction, Bid, AgentPreference)
+
+
 @router.post("/reset")
 async def reset_simulation(db: AsyncSession = Depends(get_db)):
     """Reset all simulation data (auctions, bookings, etc.).
-    Preserves resources, time slots, admin config, and agents (with reset balances)."""
+    Preserves resources, time slots, admin config, and agents (with reset balances).
+
+    Set-based: a fixed handful of statements whatever the catalog size, and
+    no rows are loaded into Python. Every slot ends up with exactly one
+    active Dutch auction at the opening price: existing auctions are reopened
+    in place (keeping their ids) and only slots without one get a new row."""
     # Get admin config for default balance
     config_result = await db.execute(select(AdminConfig))
     config = config_result.scalar_one_or_none()
@@ -124,67 +153,64 @@ async def reset_simulation(db: AsyncSession = Depends(get_db)):
     # Reset Date as well
     if config:
         config.current_simulation_date = datetime(2026, 2, 15, 9, 0)
+        await db.flush()
+        _publish_clock(db, config)
 
-    # Delete in dependency order
-    await db.execute(delete(GroupBidMember))
-    await db.execute(delete(LimitOrder))
-    await db.execute(delete(Booking))
-    await db.execute(delete(PriceHistory))
-    await db.execute(delete(Transaction))
-    await db.execute(delete(Bid))
-    await db.execute(delete(Auction))
-    await db.execute(delete(AgentPreference))
+    if db.get_bind().dialect.name == "postgresql":
+        tables = ", ".join(model.__tablename__ for model in _RESET_TABLES)
+        await db.execute(text(f"TRUNCATE {tables}"))
+    else:
+        # A DELETE with no WHERE is SQLite's truncate fast path
+        for model in _RESET_TABLES:
+            await db.execute(delete(model))
+    order_book.stage_clear(db)
 
     # Reset agents instead of deleting them
-    agent_result = await db.execute(select(Agent))
-    agents = agent_result.scalars().all()
-    if agents:
-        for agent in agents:
-            agent.token_balance = default_balance
-    else:
+    result = await db.execute(update(Agent).values(token_balance=default_balance))
+    if result.rowcount == 0:
         # No agents exist — seed defaults
         for i in range(1, 7):
             db.add(Agent(name=f"User_{i}", token_balance=default_balance, max_bookings=10))
 
-    # Reset time slot statuses and recreate auctions
-    result = await db.execute(select(TimeSlot))
-    slots = result.scalars().all()
+    # Reset time slot statuses; reopened auctions reprice on the next pass
+    await db.execute(
+        update(TimeSlot).values(status=TimeSlotStatus.IN_AUCTION, priced_version=None)
+    )
 
-    start_price = config.dutch_start_price if config else 80.0
-    min_price = config.dutch_min_price if config else 5.0
-    price_step = config.dutch_price_step if config else 3.0
-    tick_interval = config.dutch_tick_interval_sec if config else 10.0
+    opening = {
+        "auction_type": "dutch",
+        "status": AuctionStatus.ACTIVE,
+        "start_price": config.dutch_start_price if config else 80.0,
+        "current_price": config.dutch_start_price if config else 80.0,
+        "min_price": config.dutch_min_price if config else 5.0,
+        "price_step": config.dutch_price_step if config else 3.0,
+        "tick_interval_sec": config.dutch_tick_interval_sec if config else 10.0,
+        "created_at": config.current_simulation_date if config else datetime.utcnow(),
+    }
 
-    auctions_to_insert = []
-    created_at = config.current_simulation_date if config else datetime.utcnow()
-    
-    # Bulk Update Slots status? Ideally, but iterating objects updates session
-    # For speed, we might want bulk update too, but object iteration is okay for now if we bulk insert auctions
-    
-    for slot in slots:
-        slot.status = TimeSlotStatus.IN_AUCTION
-        auctions_to_insert.append({
-            "id": str(uuid.uuid4()), # We need to import uuid if not present, check
-            "time_slot_id": slot.id,
-            "auction_type": "dutch",
-            "start_price": start_price,
-            "current_price": start_price,
-            "min_price": min_price,
-            "price_step": price_step,
-            "tick_interval_sec": tick_interval,
-            "created_at": created_at,
-            "status": AuctionStatus.ACTIVE
-        })
-    
-    if auctions_to_insert:
-        from sqlalchemy import insert
-        await db.execute(insert(Auction), auctions_to_insert)
-        
-    # We need to start engines? 
-    # get_auction_engine("dutch").start() usually just sets status to active or logs
-    # If engine.start does DB changes, we might skip it or do it in bulk. 
-    # Standard Dutch auction start just is "Active".
-     
+    # One auction per slot: drop relisted extras, reopen the rest
+    other = aliased(Auction)
+    await db.execute(
+        delete(Auction).where(
+            select(other.id)
+            .where(other.time_slot_id == Auction.time_slot_id, other.id < Auction.id)
+            .exists()
+        )
+    )
+    await db.execute(update(Auction).values(**opening, started_at=None, ended_at=None, last_ticked_at=None))
+
+    # Slots that never had an auction get one
+    columns = Auction.__table__.c
+    await db.execute(
+        insert(Auction).from_select(
+            ["id", "time_slot_id", *opening],
+            select(
+                sql_uuid(),
+                TimeSlot.id,
+                *(literal(value, columns[name].type) for name, value in opening.items()),
+            ).where(~select(Auction.id).where(Auction.time_slot_id == TimeSlot.id).exists()),
+        )
+    )
 
     await db.commit()
     return {"status": "reset_complete"}
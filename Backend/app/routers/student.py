@@ -2,12 +2,14 @@ from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from datetime import datetime, timedelta
+import asyncio
 import uuid
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.agent import Agent
 from app.models.limit_order import LimitOrder, LimitOrderStatus
 from app.models.resource import TimeSlot, TimeSlotStatus, Resource
+from app.services.order_book import order_book
 from app.services.patriot_ai_client import patriot_client
 
 router = APIRouter(prefix="/api/student", tags=["student"])
@@ -19,14 +21,14 @@ async def parse_syllabus(file: UploadFile = File(...)):
         content = await file.read()
         
         # 1. Extract Text
-        text = patriot_client.extract_text_from_pdf(content)
+        text = await asyncio.to_thread(patriot_client.extract_text_from_pdf, content)
         if not text:
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
             
         # 2. Ask Patriot AI
         # Mock response if extraction fails or for testing without live API if needed
         # exams = [{"name": "Midterm 1", "date": "2026-03-01", "time": "10:00"}]
-        exams = patriot_client.parse_syllabus(text)
+        exams = await patriot_client.parse_syllabus(text)
         
         # Fallback Mock for Hackathon Demo if API fails/timeout
         if not exams:
@@ -114,6 +116,7 @@ async def create_exam_orders(payload: dict, db: AsyncSession = Depends(get_db)):
                 status=LimitOrderStatus.PENDING
             )
             db.add(order)
+            order_book.stage_add(db, order)
             used_auction_ids.add(auction.id)
             orders_created += 1
     
@@ -121,10 +124,10 @@ async def create_exam_orders(payload: dict, db: AsyncSession = Depends(get_db)):
     return {"orders_count": orders_created, "message": f"Created {orders_created} limit orders for {len(exams)} exams"}
 
 from app.services.gemini_client import gemini_client
-from app.models.admin_config import AdminConfig
+from app.services.config_cache import config_cache
 
 @router.post("/chat")
-async def chat_with_agent(payload: dict, db: AsyncSession = Depends(get_db)):
+async def chat_with_agent(payload: dict, db: AsyncSession = Depends(get_read_db)):
     """
     Send a text message to Patriot AI / Gemini Market Analyst.
     Payload: {"message": "str", "history": []}
@@ -133,7 +136,7 @@ async def chat_with_agent(payload: dict, db: AsyncSession = Depends(get_db)):
     
     # 1. Fetch Market Context (Simplified)
     # In a real app, we'd query average prices, busy slots, etc.
-    config = await db.scalar(select(AdminConfig))
+    config = await config_cache.get(db)
     sim_time = config.current_simulation_date if config else "Unknown"
     
     market_context = {
@@ -153,7 +156,7 @@ async def chat_with_agent(payload: dict, db: AsyncSession = Depends(get_db)):
     lower_msg = message.lower()
     if any(k in lower_msg for k in ["search", "images", "generate", "create", "find", "who is", "what is"]):
         print(f"Routing to Patriot AI for advanced capability: {message}")
-        response_text = patriot_client.chat(message)
+        response_text = await patriot_client.chat(message)
     else:
         # Default to Gemini for Market Analyst Persona
         response_text = await gemini_client.chat_with_market_analyst(message, market_context)
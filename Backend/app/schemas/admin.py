@@ -23,6 +23,7 @@ class AdminConfigResponse(BaseModel):
     lead_time_sensitivity: float | None = 1.0
     current_simulation_date: datetime | None = None
     pricing_model_version: int | None = 1
+    version: int | None = 1
 
     model_config = {"from_attributes": True}
 
@@ -47,3 +48,14 @@ class AdminConfigUpdate(BaseModel):
     lead_time_sensitivity: float | None = None
     current_simulation_date: datetime | None = None
     pricing_model_version: int | None = None
+
+
+class SnapshotCreate(BaseModel):
+    name: str
+    overwrite: bool = False
+
+
+class SnapshotResponse(BaseModel):
+    name: str
+    size_bytes: int
+    created_at: datetime
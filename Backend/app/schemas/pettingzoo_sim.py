@@ -1,6 +1,6 @@
 """Pydantic schemas for PettingZoo simulation endpoints."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -34,6 +34,9 @@ class PZSimConfig(BaseModel):
     # Agent profiles (Pareto tiers)
     agent_profiles: Optional[List[PZAgentProfile]] = None
 
+    # "vectorized" runs the NumPy engine (thousands of agents/rooms)
+    engine: Literal["fast", "vectorized"] = "fast"
+
 
 class PZGridSearchRequest(BaseModel):
     """Request body for grid search."""
@@ -0,0 +1,182 @@
+"""Background clock that ticks active auctions every `tick_interval_sec`.
+
+Active auctions sit in a heap keyed by their next due time (monotonic
+seconds). The loop pops everything that is due, ticks it through the
+engine's `tick_batch` in chunks of `AUCTION_CLOCK_BATCH_SIZE`, and sleeps
+until the next deadline. An auction that missed several deadlines (event
+loop stall, slow batch) gets a single tick and is put back on its grid; the
+skipped ticks are counted as coalesced rather than replayed. The set of
+active auctions is re-read from the table every `AUCTION_CLOCK_REFRESH_SEC`.
+
+Started from the FastAPI lifespan when `MARKET_AUCTION_CLOCK_ENABLED` is set,
+so every worker process runs its own clock. Batches are ticked with
+`due_only`: an auction another worker ticked within its interval is
+skipped in the UPDATE itself, so prices still move once per interval.
+"""
+import asyncio
+import heapq
+import math
+import time
+import traceback
+from collections import defaultdict
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import async_session
+from app.models import Auction, AuctionStatus
+from app.services.auction_engine import get_auction_engine
+
+MIN_TICK_INTERVAL_SEC = 0.05
+
+
+class AuctionClock:
+    def __init__(
+        self,
+        batch_size: int = settings.AUCTION_CLOCK_BATCH_SIZE,
+        refresh_sec: float = settings.AUCTION_CLOCK_REFRESH_SEC,
+        max_sleep_sec: float = settings.AUCTION_CLOCK_MAX_SLEEP_SEC,
+    ):
+        self.batch_size = batch_size
+        self.refresh_sec = refresh_sec
+        self.max_sleep_sec = max_sleep_sec
+        self._heap: list[tuple[float, str]] = []  # (due, auction_id)
+        self._tracked: dict[str, tuple[str, float, float]] = {}  # id -> (type, interval, due)
+        self._task: asyncio.Task | None = None
+        self._next_refresh = 0.0
+        self._reset_metrics()
+
+    def _reset_metrics(self) -> None:
+        self.ticks_total = 0
+        self.coalesced_ticks_total = 0
+        self.batches_total = 0
+        self.errors_total = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.last_batch_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._next_refresh = 0.0
+        self._task = asyncio.create_task(self._run(), name="auction-clock")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def metrics(self) -> dict:
+        now = time.monotonic()
+        due = [d for _, _, d in self._tracked.values() if d <= now]
+        return {
+            "running": self.running,
+            "tracked_auctions": len(self._tracked),
+            "backlog": len(due),
+            "lag_ms": round((now - min(due)) * 1000.0, 2) if due else 0.0,
+            "last_batch_lag_ms": round(self.last_lag_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "last_batch_ms": round(self.last_batch_ms, 2),
+            "ticks_total": self.ticks_total,
+            "coalesced_ticks_total": self.coalesced_ticks_total,
+            "batches_total": self.batches_total,
+            "errors_total": self.errors_total,
+        }
+
+    # --- Schedule ---
+
+    async def refresh(self) -> None:
+        """Track newly active auctions and forget ones that are no longer active."""
+        async with async_session() as db:
+            rows = (await db.execute(
+                select(Auction.id, Auction.auction_type, Auction.tick_interval_sec)
+                .where(Auction.status == AuctionStatus.ACTIVE)
+            )).all()
+        now = time.monotonic()
+        active = set()
+        for auction_id, auction_type, interval in rows:
+            active.add(auction_id)
+            interval = max(interval or 0.0, MIN_TICK_INTERVAL_SEC)
+            tracked = self._tracked.get(auction_id)
+            if tracked and tracked[1] == interval:
+                continue
+            due = now + interval
+            self._tracked[auction_id] = (auction_type, interval, due)
+            heapq.heappush(self._heap, (due, auction_id))
+        for auction_id in self._tracked.keys() - active:
+            del self._tracked[auction_id]  # Its heap entry is skipped lazily
+        self._next_refresh = now + self.refresh_sec
+
+    def _pop_due(self, now: float) -> list[tuple[str, str, float]]:
+        """Due auctions as (id, type, lag seconds), rescheduled on their grid."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, auction_id = heapq.heappop(self._heap)
+            tracked = self._tracked.get(auction_id)
+            if tracked is None or tracked[2] != deadline:
+                continue  # Stale heap entry
+            auction_type, interval, _ = tracked
+            missed = math.floor((now - deadline) / interval)
+            self.coalesced_ticks_total += missed
+            next_due = deadline + (missed + 1) * interval
+            self._tracked[auction_id] = (auction_type, interval, next_due)
+            heapq.heappush(self._heap, (next_due, auction_id))
+            due.append((auction_id, auction_type, now - deadline))
+        return due
+
+    # --- Loop ---
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() >= self._next_refresh:
+                    await self.refresh()
+                await self._tick_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors_total += 1
+                traceback.print_exc()
+                self._next_refresh = 0.0  # Re-read the schedule after a failure
+                await asyncio.sleep(self.max_sleep_sec)
+                continue
+
+            now = time.monotonic()
+            next_due = self._heap[0][0] if self._heap else math.inf
+            await asyncio.sleep(max(0.0, min(next_due, self._next_refresh, now + self.max_sleep_sec) - now))
+
+    async def _tick_due(self) -> None:
+        due = self._pop_due(time.monotonic())
+        if not due:
+            return
+        lag = max(lag for _, _, lag in due)
+        self.last_lag_ms = lag * 1000.0
+        self.max_lag_ms = max(self.max_lag_ms, self.last_lag_ms)
+
+        by_type = defaultdict(list)
+        for auction_id, auction_type, _ in due:
+            by_type[auction_type].append(auction_id)
+
+        start = time.perf_counter()
+        for auction_type, ids in by_type.items():
+            engine = get_auction_engine(auction_type)
+            for i in range(0, len(ids), self.batch_size):
+                async with async_session() as db:
+                    self.ticks_total += await engine.tick_batch(
+                        db, auction_type, ids[i:i + self.batch_size], due_only=True
+                    )
+                    await db.commit()
+                self.batches_total += 1
+        self.last_batch_ms = (time.perf_counter() - start) * 1000.0
+
+
+auction_clock = AuctionClock()
@@ -1,8 +1,9 @@
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import case, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
@@ -18,6 +19,24 @@ from app.models import (
     Transaction,
 )
 from app.schemas.auction import BidCreate
+from app.services.event_bus import event_bus
+from app.services.order_book import order_book
+from app.utils import generate_uuid
+
+# Limit orders taken from the book per auction before asking for more
+_CANDIDATES_PER_AUCTION = 4
+
+# Share of tick_interval_sec that must have passed since an auction's last
+# tick for `due_only` batches; the rest absorbs scheduling jitter
+_DUE_FRACTION = 0.95
+
+
+def _due(now: float):
+    """Auctions never ticked, or last ticked about one interval before `now`."""
+    return or_(
+        Auction.last_ticked_at.is_(None),
+        Auction.last_ticked_at <= now - _DUE_FRACTION * Auction.tick_interval_sec,
+    )
 
 
 class AuctionEngine(ABC):
@@ -29,6 +48,33 @@ class AuctionEngine(ABC):
     async def tick(self, auction: Auction, db: AsyncSession) -> None:
         pass
 
+    async def tick_batch(
+        self,
+        db: AsyncSession,
+        auction_type: str,
+        auction_ids: list[str] | None = None,
+        due_only: bool = False,
+    ) -> int:
+        """Tick every ACTIVE auction of `auction_type`, or only `auction_ids`.
+
+        With `due_only`, auctions ticked less than `tick_interval_sec` ago
+        (by any process) are skipped. Returns the number of auctions ticked.
+        The default calls `tick` once per auction; engines override it with
+        set-based SQL.
+        """
+        query = select(Auction).where(
+            Auction.status == AuctionStatus.ACTIVE,
+            Auction.auction_type == auction_type,
+        )
+        if auction_ids is not None:
+            query = query.where(Auction.id.in_(auction_ids))
+        if due_only:
+            query = query.where(_due(time.time()))
+        auctions = (await db.execute(query)).scalars().all()
+        for auction in auctions:
+            await self.tick(auction, db)
+        return len(auctions)
+
     @abstractmethod
     async def place_bid(self, auction: Auction, bid_data: BidCreate, db: AsyncSession) -> Bid:
         pass
@@ -61,63 +107,193 @@ class DutchAuctionEngine(AuctionEngine):
         else:
             # Increasing phase (scarcity signal)
             auction.current_price = auction.current_price + auction.price_step
+        auction.last_ticked_at = time.time()
 
         # Record price tick
         history = PriceHistory(auction_id=auction.id, price=auction.current_price)
         db.add(history)
-
-        # Auto-execute matching limit orders
-        result = await db.execute(
-            select(LimitOrder).where(
-                LimitOrder.time_slot_id == auction.time_slot_id,
-                LimitOrder.status == LimitOrderStatus.PENDING,
-                LimitOrder.max_price >= auction.current_price,
-            ).order_by(LimitOrder.created_at)
+        event_bus.publish_after_commit(db, {
+            "type": "price", "auction_id": auction.id,
+            "time_slot_id": auction.time_slot_id, "price": auction.current_price,
+        })
+
+        # Auto-execute matching limit orders, highest max_price first
+        await self._fill_limit_orders(
+            [(auction.id, auction.time_slot_id, auction.current_price)], db, {auction.id: auction}
         )
-        matching_orders = result.scalars().all()
-
-        for order in matching_orders:
-            agent_result = await db.execute(
-                select(Agent).where(Agent.id == order.agent_id)
-            )
-            agent = agent_result.scalar_one_or_none()
-            if not agent or agent.token_balance < auction.current_price:
-                continue
-
-            bid = Bid(
-                auction_id=auction.id,
-                agent_id=order.agent_id,
-                amount=auction.current_price,
-                is_group_bid=False,
-                status=BidStatus.ACCEPTED,
-            )
-            db.add(bid)
-            await db.flush()
-
-            agent.token_balance -= auction.current_price
-            tx = Transaction(
-                agent_id=agent.id,
-                amount=-auction.current_price,
-                type="bid_payment",
-                reference_id=bid.id,
-            )
-            db.add(tx)
 
-            order.status = LimitOrderStatus.EXECUTED
-            order.executed_at = datetime.utcnow()
-            order.bid_id = bid.id
-
-            # Create booking
-            from app.services.booking_service import create_booking_from_bid
-            try:
-                await create_booking_from_bid(auction, bid, db)
-            except HTTPException:
-                # If booking fails (capacity, conflict), skip this order
-                order.status = LimitOrderStatus.PENDING
-                order.executed_at = None
-                order.bid_id = None
-                continue
-            break  # One execution per tick in Dutch auction
+    async def tick_batch(
+        self,
+        db: AsyncSession,
+        auction_type: str,
+        auction_ids: list[str] | None = None,
+        due_only: bool = False,
+    ) -> int:
+        """Tick many Dutch auctions in a fixed number of statements.
+
+        One UPDATE ... RETURNING moves every price and one executemany
+        INSERT records the history; the order book then names the limit
+        orders the new prices trigger. Only auctions with a matching order
+        cost extra round trips (to load the rows and book the winner).
+        Auctions already loaded in the session are not refreshed; reload
+        them after the call.
+        """
+        conditions = [
+            Auction.status == AuctionStatus.ACTIVE,
+            Auction.auction_type == auction_type,
+        ]
+        if auction_ids is not None:
+            conditions.append(Auction.id.in_(auction_ids))
+        now = time.time()
+        if due_only:
+            # The guard is part of the UPDATE, so concurrent clocks cannot both pass it
+            conditions.append(_due(now))
+
+        # Same rule as `tick`: step down to min_price, then step back up
+        price, floor, step = Auction.current_price, Auction.min_price, Auction.price_step
+        new_price = case(
+            (price > floor, case((price - step > floor, price - step), else_=floor)),
+            else_=price + step,
+        )
+        auctions = Auction.__table__
+        ticked = (await db.execute(
+            update(auctions)
+            .where(*conditions)
+            .values(current_price=new_price, last_ticked_at=now)
+            .returning(auctions.c.id, auctions.c.time_slot_id, auctions.c.current_price)
+        )).all()
+        if not ticked:
+            return 0
+
+        await db.execute(insert(PriceHistory), [
+            {"id": generate_uuid(), "auction_id": auction_id, "time_slot_id": slot_id, "price": new}
+            for auction_id, slot_id, new in ticked
+        ])
+        if event_bus.has_subscribers:
+            event_bus.publish_after_commit(db, *(
+                {"type": "price", "auction_id": auction_id, "time_slot_id": slot_id, "price": new}
+                for auction_id, slot_id, new in ticked
+            ))
+
+        await self._fill_limit_orders(ticked, db)
+        return len(ticked)
+
+    async def _fill_limit_orders(
+        self, ticked, db: AsyncSession, auctions_by_id: dict[str, Auction] | None = None
+    ) -> None:
+        """Fill at most one triggered limit order per ticked auction, best first.
+
+        `ticked` holds (auction_id, time_slot_id, new_price). The book hands
+        out a few candidates per auction at a time; an auction only asks for
+        more (twice as many) when every one it got was stale or could not be
+        paid for. Auctions missing from `auctions_by_id` are loaded only if
+        an order triggers on them.
+        """
+        await order_book.ensure_loaded(db)
+        auctions_by_id = dict(auctions_by_id or {})
+        pending = {auction_id: (slot_id, price) for auction_id, slot_id, price in ticked}
+        tried: dict[str, set[str]] = {}
+        limit = _CANDIDATES_PER_AUCTION
+        while pending:
+            hits, exhausted = [], set()
+            for auction_id, (slot_id, price) in sorted(pending.items()):
+                order_ids = order_book.candidates(slot_id, price, limit)
+                if len(order_ids) < limit:
+                    exhausted.add(auction_id)
+                seen = tried.setdefault(auction_id, set())
+                if new := [oid for oid in order_ids if oid not in seen]:
+                    hits.append((auction_id, new))
+                    seen.update(new)
+            if not hits:
+                return
+
+            orders, agents = await self._load_orders({oid for _, ids in hits for oid in ids}, db)
+            if missing := [auction_id for auction_id, _ in hits if auction_id not in auctions_by_id]:
+                auctions_by_id.update((a.id, a) for a in (await db.execute(
+                    select(Auction).where(Auction.id.in_(missing))
+                    .execution_options(populate_existing=True)
+                )).scalars())
+
+            unfilled = set()
+            for auction_id, order_ids in hits:
+                auction = auctions_by_id[auction_id]
+                for order_id in order_ids:
+                    order = orders.get(order_id)
+                    if order is None or order.status != LimitOrderStatus.PENDING:
+                        continue  # Stale, or already filled on another auction this round
+                    if await self._execute_limit_order(auction, order, agents.get(order.agent_id), db):
+                        break  # One execution per tick in Dutch auction
+                else:
+                    unfilled.add(auction_id)
+            pending = {a: pending[a] for a in unfilled - exhausted}
+            limit *= 2
+
+    async def _load_orders(
+        self, order_ids, db: AsyncSession
+    ) -> tuple[dict[str, LimitOrder], dict[str, Agent]]:
+        """Load book candidates that are still PENDING, plus their agents.
+
+        Ids the table no longer has as PENDING are dropped from the book.
+        """
+        orders = {
+            o.id: o for o in (await db.execute(
+                select(LimitOrder).where(
+                    LimitOrder.id.in_(order_ids),
+                    LimitOrder.status == LimitOrderStatus.PENDING,
+                )
+            )).scalars()
+        }
+        for order_id in set(order_ids) - orders.keys():
+            order_book.stage_discard(db, order_id)
+        agents = {
+            a.id: a for a in (await db.execute(
+                select(Agent).where(Agent.id.in_({o.agent_id for o in orders.values()}))
+            )).scalars()
+        }
+        return orders, agents
+
+    async def _execute_limit_order(
+        self, auction: Auction, order: LimitOrder, agent: Agent | None, db: AsyncSession
+    ) -> bool:
+        """Fill `order` at the auction's current price; False if it cannot be filled."""
+        if not agent or agent.token_balance < auction.current_price:
+            return False
+
+        bid = Bid(
+            auction_id=auction.id,
+            agent_id=order.agent_id,
+            amount=auction.current_price,
+            is_group_bid=False,
+            status=BidStatus.ACCEPTED,
+        )
+        db.add(bid)
+        await db.flush()
+
+        agent.token_balance -= auction.current_price
+        tx = Transaction(
+            agent_id=agent.id,
+            amount=-auction.current_price,
+            type="bid_payment",
+            reference_id=bid.id,
+        )
+        db.add(tx)
+
+        order.status = LimitOrderStatus.EXECUTED
+        order.executed_at = datetime.utcnow()
+        order.bid_id = bid.id
+
+        # Create booking
+        from app.services.booking_service import create_booking_from_bid
+        try:
+            await create_booking_from_bid(auction, bid, db)
+        except HTTPException:
+            # If booking fails (capacity, conflict), skip this order
+            order.status = LimitOrderStatus.PENDING
+            order.executed_at = None
+            order.bid_id = None
+            return False
+        order_book.stage_discard(db, order.id)
+        return True
 
     async def place_bid(self, auction: Auction, bid_data: BidCreate, db: AsyncSession) -> Bid:
         # Validate agent
@@ -12,80 +12,94 @@ from app.models import (
     TimeSlotStatus,
     Resource,
 )
+from app.services.event_bus import event_bus
 
 
 async def create_booking_from_bid(
     auction: Auction, bid: Bid, db: AsyncSession
 ) -> list[Booking]:
-    """Create bookings for the winning bid. For group bids, all members get a booking."""
-    slot_result = await db.execute(select(TimeSlot).where(TimeSlot.id == auction.time_slot_id))
-    slot = slot_result.scalar_one()
+    """Create bookings for the winning bid. For group bids, all members get a booking.
 
-    resource_result = await db.execute(select(Resource).where(Resource.id == slot.resource_id))
-    resource = resource_result.scalar_one()
-
-    # Check room capacity
-    existing_count_result = await db.execute(
-        select(func.count()).select_from(Booking).where(Booking.time_slot_id == slot.id)
+    All constraints for every candidate agent are loaded up front in a fixed
+    number of queries (slot + capacity, existing bookings on the slot,
+    same-time overlaps, agent limits with booking counts), independent of
+    group size. Checks are then applied in the same order as before.
+    """
+    slot_result = await db.execute(
+        select(TimeSlot, Resource.capacity)
+        .join(Resource, Resource.id == TimeSlot.resource_id)
+        .where(TimeSlot.id == auction.time_slot_id)
     )
-    existing_count = existing_count_result.scalar()
+    slot, capacity = slot_result.one()
 
     if bid.is_group_bid:
         # Get group members
         members_result = await db.execute(
-            select(GroupBidMember).where(GroupBidMember.bid_id == bid.id)
+            select(GroupBidMember.agent_id).where(GroupBidMember.bid_id == bid.id)
         )
-        members = members_result.scalars().all()
-        agent_ids = [m.agent_id for m in members]
+        agent_ids = list(members_result.scalars().all())
     else:
         agent_ids = [bid.agent_id]
+    candidate_ids = set(agent_ids)
+
+    # Existing bookings on this slot: gives both the capacity count and duplicates
+    existing_result = await db.execute(
+        select(Booking.agent_id).where(Booking.time_slot_id == slot.id)
+    )
+    existing_agent_ids = list(existing_result.scalars().all())
+    existing_count = len(existing_agent_ids)
 
     # Check capacity
-    if existing_count + len(agent_ids) > resource.capacity:
+    if existing_count + len(agent_ids) > capacity:
         raise HTTPException(
             status_code=400,
-            detail=f"Room capacity ({resource.capacity}) would be exceeded",
+            detail=f"Room capacity ({capacity}) would be exceeded",
         )
 
+    # Candidates holding another room at the same start time
+    overlap_result = await db.execute(
+        select(Booking.agent_id)
+        .join(TimeSlot, TimeSlot.id == Booking.time_slot_id)
+        .where(
+            Booking.agent_id.in_(candidate_ids),
+            TimeSlot.start_time == slot.start_time,
+            TimeSlot.id != slot.id,
+        )
+        .distinct()
+    )
+    overlapping = set(overlap_result.scalars().all())
+
+    # Max bookings per candidate alongside their current booking count
+    limits_result = await db.execute(
+        select(Agent.id, Agent.max_bookings, func.count(Booking.id))
+        .outerjoin(Booking, Booking.agent_id == Agent.id)
+        .where(Agent.id.in_(candidate_ids))
+        .group_by(Agent.id, Agent.max_bookings)
+    )
+    limits = {agent_id: (max_bookings, count) for agent_id, max_bookings, count in limits_result.all()}
+
+    already_booked = set(existing_agent_ids)
     bookings = []
     for agent_id in agent_ids:
         # Check agent hasn't already booked this time slot
-        dup_result = await db.execute(
-            select(Booking).where(
-                Booking.agent_id == agent_id,
-                Booking.time_slot_id == slot.id,
-            )
-        )
-        if dup_result.scalar_one_or_none():
+        if agent_id in already_booked:
             continue  # Skip duplicate
 
         # Check agent doesn't have another room at same time
-        overlap_result = await db.execute(
-            select(Booking)
-            .join(TimeSlot)
-            .where(
-                Booking.agent_id == agent_id,
-                TimeSlot.start_time == slot.start_time,
-                TimeSlot.id != slot.id,
-            )
-        )
-        if overlap_result.scalar_one_or_none():
+        if agent_id in overlapping:
             raise HTTPException(
                 status_code=400,
                 detail=f"Agent {agent_id} already has a booking at this time",
             )
 
         # Check max bookings
-        agent_result = await db.execute(select(Agent).where(Agent.id == agent_id))
-        agent = agent_result.scalar_one()
-        booking_count_result = await db.execute(
-            select(func.count()).select_from(Booking).where(Booking.agent_id == agent_id)
-        )
-        booking_count = booking_count_result.scalar()
-        if booking_count >= agent.max_bookings:
+        if agent_id not in limits:
+            raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
+        max_bookings, booking_count = limits[agent_id]
+        if booking_count >= max_bookings:
             raise HTTPException(
                 status_code=400,
-                detail=f"Agent {agent_id} has reached max bookings ({agent.max_bookings})",
+                detail=f"Agent {agent_id} has reached max bookings ({max_bookings})",
             )
 
         booking = Booking(
@@ -97,15 +111,17 @@ async def create_booking_from_bid(
         )
         db.add(booking)
         bookings.append(booking)
+        already_booked.add(agent_id)
 
     # Mark slot as booked only when at full capacity
     if bookings:
-        await db.flush()  # Flush so the new bookings are counted
-        total_bookings_result = await db.execute(
-            select(func.count()).select_from(Booking).where(Booking.time_slot_id == slot.id)
-        )
-        total_bookings = total_bookings_result.scalar()
-        if total_bookings >= resource.capacity:
+        await db.flush()
+        if existing_count + len(bookings) >= capacity:
             slot.status = TimeSlotStatus.BOOKED
+        event_bus.publish_after_commit(db, *(
+            {"type": "booking", "booking_id": b.id, "auction_id": auction.id,
+             "time_slot_id": slot.id, "agent_id": b.agent_id}
+            for b in bookings
+        ))
 
     return bookings
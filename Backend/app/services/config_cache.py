@@ -0,0 +1,91 @@
+"""Process-local cache of the AdminConfig row.
+
+Almost every request path reads the single config row (auction defaults,
+pricing weights, the simulation clock). `config_cache.get(db)` serves a
+detached copy instead of running the SELECT each time:
+
+- Any ORM write to AdminConfig bumps its `version` column (in SQL, so
+  concurrent writers never reuse a number) and drops the cached copy once
+  the writing session commits.
+- After `MARKET_CONFIG_CACHE_TTL_SEC` the copy is re-validated with a
+  one-column `SELECT version`, so changes made by other worker processes
+  show up within that window without reloading the row every time.
+- A session that already holds the config (typically one that is changing
+  it, e.g. advance-hour) gets its own instance back, uncommitted edits
+  included, and never fills the cache from them.
+
+The cached object is shared: treat it as read-only. Code that modifies the
+config must load it through its session as before.
+"""
+import hashlib
+import time
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from app.config import settings
+from app.database import run_after_commit
+from app.models import AdminConfig
+from app.schemas.admin import AdminConfigResponse
+
+_CONFIG_KEY = identity_key(AdminConfig, 1)
+_COLUMNS = AdminConfig.__table__.c
+
+
+class ConfigCache:
+    def __init__(self):
+        self._config: AdminConfig | None = None
+        self._etag: str | None = None
+        self._checked_at = 0.0
+
+    def invalidate(self) -> None:
+        self._config = None
+        self._etag = None
+
+    async def get(self, db: AsyncSession) -> AdminConfig | None:
+        """The config row as `db` should see it, or None if there is none yet."""
+        in_session = db.sync_session.identity_map.get(_CONFIG_KEY)
+        if in_session is not None:
+            return in_session
+
+        cached, now = self._config, time.monotonic()
+        if cached is not None:
+            if now - self._checked_at < settings.CONFIG_CACHE_TTL_SEC:
+                return cached
+            version = await db.scalar(select(AdminConfig.version).where(AdminConfig.id == 1))
+            if version == cached.version:
+                self._checked_at = now
+                return cached
+
+        row = (await db.execute(select(*_COLUMNS).where(AdminConfig.id == 1))).one_or_none()
+        if row is None:
+            self.invalidate()
+            return None
+        self._config = AdminConfig(**row._mapping)
+        self._etag = None
+        self._checked_at = now
+        return self._config
+
+    def etag(self, config: AdminConfig) -> str:
+        """Strong ETag for the `GET /api/admin/config` body of `config`."""
+        if config is self._config and self._etag is not None:
+            return self._etag
+        body = AdminConfigResponse.model_validate(config).model_dump_json()
+        etag = f'"{hashlib.sha1(body.encode()).hexdigest()[:20]}"'
+        if config is self._config:
+            self._etag = etag
+        return etag
+
+
+config_cache = ConfigCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_config_write(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, AdminConfig)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        run_after_commit(session, config_cache.invalidate)
@@ -0,0 +1,93 @@
+"""In-process pub/sub for live market events (price ticks, bookings, clock).
+
+Publishers stage events on their session with `publish_after_commit`, so
+subscribers only ever see changes that were committed. Each subscriber
+owns a bounded queue: when a slow client falls behind, the oldest queued
+event is dropped and counted instead of blocking the publisher, and the
+stream tells the client how many it missed so it can re-sync.
+
+Event payloads are plain dicts with a "type" key:
+
+    {"type": "price", "auction_id", "time_slot_id", "price"}
+    {"type": "booking", "booking_id", "auction_id", "time_slot_id", "agent_id"}
+    {"type": "booking_cancelled", "booking_id", "auction_id", "time_slot_id", "agent_id"}
+    {"type": "prices_recalculated", "slots"}
+    {"type": "clock", "current_simulation_date"}
+    {"type": "snapshot_restored", "name"}
+"""
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import run_after_commit
+
+
+class Subscription:
+    def __init__(
+        self,
+        maxsize: int,
+        auction_id: str | None = None,
+        time_slot_ids: set[str] | None = None,
+    ):
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=maxsize)
+        self.auction_id = auction_id
+        self.time_slot_ids = time_slot_ids
+        self.dropped = 0
+
+    def wants(self, event: dict) -> bool:
+        """Events without an auction or slot (clock, bulk repricing) go to everyone."""
+        auction_id = event.get("auction_id")
+        if self.auction_id is not None and auction_id is not None and auction_id != self.auction_id:
+            return False
+        slot_id = event.get("time_slot_id")
+        if self.time_slot_ids is not None and slot_id is not None and slot_id not in self.time_slot_ids:
+            return False
+        return True
+
+    def offer(self, event: dict) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()  # Drop the oldest event, keep the newest
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class EventBus:
+    def __init__(self, queue_size: int = settings.EVENT_STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self.published_total = 0
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, auction_id: str | None = None, time_slot_ids: set[str] | None = None) -> Subscription:
+        sub = Subscription(self.queue_size, auction_id=auction_id, time_slot_ids=time_slot_ids)
+        self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self._subscribers.discard(sub)
+
+    def publish(self, *events: dict) -> None:
+        for event in events:
+            self.published_total += 1
+            for sub in self._subscribers:
+                if sub.wants(event):
+                    sub.offer(event)
+
+    def publish_after_commit(self, db: AsyncSession, *events: dict) -> None:
+        """Publish `events` once `db` commits; nothing is sent on rollback."""
+        if events and self._subscribers:
+            run_after_commit(db, self.publish, *events)
+
+    def metrics(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "published_total": self.published_total,
+            "dropped_total": sum(sub.dropped for sub in self._subscribers),
+        }
+
+
+event_bus = EventBus()
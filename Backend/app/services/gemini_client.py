@@ -1,24 +1,86 @@
-import google.generativeai as genai
+import asyncio
+import hashlib
+import json
 import os
 
+import google.generativeai as genai
+
+from app.config import settings
+from app.services.response_cache import ResponseCache
+
 # Configure API Key (User should provide this in env or we can hardcode for hackathon demo if safe)
 # For now, we'll try to read from env or expect it to be set
 
+# Report inputs that change on every call without changing what the report says
+_VOLATILE_REPORT_FIELDS = {"date"}
+
+
+class GeminiBackend:
+    """The hosted Gemini model."""
+
+    def __init__(self, api_key: str):
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel('gemini-flash-latest')
+
+    async def generate(self, prompt: str) -> str:
+        response = await self.model.generate_content_async(prompt)
+        return response.text
+
+
+class StubBackend:
+    """Local stand-in (`MARKET_GEMINI_BACKEND=stub`): answers after `delay`
+    seconds with a canned text derived from the prompt, and counts calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"## Stub Analysis\n\nPrompt fingerprint `{hashlib.sha1(prompt.encode()).hexdigest()[:12]}`."
+
+
+def _default_backend():
+    if settings.GEMINI_BACKEND == "stub":
+        return StubBackend()
+    api_key = os.getenv("GEMINI_API_KEY")
+    if api_key:
+        return GeminiBackend(api_key)
+    print("Warning: GEMINI_API_KEY not set. Gemini features will be mocked.")
+    return None
+
+
+def _fingerprint(kind: str, text: str, context: dict) -> str:
+    """Cache key: the request kind, the text with case and whitespace
+    normalized, and the context with its keys in a fixed order."""
+    normalized = " ".join(text.lower().split())
+    payload = json.dumps([kind, normalized, context], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 class GeminiClient:
-    def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-flash-latest')
-        else:
-            self.model = None
-            print("Warning: GEMINI_API_KEY not set. Gemini features will be mocked.")
+    """Gemini calls behind a response cache.
+
+    Answers are cached per normalized message and market context for
+    `MARKET_GEMINI_CACHE_TTL_SEC`, at most `MARKET_GEMINI_CACHE_MAX_ENTRIES`
+    of them (least recently used dropped first), and identical requests that
+    arrive while one is in flight share its upstream call. Errors are not
+    cached. `cache.stats()` has the hit counters.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else _default_backend()
+        self.cache = ResponseCache(settings.GEMINI_CACHE_MAX_ENTRIES, settings.GEMINI_CACHE_TTL_SEC)
+
+    async def _generate(self, key: str, prompt: str) -> str:
+        return await self.cache.get_or_call(key, lambda: self.backend.generate(prompt))
 
     async def chat_with_market_analyst(self, user_message: str, market_context: dict) -> str:
         """
         Sends a message to Gemini with market context to get specialized advice.
         """
-        if not self.model:
+        if self.backend is None:
             return "I am unable to connect to the Gemini Market Brain right now (API Key missing). But based on simple logic: prices are likely to rise!"
 
         # Construct a rich prompt
@@ -36,9 +98,9 @@ class GeminiClient:
 
         prompt = f"{system_instruction}\n\nUser: {user_message}\nAnalyst:"
 
+        key = _fingerprint("chat", user_message, market_context)
         try:
-            response = await self.model.generate_content_async(prompt)
-            return response.text
+            return await self._generate(key, prompt)
         except Exception as e:
             print(f"Gemini API Error: {e}")
             return "I'm having trouble analyzing the market signals right now. Please try again later."
@@ -47,7 +109,7 @@ class GeminiClient:
         """
         Generates a high-level strategic report for the Admin Dashboard.
         """
-        if not self.model:
+        if self.backend is None:
             return "## Market Analysis Unavailable\n\nPlease configure the `GEMINI_API_KEY` to enable AI insights."
 
         system_instruction = (
@@ -69,9 +131,12 @@ class GeminiClient:
             "**Report:**"
         )
 
+        # The report is keyed without its timestamp, so requests in the same
+        # TTL window with the same numbers share one report
+        stable = {k: v for k, v in market_data.items() if k not in _VOLATILE_REPORT_FIELDS}
+        key = _fingerprint("admin_report", "", stable)
         try:
-            response = await self.model.generate_content_async(prompt)
-            return response.text
+            return await self._generate(key, prompt)
         except Exception as e:
             return f"Error generating report: {str(e)}"
 
@@ -0,0 +1,284 @@
+"""Room-schedule imports as background jobs with progress and resume.
+
+A job runs the same phases as `process_import`, but off the request:
+
+    parse      read the next CSV chunk (in a worker thread)
+    learn      fold the chunk into the demand aggregates (worker thread)
+    resources  store popularity on AdminConfig and create rooms; commit
+    slots      build and insert one day of slots
+    auctions   insert that day's opening auctions; commit
+
+Every simulated day is its own committed batch, so a job that fails or is
+cancelled part-way keeps the days already written; `resume` picks up at the
+next day instead of starting over. Progress is 0-40% for reading the file
+(by bytes consumed) and 40-100% for the days written.
+
+Jobs live in this process only (like the order book and event bus). Only
+one job runs at a time, because every import rewrites the shared catalog.
+Finished jobs are dropped `MARKET_IMPORT_JOB_RETENTION_SEC` after they end,
+together with their upload copy; shutdown deletes every upload copy, since
+no job can be resumed after a restart.
+"""
+import asyncio
+import contextlib
+import os
+import shutil
+import tempfile
+import time
+import traceback
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.config import settings
+from app.database import async_session
+from app.models import Auction, TimeSlot
+from app.services.config_cache import config_cache
+from app.services.import_service import (
+    IMPORT_DAYS,
+    ImportStats,
+    apply_import_stats,
+    clear_catalog,
+    create_import_resources,
+    day_rows,
+    insert_rows,
+    read_csv_chunks,
+)
+
+PHASES = ("parse", "learn", "resources", "slots", "auctions")
+READ_SHARE = 40.0  # Percent of progress given to reading the file
+
+
+class ImportJobError(Exception):
+    """A job request that conflicts with the job's current state."""
+
+
+class ImportJob:
+    def __init__(self, path: str, owns_file: bool, reset: bool):
+        self.id = str(uuid.uuid4())
+        self.path = path
+        self.owns_file = owns_file  # Uploads are copied to a temp file we delete when done
+        self.reset = reset  # Clear the catalog before the first batch
+        self.status = "pending"  # pending, running, completed, failed, cancelled
+        self.phase: str | None = None
+        self.progress = 0.0
+        self.phase_timings = {phase: 0.0 for phase in PHASES}
+        self.error: str | None = None
+        self.result: dict | None = None
+        self.created_at = datetime.utcnow()
+        self.finished_at: datetime | None = None
+        # Checkpoint: what is already committed
+        self.stats: ImportStats | None = None
+        self.learned = False
+        self.start_date: datetime | None = None
+        self.resources_created = 0
+        self.days_committed = 0
+        self.slots_committed = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def resumable(self) -> bool:
+        return self.status in ("failed", "cancelled") and os.path.exists(self.path)
+
+    def remove_file(self) -> None:
+        """Delete the upload copy, if this job owns one; the job is then not resumable."""
+        if self.owns_file:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
+
+    def _timed(self, phase: str, started: float) -> None:
+        self.phase_timings[phase] += time.perf_counter() - started
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "phase": self.phase,
+            "progress": round(self.progress, 1),
+            "phase_timings": {phase: round(sec, 3) for phase, sec in self.phase_timings.items()},
+            "rows_processed": self.stats.rows if self.stats else 0,
+            "days_committed": self.days_committed,
+            "days_total": IMPORT_DAYS,
+            "resumable": self.resumable,
+            "error": self.error,
+            "result": self.result,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    # --- Phases ---
+
+    async def _learn(self) -> None:
+        stats = ImportStats()
+        size = max(os.path.getsize(self.path), 1)
+        with open(self.path, "rb") as f:
+            reader = read_csv_chunks(f)
+            while True:
+                self.phase, started = "parse", time.perf_counter()
+                chunk = await asyncio.to_thread(next, reader, None)
+                self._timed("parse", started)
+                if chunk is None:
+                    break
+                self.phase, started = "learn", time.perf_counter()
+                await asyncio.to_thread(stats.add_chunk, chunk)
+                self._timed("learn", started)
+                self.progress = READ_SHARE * min(f.tell() / size, 1.0)
+        self.stats = stats
+
+    async def _store_learned(self) -> None:
+        self.phase, started = "resources", time.perf_counter()
+        async with async_session() as db:
+            if self.reset:
+                await clear_catalog(db)
+            config = await apply_import_stats(db, self.stats)
+            _, self.resources_created = await create_import_resources(db, self.stats)
+            self.start_date = config.current_simulation_date or datetime.now()
+            await db.commit()
+        self.reset = False  # Never clear again on resume: that would drop committed days
+        self.learned = True
+        self._timed("resources", started)
+        self.progress = READ_SHARE
+
+    async def _write_days(self) -> None:
+        rng = np.random.default_rng()
+        while self.days_committed < IMPORT_DAYS:
+            day = self.start_date + timedelta(days=self.days_committed)
+            async with async_session() as db:
+                config = await config_cache.get(db)
+                # Idempotent: matches the rooms committed by _store_learned
+                resources, _ = await create_import_resources(db, self.stats)
+
+                self.phase, started = "slots", time.perf_counter()
+                slots, auctions = await asyncio.to_thread(
+                    day_rows, day, self.start_date, self.stats, resources, config, rng,
+                )
+                await insert_rows(db, TimeSlot, slots)
+                self._timed("slots", started)
+
+                self.phase, started = "auctions", time.perf_counter()
+                await insert_rows(db, Auction, auctions)
+                await db.commit()
+                self._timed("auctions", started)
+
+            self.days_committed += 1
+            self.slots_committed += len(slots)
+            self.progress = READ_SHARE + (100.0 - READ_SHARE) * self.days_committed / IMPORT_DAYS
+
+    async def run(self) -> None:
+        self.status, self.error = "running", None
+        started = time.perf_counter()
+        try:
+            if not self.learned:
+                if self.stats is None:
+                    await self._learn()
+                await self._store_learned()
+            await self._write_days()
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            self.finished_at = datetime.utcnow()
+            raise
+        except Exception as e:
+            traceback.print_exc()
+            self.status, self.error = "failed", str(e)
+            self.finished_at = datetime.utcnow()
+            return
+
+        elapsed = sum(self.phase_timings.values()) or time.perf_counter() - started
+        self.status, self.phase, self.progress = "completed", None, 100.0
+        self.finished_at = datetime.utcnow()
+        self.result = {
+            "resources_created": self.resources_created,
+            "time_slots_created": self.slots_committed,
+            "rows_processed": self.stats.rows,
+            "elapsed_sec": round(elapsed, 3),
+            "rows_per_sec": round(self.stats.rows / elapsed, 1) if elapsed > 0 else None,
+        }
+        self.remove_file()
+
+
+class ImportJobManager:
+    def __init__(self):
+        self._jobs: dict[str, ImportJob] = {}
+
+    def get(self, job_id: str) -> ImportJob | None:
+        self._prune()
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[ImportJob]:
+        self._prune()
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    @property
+    def busy(self) -> bool:
+        return any(job.running for job in self._jobs.values())
+
+    def _prune(self) -> None:
+        """Forget jobs that ended more than the retention window ago."""
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.IMPORT_JOB_RETENTION_SEC)
+        for job in list(self._jobs.values()):
+            if not job.running and job.finished_at is not None and job.finished_at < cutoff:
+                job.remove_file()
+                del self._jobs[job.id]
+
+    def _ensure_idle(self) -> None:
+        self._prune()
+        if self.busy:
+            raise ImportJobError("Another import job is already running")
+
+    def _launch(self, job: ImportJob) -> ImportJob:
+        job._task = asyncio.create_task(job.run(), name=f"import-{job.id}")
+        return job
+
+    def start_file(self, path: str, reset: bool = False) -> ImportJob:
+        """Import a CSV already on disk (e.g. the bundled defaults)."""
+        self._ensure_idle()
+        job = ImportJob(path, owns_file=False, reset=reset)
+        self._jobs[job.id] = job
+        return self._launch(job)
+
+    async def start_upload(self, upload, reset: bool = False) -> ImportJob:
+        """Copy an uploaded file aside (the request closes it) and import the copy."""
+        self._ensure_idle()
+        fd, path = tempfile.mkstemp(prefix="market_import_", suffix=".csv")
+        with os.fdopen(fd, "wb") as out:
+            await asyncio.to_thread(shutil.copyfileobj, upload, out)
+        job = ImportJob(path, owns_file=True, reset=reset)
+        self._jobs[job.id] = job
+        return self._launch(job)
+
+    async def cancel(self, job_id: str) -> ImportJob:
+        job = self._jobs[job_id]
+        if not job.running:
+            raise ImportJobError(f"Job is {job.status}, not running")
+        job._task.cancel()
+        try:
+            await job._task
+        except asyncio.CancelledError:
+            pass
+        return job
+
+    def resume(self, job_id: str) -> ImportJob:
+        job = self._jobs[job_id]
+        if not job.resumable:
+            raise ImportJobError(f"Job is {job.status} and cannot be resumed")
+        self._ensure_idle()
+        return self._launch(job)
+
+    async def shutdown(self) -> None:
+        for job in self._jobs.values():
+            if job.running:
+                job._task.cancel()
+                try:
+                    await job._task
+                except asyncio.CancelledError:
+                    pass
+            job.remove_file()
+        self._jobs.clear()
+
+
+import_jobs = ImportJobManager()
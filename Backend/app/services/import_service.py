@@ -0,0 +1,222 @@
+"""Room-schedule CSV import: learn demand, create resources, open auctions.
+
+The CSV has one row per room and half-hour (`Building`, `Room Name`,
+`Capacity`, `Date`, `Time`, `Status`). It is consumed in chunks of
+IMPORT_CHUNK_ROWS, so memory is bounded by the chunk size and the number
+of distinct rooms, not by the length of the file. Each chunk folds into
+running groupby totals; the slots and opening auctions for the next
+IMPORT_DAYS are then built as column arrays one day at a time and priced
+with the shared `price_kernel`.
+"""
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AdminConfig, Auction, AuctionStatus, Resource, TimeSlot, TimeSlotStatus
+from app.services.pricing_service import price_kernel, slot_time_columns, time_popularity_table
+
+IMPORT_CHUNK_ROWS = 100_000
+IMPORT_DAYS = 14
+INSERT_CHUNK_ROWS = 1000
+SLOT_MINUTES = 30
+CSV_COLUMNS = ["Building", "Room Name", "Capacity", "Date", "Time", "Status"]
+
+
+@dataclass
+class ImportStats:
+    """Running aggregates over every chunk read so far."""
+    rows: int = 0
+    resources: dict = field(default_factory=dict)  # (name, location) -> capacity, first seen wins
+    schedule: set = field(default_factory=set)  # (day_of_week, "HH:MM")
+    location_counts: pd.DataFrame | None = None  # Building -> total, booked
+    time_counts: pd.DataFrame | None = None  # (day_of_week, hour) -> total, booked
+
+    def add_chunk(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        # Dates and times repeat on every room, so parse each distinct value once
+        date_codes, dates = pd.factorize(chunk["Date"])
+        time_codes, times = pd.factorize(chunk["Time"].astype(str))
+        frame = pd.DataFrame({
+            "location": chunk["Building"].to_numpy(),
+            "name": chunk["Room Name"].to_numpy(),
+            "capacity": chunk["Capacity"].astype(int).to_numpy(),
+            "dow": pd.to_datetime(dates, format="%Y-%m-%d").dayofweek.to_numpy()[date_codes],
+            "time": np.asarray(times, dtype=object)[time_codes],
+            "hour": np.array([int(t.split(":")[0]) for t in times], dtype=np.int64)[time_codes],
+            "booked": chunk["Status"].astype(str).str.lower().eq("booked").to_numpy(dtype=np.int64),
+        })
+        self.rows += len(frame)
+
+        rooms = frame.drop_duplicates(["name", "location"])
+        for name, loc, cap in zip(rooms["name"], rooms["location"], rooms["capacity"]):
+            self.resources.setdefault((name, loc), int(cap))
+        pattern = frame.drop_duplicates(["dow", "time"])
+        self.schedule.update(zip(pattern["dow"].tolist(), pattern["time"].tolist()))
+
+        self.location_counts = _accumulate(self.location_counts, frame, ["location"])
+        self.time_counts = _accumulate(self.time_counts, frame, ["dow", "hour"])
+
+    def location_popularity(self) -> dict:
+        if self.location_counts is None:
+            return {}
+        pop = (self.location_counts["booked"] / self.location_counts["total"]).round(2)
+        return {loc: float(v) for loc, v in pop.items()}
+
+    def time_popularity(self) -> dict:
+        if self.time_counts is None:
+            return {}
+        pop = (self.time_counts["booked"] / self.time_counts["total"]).round(2)
+        return {f"{day}-{hour}": float(v) for (day, hour), v in pop.items()}
+
+
+def _accumulate(totals: pd.DataFrame | None, frame: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    counts = frame.groupby(keys)["booked"].agg(total="size", booked="sum")
+    return counts if totals is None else totals.add(counts, fill_value=0)
+
+
+def read_csv_chunks(source, chunk_rows: int = IMPORT_CHUNK_ROWS) -> Iterable[pd.DataFrame]:
+    """Stream a path or file object as DataFrames of at most `chunk_rows` rows."""
+    return pd.read_csv(source, usecols=CSV_COLUMNS, chunksize=chunk_rows)
+
+
+def learn_import_stats(chunks: pd.DataFrame | Iterable[pd.DataFrame]) -> ImportStats:
+    stats = ImportStats()
+    for chunk in [chunks] if isinstance(chunks, pd.DataFrame) else chunks:
+        stats.add_chunk(chunk)
+    return stats
+
+
+async def apply_import_stats(db: AsyncSession, stats: ImportStats) -> AdminConfig:
+    """Store learned popularity on AdminConfig; this invalidates every priced slot."""
+    config = (await db.execute(select(AdminConfig).where(AdminConfig.id == 1))).scalar_one_or_none()
+    if not config:
+        config = AdminConfig(id=1)
+        db.add(config)
+    config.location_popularity = stats.location_popularity()
+    config.time_popularity = stats.time_popularity()
+    config.pricing_model_version = (config.pricing_model_version or 0) + 1
+    await db.flush()
+    return config
+
+
+async def create_import_resources(db: AsyncSession, stats: ImportStats) -> tuple[list[Resource], int]:
+    """Resources for every imported room, in first-seen order, plus how many were new."""
+    existing = await db.execute(select(Resource))
+    existing_map = {(r.name, r.location): r for r in existing.scalars().all()}
+
+    resources, created = [], 0
+    for (name, loc), capacity in stats.resources.items():
+        resource = existing_map.get((name, loc))
+        if resource is None:
+            resource = Resource(name=name, location=loc, capacity=capacity, resource_type="room")
+            db.add(resource)
+            created += 1
+        resources.append(resource)
+    await db.flush()
+    return resources, created
+
+
+def day_rows(
+    day: datetime,
+    start_date: datetime,
+    stats: ImportStats,
+    resources: list[Resource],
+    config: AdminConfig,
+    rng: np.random.Generator,
+) -> tuple[list[dict], list[dict]]:
+    """Slot and opening-auction rows for every room at each learned time on `day`."""
+    times = sorted(t for d, t in stats.schedule if d == day.weekday())
+    if not times or not resources:
+        return [], []
+
+    minutes = np.array([int(h) * 60 + int(m) for h, m in (t.split(":")[:2] for t in times)])
+    midnight = np.datetime64(day.date(), "m")
+    # Times outer, rooms inner
+    starts = np.repeat(midnight + minutes.astype("timedelta64[m]"), len(resources))
+    room = np.tile(np.arange(len(resources)), len(times))
+
+    capacity = np.array([r.capacity for r in resources], dtype=np.float64)[room]
+    loc_pop = config.location_popularity or {}
+    loc_score = np.array([float(loc_pop.get(r.location, 0.5)) for r in resources])[room]
+    day_of_week, hour, days_out = slot_time_columns(starts, start_date)
+    prices = price_kernel(
+        capacity, loc_score, day_of_week, hour, days_out,
+        time_popularity_table(config.time_popularity or {}), config, rng,
+    )
+
+    start_list = starts.astype("datetime64[us]").tolist()
+    end_list = (starts + np.timedelta64(SLOT_MINUTES, "m")).astype("datetime64[us]").tolist()
+    resource_ids = [r.id for r in resources]
+    slot_ids = [str(uuid.uuid4()) for _ in range(len(start_list))]
+    slots = [
+        {"id": sid, "resource_id": resource_ids[r], "start_time": s, "end_time": e,
+         "status": TimeSlotStatus.IN_AUCTION}
+        for sid, r, s, e in zip(slot_ids, room.tolist(), start_list, end_list)
+    ]
+    auctions = [
+        {"id": str(uuid.uuid4()), "time_slot_id": sid, "start_price": sp, "current_price": cp,
+         "min_price": mp, "status": AuctionStatus.ACTIVE, "auction_type": "dutch",
+         "price_step": 2.0, "tick_interval_sec": 10.0, "created_at": start_date}
+        for sid, sp, cp, mp in zip(
+            slot_ids,
+            np.round(prices * 1.6, 2).tolist(),
+            np.round(prices, 2).tolist(),
+            np.round(prices * 0.4, 2).tolist(),
+        )
+    ]
+    return slots, auctions
+
+
+async def insert_rows(db: AsyncSession, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), INSERT_CHUNK_ROWS):
+        await db.execute(insert(model), rows[i:i + INSERT_CHUNK_ROWS])
+
+
+async def clear_catalog(db: AsyncSession) -> None:
+    """Delete rooms and everything hanging off their slots, children first."""
+    for table in ("bookings", "bids", "auctions", "time_slots", "resources"):
+        await db.execute(text(f"DELETE FROM {table}"))
+
+
+async def process_import(
+    chunks: pd.DataFrame | Iterable[pd.DataFrame],
+    db: AsyncSession,
+    seed: int | None = None,
+) -> dict:
+    """Import a room schedule and open the next IMPORT_DAYS of auctions.
+
+    Leaves the transaction open; the caller commits.
+    """
+    started = time.perf_counter()
+    stats = learn_import_stats(chunks)
+    config = await apply_import_stats(db, stats)
+    resources, created_resources = await create_import_resources(db, stats)
+
+    rng = np.random.default_rng(seed)
+    start_date = config.current_simulation_date or datetime.now()
+    created_slots = 0
+    for day_offset in range(IMPORT_DAYS):
+        slots, auctions = day_rows(
+            start_date + timedelta(days=day_offset), start_date, stats, resources, config, rng,
+        )
+        await insert_rows(db, TimeSlot, slots)  # Slots first so auctions can reference them
+        await insert_rows(db, Auction, auctions)
+        created_slots += len(slots)
+    await db.flush()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "resources_created": created_resources,
+        "time_slots_created": created_slots,
+        "rows_processed": stats.rows,
+        "elapsed_sec": round(elapsed, 3),
+        "rows_per_sec": round(stats.rows / elapsed, 1) if elapsed > 0 else None,
+    }
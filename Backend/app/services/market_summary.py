@@ -0,0 +1,298 @@
+"""Materialized market summary behind /api/market/state and /api/simulation/results.
+
+Keeps running totals (auctions and slots by status, bookings, rooms,
+clearing prices with a histogram, token volume) so the dashboards answer
+without scanning auctions or bookings.
+
+The totals move with the rows, not with individual code paths: after each
+ORM flush the changed auctions, slots, bookings, resources and payments
+are turned into a delta that is applied once the session commits (and
+dropped if it rolls back), the same way events reach the event bus. That
+covers every writer that goes through the ORM, including the ones that
+publish no event (simulation rounds, bid resolution).
+
+Bulk statements (imports, the simulation reset, raw SQL) cannot be
+diffed; they mark the summary stale and the next read rebuilds it with a
+handful of GROUP BY queries. So does anything else that rewrites the
+tables wholesale, e.g. restoring a snapshot. The summary is also rebuilt
+once it is older than `MARKET_SUMMARY_MAX_AGE_SEC`, which bounds drift
+from writes made by other worker processes.
+"""
+import asyncio
+import time
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import Integer, cast, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, TextClause
+
+from app.config import settings
+from app.database import run_after_commit
+from app.models import (
+    Auction,
+    AuctionStatus,
+    Booking,
+    Resource,
+    TimeSlot,
+    TimeSlotStatus,
+    Transaction,
+)
+
+PRICE_BIN_WIDTH = 5.0  # Clearing-price histogram bucket width, in tokens
+_DELTA_KEY = "market_summary_delta"
+_TRACKED_TABLES = {
+    model.__tablename__ for model in (Auction, TimeSlot, Booking, Resource, Transaction)
+}
+
+
+def _bucket(price: float) -> int:
+    return int(price // PRICE_BIN_WIDTH)
+
+
+def _is_payment(tx: Transaction) -> bool:
+    return tx.type == "bid_payment"
+
+
+class SummaryDelta:
+    """Changes made by one session, applied to the summary on commit."""
+
+    def __init__(self):
+        self.auctions: Counter = Counter()
+        self.slots: Counter = Counter()
+        self.bookings = 0
+        self.resources = 0
+        self.clearing_sum = 0.0
+        self.histogram: Counter = Counter()
+        self.token_volume = 0.0
+        self.stale = False
+
+    def clearing(self, price: float, sign: int) -> None:
+        self.clearing_sum += sign * price
+        self.histogram[_bucket(price)] += sign
+
+    def add_row(self, obj, sign: int) -> None:
+        """Count a whole row in (+1, inserted) or out (-1, deleted)."""
+        if isinstance(obj, Auction):
+            self.auctions[obj.status] += sign
+            if obj.status == AuctionStatus.COMPLETED:
+                self.clearing(obj.current_price, sign)
+        elif isinstance(obj, TimeSlot):
+            self.slots[obj.status] += sign
+        elif isinstance(obj, Booking):
+            self.bookings += sign
+        elif isinstance(obj, Resource):
+            self.resources += sign
+        elif isinstance(obj, Transaction) and _is_payment(obj):
+            self.token_volume += sign * abs(obj.amount)
+
+    def update_row(self, obj) -> None:
+        if isinstance(obj, Auction):
+            status = attributes.get_history(obj, "status")
+            price = attributes.get_history(obj, "current_price")
+            if not status.has_changes() and not price.has_changes():
+                return
+            if (status.has_changes() and not status.deleted) or (price.has_changes() and not price.deleted):
+                self.stale = True  # Previous value was never loaded; cannot diff
+                return
+            old_status = status.deleted[0] if status.has_changes() else obj.status
+            old_price = price.deleted[0] if price.has_changes() else obj.current_price
+            if old_status != obj.status:
+                self.auctions[old_status] -= 1
+                self.auctions[obj.status] += 1
+            if old_status == AuctionStatus.COMPLETED:
+                self.clearing(old_price, -1)
+            if obj.status == AuctionStatus.COMPLETED:
+                self.clearing(obj.current_price, +1)
+        elif isinstance(obj, TimeSlot):
+            status = attributes.get_history(obj, "status")
+            if status.has_changes():
+                if not status.deleted:
+                    self.stale = True
+                    return
+                self.slots[status.deleted[0]] -= 1
+                self.slots[obj.status] += 1
+
+
+class MarketSummary:
+    def __init__(self):
+        self._auctions: Counter = Counter()
+        self._slots: Counter = Counter()
+        self._bookings = 0
+        self._resources = 0
+        self._clearing_sum = 0.0
+        self._histogram: Counter = Counter()
+        self._token_volume = 0.0
+        self._built_at: float | None = None  # None: rebuild on the next read
+        self._as_of: datetime | None = None
+        self._generation = 0  # Bumped by every applied delta
+        self._lock = asyncio.Lock()
+        self.rebuilds = 0
+
+    def invalidate(self) -> None:
+        self._built_at = None
+
+    def apply(self, delta: SummaryDelta) -> None:
+        if delta.stale:
+            self.invalidate()
+            return
+        self._auctions.update(delta.auctions)
+        self._slots.update(delta.slots)
+        self._bookings += delta.bookings
+        self._resources += delta.resources
+        self._clearing_sum += delta.clearing_sum
+        self._histogram.update(delta.histogram)
+        self._token_volume += delta.token_volume
+        self._generation += 1
+        self._as_of = datetime.utcnow()
+
+    def _fresh(self) -> bool:
+        return (
+            self._built_at is not None
+            and time.monotonic() - self._built_at < settings.MARKET_SUMMARY_MAX_AGE_SEC
+        )
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        """Recompute every total from the tables."""
+        generation = self._generation
+        bucket = cast(Auction.current_price / PRICE_BIN_WIDTH, Integer)
+        auctions = Counter(dict((await db.execute(
+            select(Auction.status, func.count()).group_by(Auction.status)
+        )).all()))
+        clearing = (await db.execute(
+            select(bucket, func.count(), func.sum(Auction.current_price))
+            .where(Auction.status == AuctionStatus.COMPLETED)
+            .group_by(bucket)
+        )).all()
+        slots = Counter(dict((await db.execute(
+            select(TimeSlot.status, func.count()).group_by(TimeSlot.status)
+        )).all()))
+        bookings = await db.scalar(select(func.count()).select_from(Booking))
+        resources = await db.scalar(select(func.count()).select_from(Resource))
+        volume = await db.scalar(
+            select(func.sum(func.abs(Transaction.amount))).where(Transaction.type == "bid_payment")
+        )
+
+        self._auctions, self._slots = auctions, slots
+        self._bookings, self._resources = bookings or 0, resources or 0
+        self._histogram = Counter({b: n for b, n, _ in clearing})
+        self._clearing_sum = sum(total or 0.0 for _, _, total in clearing)
+        self._token_volume = volume or 0.0
+        self._as_of = datetime.utcnow()
+        self.rebuilds += 1
+        # A commit that landed while we were reading may or may not be in
+        # the numbers above; rebuild again next time rather than guess
+        self._built_at = time.monotonic() if self._generation == generation else None
+
+    async def get(self, db: AsyncSession) -> dict:
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    await self.rebuild(db)
+        return self.to_dict()
+
+    def to_dict(self) -> dict:
+        completed = self._auctions[AuctionStatus.COMPLETED]
+        total_slots = sum(self._slots.values())
+        return {
+            "active_auctions": self._auctions[AuctionStatus.ACTIVE],
+            "completed_auctions": completed,
+            "total_resources": self._resources,
+            "total_slots": total_slots,
+            "available_slots": self._slots[TimeSlotStatus.AVAILABLE],
+            "booked_slots": self._slots[TimeSlotStatus.BOOKED],
+            "total_bookings": self._bookings,
+            "clearing_price_sum": round(self._clearing_sum, 2),
+            "clearing_price_count": completed,
+            "avg_clearing_price": round(self._clearing_sum / completed, 2) if completed else 0,
+            "clearing_price_histogram": [
+                {"min": b * PRICE_BIN_WIDTH, "max": (b + 1) * PRICE_BIN_WIDTH, "count": n}
+                for b, n in sorted(self._histogram.items()) if n > 0
+            ],
+            "token_volume": round(self._token_volume, 2),
+            "as_of": self._as_of.isoformat() if self._as_of else None,
+        }
+
+
+market_summary = MarketSummary()
+
+
+def _session_delta(session: Session) -> SummaryDelta:
+    delta = session.info.get(_DELTA_KEY)
+    if delta is None:
+        delta = session.info[_DELTA_KEY] = SummaryDelta()
+        run_after_commit(session, _apply_committed, session.info)
+    return delta
+
+
+def _apply_committed(info: dict) -> None:
+    delta = info.pop(_DELTA_KEY, None)
+    if delta is not None:
+        market_summary.apply(delta)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flush(session: Session, flush_context) -> None:
+    # new/dirty/deleted and attribute history still show the pre-flush state here
+    delta = None
+    for objects, handle in (
+        (session.new, lambda d, o: d.add_row(o, +1)),
+        (session.deleted, lambda d, o: d.add_row(o, -1)),
+        (session.dirty, lambda d, o: d.update_row(o)),
+    ):
+        for obj in objects:
+            if obj.__class__.__tablename__ in _TRACKED_TABLES:
+                delta = delta or _session_delta(session)
+                handle(delta, obj)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _watch_bulk_statements(orm_execute_state) -> None:
+    statement = orm_execute_state.statement
+    if isinstance(statement, TextClause):
+        bulk = not statement.text.lstrip().upper().startswith("SELECT")
+    elif orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = statement.table
+        bulk = table.name in _TRACKED_TABLES and not (
+            orm_execute_state.is_update and _price_only_update(statement)
+        )
+    else:
+        bulk = False
+    if bulk:
+        _session_delta(orm_execute_state.session).stale = True
+
+
+def _price_only_update(statement) -> bool:
+    """Updates the summary does not count: auction prices (and tick stamps)
+    on rows the WHERE clause limits to ACTIVE, and slot pricing stamps.
+
+    A completed auction's price is its clearing price, so price updates not
+    restricted to active auctions still mark the summary stale."""
+    columns = {getattr(col, "key", col) for col in (statement._values or {})}
+    if statement.table.name == Auction.__tablename__:
+        return (
+            columns <= {"current_price", "start_price", "min_price", "last_ticked_at"}
+            and _active_only(statement.whereclause)
+        )
+    if statement.table.name == TimeSlot.__tablename__:
+        return columns <= {"priced_version", "priced_lead_bucket"}
+    return False
+
+
+def _active_only(where) -> bool:
+    """True if `where` ANDs in `status = ACTIVE`."""
+    if isinstance(where, BooleanClauseList) and where.operator is operators.and_:
+        return any(_active_only(clause) for clause in where.clauses)
+    return (
+        isinstance(where, BinaryExpression)
+        and where.operator is operators.eq
+        and getattr(where.left, "key", None) == "status"
+        and getattr(where.right, "value", None) == AuctionStatus.ACTIVE
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_delta(session: Session) -> None:
+    session.info.pop(_DELTA_KEY, None)
@@ -0,0 +1,179 @@
+"""In-memory limit order book: one price-time priority queue per time slot.
+
+The `limit_orders` table stays the source of truth. The book only indexes
+PENDING orders so a Dutch tick can find the orders its new price triggers
+with a heap peek instead of a table scan. It is loaded from the table on
+first use (or at startup), and writers keep it in step by staging changes
+on their session with `stage_add` / `stage_discard`; staged changes are
+applied when that session commits and dropped if it rolls back
+(`app.database.run_after_commit`).
+
+Orders written by other worker processes never reach this process's
+staging, so `ensure_loaded` re-checks the book before each match: one
+`SELECT count(*), max(created_at)` over `limit_orders`. Inserts anywhere
+grow the count and bulk deletes (resets, restores) shrink it or move the
+newest timestamp; on a mismatch the book is rebuilt from the table.
+
+Entries that went stale anyway (e.g. a status changed by a bulk statement)
+are harmless: callers re-read the candidate rows and skip any that are no
+longer PENDING, discarding them from the book as they go.
+"""
+import asyncio
+import heapq
+import itertools
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import run_after_commit
+from app.models import LimitOrder, LimitOrderStatus
+
+
+class SlotBook:
+    """Pending orders for one time slot, best (highest max_price, earliest) first."""
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, str]] = []  # (-max_price, arrival, order_id)
+        self._live: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def add(self, order_id: str, max_price: float, arrival: int) -> None:
+        if order_id in self._live:
+            return
+        self._live.add(order_id)
+        heapq.heappush(self._heap, (-max_price, arrival, order_id))
+
+    def discard(self, order_id: str) -> None:
+        # Lazy deletion: the heap entry is skipped when it reaches the top
+        self._live.discard(order_id)
+
+    def best_price(self) -> float | None:
+        while self._heap and self._heap[0][2] not in self._live:
+            heapq.heappop(self._heap)
+        return -self._heap[0][0] if self._heap else None
+
+    def eligible(self, price: float, limit: int) -> list[str]:
+        """Up to `limit` orders willing to pay at least `price`, in priority order.
+
+        Walks the heap from the top without popping it: a node's children
+        are only visited once the node is taken, so this costs
+        O(limit log limit) whatever the number of eligible orders.
+        """
+        best = self.best_price()
+        if best is None or best < price:
+            return []
+        heap, found = self._heap, []
+        frontier = [(heap[0], 0)]
+        while frontier and len(found) < limit:
+            entry, i = heapq.heappop(frontier)
+            if entry[2] in self._live:
+                found.append(entry[2])
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap) and -heap[child][0] >= price:
+                    heapq.heappush(frontier, (heap[child], child))
+        return found
+
+
+class OrderBook:
+    def __init__(self):
+        self._books: dict[str, SlotBook] = {}
+        self._slot_of: dict[str, str] = {}  # order_id -> time_slot_id
+        self._arrival = itertools.count()
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        # What the table looked like at the last sync: (row count, newest created_at)
+        self._count = 0
+        self._newest = None
+        self._own_adds = 0  # Orders this process added since, created_at unknown
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def add(self, order_id: str, time_slot_id: str, max_price: float) -> None:
+        if order_id in self._slot_of:
+            return
+        self._slot_of[order_id] = time_slot_id
+        self._books.setdefault(time_slot_id, SlotBook()).add(order_id, max_price, next(self._arrival))
+
+    def discard(self, order_id: str) -> None:
+        slot_id = self._slot_of.pop(order_id, None)
+        if slot_id is None:
+            return
+        book = self._books[slot_id]
+        book.discard(order_id)
+        if not book:
+            del self._books[slot_id]
+
+    def candidates(self, time_slot_id: str, price: float, limit: int) -> list[str]:
+        """Up to `limit` pending order ids for the slot with max_price >= price, best first."""
+        book = self._books.get(time_slot_id)
+        return book.eligible(price, limit) if book else []
+
+    def clear(self) -> None:
+        """Forget every order; the next `ensure_loaded` reloads from the table."""
+        self._books.clear()
+        self._slot_of.clear()
+        self._loaded = False
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """Reload every PENDING order from the table. Returns the order count."""
+        async with self._lock:
+            return await self._load(db)
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Load the book, or rebuild it if the table changed behind its back."""
+        if self._loaded:
+            count, newest = await self._table_state(db)
+            if count == self._count + self._own_adds and (self._own_adds or newest == self._newest):
+                self._count, self._newest, self._own_adds = count, newest, 0
+                return
+        async with self._lock:
+            await self._load(db)
+
+    @staticmethod
+    async def _table_state(db: AsyncSession) -> tuple[int, object]:
+        return tuple((await db.execute(
+            select(func.count(), func.max(LimitOrder.created_at)).select_from(LimitOrder)
+        )).one())
+
+    async def _load(self, db: AsyncSession) -> int:
+        # Read the state first: a concurrent insert then only causes another rebuild
+        self._count, self._newest = await self._table_state(db)
+        self._own_adds = 0
+        rows = (await db.execute(
+            select(LimitOrder.id, LimitOrder.time_slot_id, LimitOrder.max_price)
+            .where(LimitOrder.status == LimitOrderStatus.PENDING)
+            .order_by(LimitOrder.created_at, LimitOrder.id)
+        )).all()
+        self._books.clear()
+        self._slot_of.clear()
+        for order_id, slot_id, max_price in rows:
+            self.add(order_id, slot_id, max_price)
+        self._loaded = True
+        return len(rows)
+
+    # --- Transactional sync ---
+
+    def stage_add(self, db: AsyncSession, order: LimitOrder) -> None:
+        """Add `order` to the book once `db` commits."""
+        run_after_commit(db, self._add_committed, order.id, order.time_slot_id, order.max_price)
+
+    def _add_committed(self, order_id: str, time_slot_id: str, max_price: float) -> None:
+        if self._loaded and order_id not in self._slot_of:
+            self._own_adds += 1  # Expected in the table, so no rebuild for it
+        self.add(order_id, time_slot_id, max_price)
+
+    def stage_discard(self, db: AsyncSession, order_id: str) -> None:
+        """Drop `order_id` from the book once `db` commits."""
+        run_after_commit(db, self.discard, order_id)
+
+    def stage_clear(self, db: AsyncSession) -> None:
+        """Reload the book from the table on next use once `db` commits (bulk deletes)."""
+        run_after_commit(db, self.clear)
+
+
+order_book = OrderBook()
+
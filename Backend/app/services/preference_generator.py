@@ -1,14 +1,13 @@
 import random
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AdminConfig, Agent, AgentPreference
+from app.services.config_cache import config_cache
 
 
 async def _get_config(db: AsyncSession) -> AdminConfig:
-    result = await db.execute(select(AdminConfig).where(AdminConfig.id == 1))
-    config = result.scalar_one_or_none()
+    config = await config_cache.get(db)
     if config is None:
         config = AdminConfig(id=1)
         db.add(config)
@@ -1,38 +1,143 @@
-import random
 from datetime import datetime, timedelta
 import uuid
-from sqlalchemy import select, insert, delete, and_
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, bindparam, case, or_, select, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import AdminConfig, Resource, TimeSlot, Auction, TimeSlotStatus, AuctionStatus
+from app.models import Resource, TimeSlot, Auction, TimeSlotStatus, AuctionStatus
+from app.services.config_cache import config_cache
+from app.services.event_bus import event_bus
+
+BASE_PRICE = 15.0
+PRICE_FLOOR = 5.0
+PRICE_CEILING = 500.0
+NOISE_AMPLITUDE = 0.05  # The "Vegas" factor: +/-5% random fluctuation
+LEAD_BUCKET_HOURS = 24  # Lead time is priced in whole buckets of this size
+
+# AdminConfig fields that feed the price model; changing any of them bumps
+# AdminConfig.pricing_model_version so incremental passes reprice everything.
+PRICING_INPUT_FIELDS = (
+    "location_popularity",
+    "time_popularity",
+    "capacity_weight",
+    "location_weight",
+    "time_of_day_weight",
+    "day_of_week_weight",
+    "global_price_modifier",
+    "lead_time_sensitivity",
+)
+
+
+def time_popularity_table(time_pop: dict) -> np.ndarray:
+    """Learned "day-hour" popularity as a 7x24 array, NaN where nothing was learned."""
+    table = np.full((7, 24), np.nan)
+    for key, value in time_pop.items():
+        day, hour = (int(part) for part in key.split("-"))
+        table[day, hour] = float(value)
+    return table
+
+
+def price_kernel(
+    capacity: np.ndarray,
+    location_score: np.ndarray,
+    day_of_week: np.ndarray,
+    hour: np.ndarray,
+    days_out: np.ndarray,
+    time_pop_table: np.ndarray,
+    config,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Price every slot in one pass from column arrays.
+
+    Same model as the original per-slot formula: learned location and
+    day-hour popularity (falling back to distance from the 14:00 peak when
+    a day-hour was never observed), capacity, lead-time urgency and a small
+    random noise term, clamped to [PRICE_FLOOR, PRICE_CEILING].
+    """
+    learned = time_pop_table[day_of_week, hour]
+    missing = np.isnan(learned)
+    hist_time_pop = np.where(missing, 0.5, learned)
+    peak_score = np.maximum(0.2, 1.0 - np.abs(hour - 14) / 10.0)
+    hour_score = np.where(missing, peak_score, learned)
+
+    cap_score = np.minimum(capacity, 100) / 100.0
+
+    # 0 = today, 1 = 30+ days away; price increases as we get closer
+    lead_ratio = np.minimum(1.0, np.maximum(0.0, days_out) / 30.0)
+    lead_score = 1.0 + (config.lead_time_sensitivity * (1.1 - lead_ratio))
+
+    noise = 1.0 + rng.uniform(-NOISE_AMPLITUDE, NOISE_AMPLITUDE, size=len(capacity))
+
+    base_demand = (
+        (cap_score * config.capacity_weight * 0.5) +  # Small rooms are base
+        (location_score * config.location_weight * 2.0) +  # Location is big
+        (hour_score * config.time_of_day_weight * 2.5) +  # Time is biggest
+        (hist_time_pop * config.day_of_week_weight * 1.5)  # Day of week influence
+    ) / 5.0
+
+    final_price = BASE_PRICE * config.global_price_modifier * lead_score * base_demand * noise
+    return np.clip(final_price, PRICE_FLOOR, PRICE_CEILING)
+
+
+def slot_time_columns(start_times: list[datetime], now: datetime) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Day of week, hour and fractional days until start for each slot."""
+    # DatetimeIndex parses a list of datetimes far faster than np.array(..., dtype=datetime64)
+    starts = pd.DatetimeIndex(start_times).values.astype("datetime64[s]").astype(np.int64)
+    day_of_week = ((starts // 86400) + 3) % 7  # 1970-01-01 was a Thursday
+    hour = (starts % 86400) // 3600
+    days_out = (starts - np.datetime64(now, "s").astype(np.int64)) / 86400.0
+    return day_of_week, hour, days_out
+
+
+def lead_buckets(days_out: np.ndarray) -> np.ndarray:
+    """Whole LEAD_BUCKET_HOURS buckets until start; slots already started are bucket 0."""
+    return np.maximum(0, np.floor(days_out * 24.0 / LEAD_BUCKET_HOURS)).astype(np.int64)
+
 
-async def recalculate_prices(db: AsyncSession, start_date: datetime, days: int = 7):
-    # 1. Get Config & Weightings
-    config_res = await db.execute(select(AdminConfig).where(AdminConfig.id == 1))
-    config = config_res.scalar_one_or_none()
+def _lead_bucket_expr(now: datetime, end_date: datetime):
+    """SQL CASE giving each slot's current lead bucket, for the stale-slot filter."""
+    step = timedelta(hours=LEAD_BUCKET_HOURS)
+    whens = []
+    bucket, bound = 0, now + step
+    while bound <= end_date + step:
+        whens.append((TimeSlot.start_time < bound, bucket))
+        bucket, bound = bucket + 1, bound + step
+    return case(*whens, else_=bucket)
+
+
+async def recalculate_prices(
+    db: AsyncSession,
+    start_date: datetime,
+    days: int = 7,
+    seed: int | None = None,
+    incremental: bool = False,
+) -> int:
+    """Reprice unbooked slots in [start_date, start_date + days].
+
+    Slot inputs are read as plain columns and priced together by
+    `price_kernel`; existing auctions are updated with one bulk UPDATE and
+    slots without an auction get one with a single bulk INSERT. Pass
+    `seed` for reproducible noise.
+
+    Every priced slot is stamped with the model version and lead-time
+    bucket it was priced at. With `incremental=True` only slots whose
+    stamp is stale are repriced: the config version moved on, the slot
+    crossed into a new lead bucket, or it was marked dirty (stamp cleared)
+    by a booking-state change. Returns the number of slots priced.
+    """
+    config = await config_cache.get(db)
     if not config:
-        return
-
-    # Weights
-    w_cap = config.capacity_weight
-    w_loc = config.location_weight
-    w_tod = config.time_of_day_weight
-    w_dow = config.day_of_week_weight
-    w_lead = config.lead_time_sensitivity
-    g_mod = config.global_price_modifier
-    
+        return 0
+
     loc_pop = config.location_popularity or {}
-    time_pop = config.time_popularity or {} # Keyed by "day-hour"
-    
-    # 2. Get Resources
-    res_result = await db.execute(select(Resource))
-    resources = res_result.scalars().all()
-    resource_map = {r.id: r for r in resources}
-
-    # 3. Fetch future slots
+    now = config.current_simulation_date or datetime.utcnow()
+    version = config.pricing_model_version
+
     end_date = start_date + timedelta(days=days)
-    
-    slots_res = await db.execute(
-        select(TimeSlot, Auction)
+    query = (
+        select(TimeSlot.id, TimeSlot.start_time, Resource.location, Resource.capacity, Auction.id)
+        .join(Resource, Resource.id == TimeSlot.resource_id)
         .outerjoin(Auction, Auction.time_slot_id == TimeSlot.id)
         .where(
             TimeSlot.start_time >= start_date,
@@ -40,95 +145,95 @@ async def recalculate_prices(db: AsyncSession, start_date: datetime, days: int =
             TimeSlot.status != TimeSlotStatus.BOOKED
         )
     )
-    rows = slots_res.all()
-    
-    # Helper to calculate price
-    def calculate_price(slot, resource):
-        dow = slot.start_time.weekday()
-        hour = slot.start_time.hour
-        
-        # 1. Learned Popularity (ML aspect)
-        # Location
-        loc_score = float(loc_pop.get(resource.location, 0.5))
-        
-        # Time (Day + Hour)
-        time_key = f"{dow}-{hour}"
-        hist_time_pop = float(time_pop.get(time_key, 0.5))
-        
-        # Fallback to general hour peak if specific day-hour is missing
-        if time_key not in time_pop:
-            dist_from_peak = abs(hour - 14)
-            hour_score = max(0.2, 1.0 - (dist_from_peak / 10.0))
-        else:
-            hour_score = hist_time_pop
-
-        # 2. Capacity Score
-        cap_score = min(resource.capacity, 100) / 100.0
-        
-        # 3. Lead Time Score (Urgency Modifier)
-        delta = slot.start_time - config.current_simulation_date
-        days_out = max(0, delta.total_seconds() / 86400.0)
-        lead_ratio = min(1.0, days_out / 30.0) # 0 = today, 1 = 30+ days away
-        # Price increases exponentially as we get closer
-        lead_score = 1.0 + (w_lead * (1.1 - lead_ratio))
-        
-        # 4. Market Noise (The "Vegas" factor)
-        noise = 1.0 + (random.uniform(-0.05, 0.05)) # Small random fluctuations
-        
-        # Combine
-        # Using a weighted average of scores
-        base_demand = (
-            (cap_score * w_cap * 0.5) + # Small rooms are base
-            (loc_score * w_loc * 2.0) + # Location is big
-            (hour_score * w_tod * 2.5) + # Time is biggest
-            (hist_time_pop * w_dow * 1.5) # Day of week influence
-        ) / 5.0
-        
-        base_price = 15.0
-        final_price = base_price * g_mod * lead_score * base_demand * noise
-        
-        # Hard limits
-        return max(5.0, min(final_price, 500.0))
-
-    # Update Loop
-    # Update Loop - Optimize for Bulk Insert
+    if incremental:
+        query = query.where(or_(
+            TimeSlot.priced_version.is_(None),
+            TimeSlot.priced_version != version,
+            TimeSlot.priced_lead_bucket.is_(None),
+            TimeSlot.priced_lead_bucket != _lead_bucket_expr(now, end_date),
+        ))
+    rows_res = await db.execute(query)
+    rows = rows_res.all()
+    if not rows:
+        return 0
+
+    slot_ids, start_times, locations, capacities, auction_ids = zip(*rows)
+
+    unique_locations, location_index = np.unique(np.array(locations, dtype=object), return_inverse=True)
+    location_scores = np.array([float(loc_pop.get(loc, 0.5)) for loc in unique_locations])
+    day_of_week, hour, days_out = slot_time_columns(start_times, now)
+
+    # Price at the start of the lead bucket so a slot's price only moves
+    # when its bucket does; full and incremental passes then agree.
+    buckets = lead_buckets(days_out)
+
+    prices = price_kernel(
+        capacity=np.array(capacities, dtype=np.float64),
+        location_score=location_scores[location_index],
+        day_of_week=day_of_week,
+        hour=hour,
+        days_out=buckets * (LEAD_BUCKET_HOURS / 24.0),
+        time_pop_table=time_popularity_table(config.time_popularity or {}),
+        config=config,
+        rng=np.random.default_rng(seed),
+    )
+    start_prices = np.round(prices * 1.6, 2).tolist()
+    min_prices = np.round(prices * 0.4, 2).tolist()
+    current_prices = np.round(prices, 2).tolist()
+
+    auctions_to_update = []
     auctions_to_insert = []
-    
-    for slot, auction in rows:
-        resource = resource_map.get(slot.resource_id)
-        if not resource: continue
-        
-        new_price = calculate_price(slot, resource)
-        
-        start_price = round(float(new_price * 1.6), 2)
-        min_price = round(float(new_price * 0.4), 2)
-        current_price = round(float(new_price), 2)
-        
-        if auction:
-             # Update existing auction
-             auction.current_price = current_price
-             auction.start_price = start_price
-             auction.min_price = min_price
+    for i, auction_id in enumerate(auction_ids):
+        if auction_id:
+            auctions_to_update.append({
+                "auction_id": auction_id,
+                "current_price": current_prices[i],
+                "start_price": start_prices[i],
+                "min_price": min_prices[i],
+            })
         else:
-            # Prepare for bulk insert
-            new_auc_id = str(uuid.uuid4())
             auctions_to_insert.append({
-                "id": new_auc_id,
-                "time_slot_id": slot.id,
-                "start_price": start_price,
-                "min_price": min_price,
-                "current_price": current_price,
+                "id": str(uuid.uuid4()),
+                "time_slot_id": slot_ids[i],
+                "start_price": start_prices[i],
+                "min_price": min_prices[i],
+                "current_price": current_prices[i],
                 "status": AuctionStatus.ACTIVE,
                 "auction_type": config.default_auction_type,
                 "price_step": config.dutch_price_step,
                 "tick_interval_sec": config.dutch_tick_interval_sec,
-                "created_at": config.current_simulation_date or datetime.utcnow()
+                "created_at": now,
             })
-            
+
+    if auctions_to_update:
+        # One Core UPDATE executed as a single executemany; skips ORM
+        # per-row bookkeeping, which dominated at 100k+ slots.
+        auctions = Auction.__table__
+        await db.execute(
+            update(auctions)
+            # Completed auctions keep their clearing price
+            .where(auctions.c.id == bindparam("auction_id"), auctions.c.status == AuctionStatus.ACTIVE)
+            .values(
+                current_price=bindparam("current_price"),
+                start_price=bindparam("start_price"),
+                min_price=bindparam("min_price"),
+            ),
+            auctions_to_update,
+        )
     if auctions_to_insert:
-        # Bulk Insert
         await db.execute(insert(Auction), auctions_to_insert)
-            
-    # Increment model version
-    config.pricing_model_version += 1
+
+    slots = TimeSlot.__table__
+    await db.execute(
+        update(slots)
+        .where(slots.c.id == bindparam("slot_id"))
+        .values(priced_version=bindparam("priced_version"), priced_lead_bucket=bindparam("priced_lead_bucket")),
+        [
+            {"slot_id": slot_id, "priced_version": version, "priced_lead_bucket": bucket}
+            for slot_id, bucket in zip(slot_ids, buckets.tolist())
+        ],
+    )
     await db.flush()
+    # One summary event rather than one per slot; clients re-fetch what they show
+    event_bus.publish_after_commit(db, {"type": "prices_recalculated", "slots": len(slot_ids)})
+    return len(slot_ids)
@@ -0,0 +1,79 @@
+"""In-process TTL + LRU cache for slow upstream calls, with single-flight.
+
+`get_or_call(key, fn)` returns the cached value for `key` if it is younger
+than the TTL. Otherwise it awaits `fn()`, and every caller that asks for
+the same key while that call is running waits on it instead of starting
+its own, so N identical requests cost one upstream call. Failures are
+handed to everyone waiting but never cached.
+
+The upstream call runs as its own task: a caller that disconnects does
+not cancel it for the others.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int, ttl_sec: float):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()  # key -> (expires_at, value)
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # Misses that joined a call already in flight
+        self.evictions = 0
+        self.expirations = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_call(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+            self.expirations += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t))
+        return await asyncio.shield(task)
+
+    def _settle(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        # exception() also marks a failure as retrieved when nobody is left waiting
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.max_entries <= 0 or self.ttl_sec <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_sec, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        requests = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_sec": self.ttl_sec,
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round((self.hits + self.coalesced) / requests, 4) if requests else 0.0,
+        }
@@ -14,6 +14,7 @@ from app.models import (
     TimeSlotStatus,
 )
 from app.services.auction_engine import get_auction_engine
+from app.services.market_summary import market_summary
 from app.services.token_service import allocate_tokens
 
 
@@ -26,17 +27,15 @@ async def run_simulation_round(db: AsyncSession) -> dict:
     # Step 1: Allocate tokens
     transactions = await allocate_tokens(db)
 
-    # Step 2: Tick all active auctions
-    active_result = await db.execute(
-        select(Auction).where(Auction.status == AuctionStatus.ACTIVE)
+    # Step 2: Tick all active auctions, one batch per auction type
+    types_result = await db.execute(
+        select(Auction.auction_type).where(Auction.status == AuctionStatus.ACTIVE).distinct()
     )
-    active_auctions = active_result.scalars().all()
 
     ticked = 0
-    for auction in active_auctions:
-        engine = get_auction_engine(auction.auction_type)
-        await engine.tick(auction, db)
-        ticked += 1
+    for auction_type in types_result.scalars().all():
+        engine = get_auction_engine(auction_type)
+        ticked += await engine.tick_batch(db, auction_type)
 
     await db.commit()
 
@@ -57,40 +56,17 @@ async def run_simulation_round(db: AsyncSession) -> dict:
 
 
 async def get_simulation_results(db: AsyncSession) -> dict:
-    """Get comprehensive simulation metrics."""
-    # Clearing prices (completed auctions)
-    completed_result = await db.execute(
-        select(Auction).where(Auction.status == AuctionStatus.COMPLETED)
-    )
-    completed = completed_result.scalars().all()
-    clearing_prices = [a.current_price for a in completed]
-
-    # Utilization
-    total_slots = await db.execute(select(func.count()).select_from(TimeSlot))
-    booked_slots = await db.execute(
-        select(func.count())
-        .select_from(TimeSlot)
-        .where(TimeSlot.status == TimeSlotStatus.BOOKED)
-    )
-    total = total_slots.scalar()
-    booked = booked_slots.scalar()
-
-    # Token velocity
-    from app.models import Transaction
-
-    total_volume = await db.execute(
-        select(func.sum(func.abs(Transaction.amount)))
-        .where(Transaction.type == "bid_payment")
-    )
-
+    """Get comprehensive simulation metrics from the materialized market summary."""
+    summary = await market_summary.get(db)
+    total, booked = summary["total_slots"], summary["booked_slots"]
     return {
-        "completed_auctions": len(completed),
-        "clearing_prices": clearing_prices,
-        "avg_clearing_price": round(sum(clearing_prices) / len(clearing_prices), 2) if clearing_prices else 0,
+        "completed_auctions": summary["completed_auctions"],
+        "avg_clearing_price": summary["avg_clearing_price"],
+        "clearing_price_histogram": summary["clearing_price_histogram"],
         "utilization": round(booked / total, 4) if total else 0,
         "total_slots": total,
         "booked_slots": booked,
-        "token_volume": round(total_volume.scalar() or 0, 2),
+        "token_volume": summary["token_volume"],
     }
 
 async def simulate_semester(db: AsyncSession, weeks: int = 1):
@@ -121,7 +97,7 @@ async def simulate_semester(db: AsyncSession, weeks: int = 1):
         config.current_simulation_date = current_date
         
         # B. Recalc Prices (Morning update)
-        await recalculate_prices(db, current_date, days=7)
+        await recalculate_prices(db, current_date, days=7, incremental=True)
         
         # C. Agent Actions
         # Each agent considers booking something in the next 7 days
@@ -0,0 +1,154 @@
+"""Named snapshots of the whole market database, for switching scenarios.
+
+A snapshot is a standalone SQLite file in `MARKET_SNAPSHOT_DIR` holding
+every table (resources, slots, auctions, agents, bookings, config...).
+Taking one runs `VACUUM INTO`, which writes a compact copy without
+blocking readers. Restoring copies the file's pages back over the live
+database with SQLite's online backup API. Both cost about one file copy,
+however large the catalog is, and neither re-runs the importer.
+
+After a restore, in-process state derived from the tables is rebuilt (the
+limit order book, the auction clock's schedule, the config cache and the
+market summary). A `snapshot_restored` event tells stream clients to
+re-fetch everything.
+
+Only SQLite databases are supported; other backends have their own dump
+and restore tooling.
+"""
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+import aiosqlite
+from sqlalchemy import func, select, update
+
+from app.config import settings
+from app.database import async_session, engine
+from app.models import AdminConfig
+from app.services.auction_clock import auction_clock
+from app.services.config_cache import config_cache
+from app.services.event_bus import event_bus
+from app.services.import_jobs import import_jobs
+from app.services.market_summary import market_summary
+from app.services.order_book import order_book
+
+SNAPSHOT_SUFFIX = ".db"
+_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+_REQUIRED_TABLES = {"resources", "time_slots", "auctions", "agents", "admin_config"}
+
+
+class SnapshotError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _ensure_sqlite() -> None:
+    if engine.dialect.name != "sqlite":
+        raise SnapshotError(501, "Snapshots are only supported for SQLite databases")
+
+
+def _path(name: str) -> str:
+    if not _NAME_RE.match(name) or name.endswith(SNAPSHOT_SUFFIX):
+        raise SnapshotError(400, "Snapshot names use letters, digits, '_', '-' and '.' (max 64)")
+    return os.path.join(settings.SNAPSHOT_DIR, name + SNAPSHOT_SUFFIX)
+
+
+def _describe(name: str, path: str) -> dict:
+    stat = os.stat(path)
+    return {
+        "name": name,
+        "size_bytes": stat.st_size,
+        "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+    }
+
+
+def list_snapshots() -> list[dict]:
+    if not os.path.isdir(settings.SNAPSHOT_DIR):
+        return []
+    snapshots = [
+        _describe(entry.name[: -len(SNAPSHOT_SUFFIX)], entry.path)
+        for entry in os.scandir(settings.SNAPSHOT_DIR)
+        if entry.is_file() and entry.name.endswith(SNAPSHOT_SUFFIX)
+    ]
+    return sorted(snapshots, key=lambda s: s["created_at"], reverse=True)
+
+
+def get_snapshot(name: str) -> dict:
+    path = _path(name)
+    if not os.path.exists(path):
+        raise SnapshotError(404, "Snapshot not found")
+    return _describe(name, path)
+
+
+async def create_snapshot(name: str, overwrite: bool = False) -> dict:
+    """Write the committed state of the live database to snapshot `name`."""
+    _ensure_sqlite()
+    path = _path(name)
+    if os.path.exists(path) and not overwrite:
+        raise SnapshotError(409, f"Snapshot '{name}' already exists")
+    os.makedirs(settings.SNAPSHOT_DIR, exist_ok=True)
+
+    # VACUUM INTO refuses an existing file; write aside and swap in atomically
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("VACUUM INTO ?", (os.path.abspath(tmp_path),))
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise SnapshotError(409, f"Could not snapshot the database: {e}")
+    os.replace(tmp_path, path)
+    return _describe(name, path)
+
+
+async def restore_snapshot(name: str) -> dict:
+    """Replace the live database with snapshot `name`."""
+    _ensure_sqlite()
+    path = _path(name)
+    if not os.path.exists(path):
+        raise SnapshotError(404, "Snapshot not found")
+    if import_jobs.busy:
+        raise SnapshotError(409, "An import job is running; cancel it before restoring")
+
+    async with aiosqlite.connect(path) as source:
+        tables = {row[0] for row in await source.execute_fetchall(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+        missing = _REQUIRED_TABLES - tables
+        if missing:
+            raise SnapshotError(400, f"Not a market snapshot (missing {', '.join(sorted(missing))})")
+        async with async_session() as db:
+            live_version = await db.scalar(select(AdminConfig.version).where(AdminConfig.id == 1)) or 0
+        try:
+            async with engine.connect() as conn:
+                live = (await conn.get_raw_connection()).driver_connection
+                await source.backup(live)
+        except sqlite3.Error as e:
+            raise SnapshotError(409, f"Could not restore while the database is busy: {e}")
+
+    async with async_session() as db:
+        # The snapshot's config version may be one that caches (here or in
+        # other workers) already hold for different contents; move past both
+        await db.execute(
+            update(AdminConfig).values(version=func.max(AdminConfig.version, live_version) + 1)
+        )
+        await db.commit()
+        await order_book.rebuild(db)
+    config_cache.invalidate()
+    market_summary.invalidate()
+    if auction_clock.running:
+        await auction_clock.refresh()
+    event_bus.publish({"type": "snapshot_restored", "name": name})
+    return _describe(name, path)
+
+
+def delete_snapshot(name: str) -> None:
+    path = _path(name)
+    if not os.path.exists(path):
+        raise SnapshotError(404, "Snapshot not found")
+    os.remove(path)
@@ -2,12 +2,12 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AdminConfig, Agent, Transaction
+from app.services.config_cache import config_cache
 
 
 async def allocate_tokens(db: AsyncSession) -> list[Transaction]:
     """Allocate tokens to all active agents based on admin config."""
-    cfg_result = await db.execute(select(AdminConfig).where(AdminConfig.id == 1))
-    config = cfg_result.scalar_one_or_none()
+    config = await config_cache.get(db)
     if not config:
         config = AdminConfig(id=1)
         db.add(config)
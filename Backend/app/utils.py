@@ -1,5 +1,95 @@
 import uuid
 
+from sqlalchemy import LargeBinary, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+from app.config import settings
+
 
 def generate_uuid() -> str:
     return str(uuid.uuid4())
+
+
+def binary_ids() -> bool:
+    return settings.ID_STORAGE == "binary"
+
+
+class IdType(TypeDecorator):
+    """Primary and foreign key column type.
+
+    Ids are UUID strings in Python and at the API either way. With
+    `MARKET_ID_STORAGE=binary` they are stored as 16 bytes (a native `uuid`
+    column on PostgreSQL) instead of 36 characters of text, which shrinks
+    every primary key, foreign key and index entry by more than half.
+    """
+    impl = String
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if not binary_ids():
+            return dialect.type_descriptor(String())
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    # Plain closures rather than process_bind_param/process_result_value:
+    # text storage gets no per-value processing at all, and binary skips the
+    # TypeDecorator wrappers on every id loaded or bound (hex() and fromhex()
+    # are also several times faster than going through uuid.UUID).
+    def bind_processor(self, dialect):
+        if not binary_ids() or dialect.name == "postgresql":
+            return None
+
+        def process(value):
+            if value is None:
+                return None
+            try:
+                return bytes.fromhex(value.replace("-", ""))
+            except ValueError:
+                return value.encode()  # Not a UUID: matches no stored id
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        if not binary_ids() or dialect.name == "postgresql":
+            return None
+
+        def process(value):
+            if value is None or len(value) != 16:
+                return value
+            h = value.hex()
+            return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+        return process
+
+
+class sql_uuid(FunctionElement):
+    """A random UUID4 generated by the database, for set-based inserts
+    (INSERT ... SELECT) where `generate_uuid` cannot run per row."""
+    type = IdType()
+    inherit_cache = True
+
+
+@compiles(sql_uuid)
+def _sql_uuid_default(element, compiler, **kw):
+    return "gen_random_uuid()" if binary_ids() else "CAST(gen_random_uuid() AS VARCHAR)"
+
+
+@compiles(sql_uuid, "sqlite")
+def _sql_uuid_sqlite(element, compiler, **kw):
+    if binary_ids():
+        return "randomblob(16)"
+    return (
+        "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "lower(hex(randomblob(6)))"
+    )
+
+
+@compiles(sql_uuid, "mysql")
+def _sql_uuid_mysql(element, compiler, **kw):
+    return "UUID_TO_BIN(UUID())" if binary_ids() else "UUID()"
@@ -0,0 +1,73 @@
+"""Shared helpers for the benchmark scripts.
+
+Every benchmark points the app at a throwaway SQLite file *before* anything
+from ``app`` is imported, so the module-level engine binds to it. Run them
+from the Backend directory, e.g. ``python -m benchmarks.bench_indexes``.
+"""
+import os
+import statistics
+import tempfile
+import time
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def use_temp_database(name: str = "bench") -> str:
+    """Route the app to a fresh SQLite file and return its path."""
+    tmp_dir = tempfile.mkdtemp(prefix="market_bench_")
+    path = os.path.join(tmp_dir, f"{name}.db")
+    os.environ["MARKET_DATABASE_URL"] = f"sqlite+aiosqlite:///{path}"
+    return path
+
+
+def gmu_csv_path() -> str:
+    for candidate in (
+        os.path.join(BACKEND_DIR, "gmu_room_data_full.csv"),
+        os.path.join(BACKEND_DIR, "..", "gmu_room_data_full.csv"),
+    ):
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError("Could not find gmu_room_data_full.csv")
+
+
+async def time_async(fn, repeat: int = 20, warmup: int = 2) -> list[float]:
+    """Run ``await fn()`` repeatedly and return wall times in milliseconds."""
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def time_sync(fn, repeat: int = 5, warmup: int = 1) -> list[float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def summarize(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "median_ms": statistics.median(ordered),
+        "p95_ms": ordered[p95_index],
+    }
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    cells = [[str(h) for h in headers]] + [
+        [f"{c:.2f}" if isinstance(c, float) else str(c) for c in row] for row in rows
+    ]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
@@ -0,0 +1,83 @@
+"""Upstream calls and latency of Gemini requests with and without the cache.
+
+Uses the local stub backend (answers after `--delay` seconds) and replays
+two patterns: a burst of `--burst` identical admin reports fired at once,
+and `--requests` sequential chat messages drawn from `--distinct` phrasings
+(with random case and spacing, which the cache key normalizes away).
+
+    python -m benchmarks.bench_gemini [--delay 0.2] [--burst 20] [--requests 200] [--distinct 10]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks._common import print_table
+
+REPORT_DATA = {
+    "total_orders": 412, "active_auctions": 37, "avg_price": 18.4, "revenue_24h": 7580.8,
+    "popular_time": "2:00 PM - 4:00 PM (Simulated)", "quiet_time": "8:00 AM - 10:00 AM (Simulated)",
+}
+CONTEXT = {"sim_time": "2026-03-02 10:00:00", "avg_price": "22.5", "busy_hours": "10:00 - 14:00", "trend": "Rising"}
+
+
+def _phrasing(rng: random.Random, i: int) -> str:
+    words = f"when is the cheapest time to book room {i} this week".split()
+    return (" " * rng.randint(1, 2)).join(
+        w.upper() if rng.random() < 0.2 else w for w in words
+    ) + " " * rng.randint(0, 3)
+
+
+async def _scenario(client, direct: bool, burst: int, requests: int, distinct: int) -> list:
+    backend = client.backend
+    generate = backend.generate
+
+    async def report(i):
+        data = dict(REPORT_DATA, date=f"2026-03-02 10:{i % 60:02d}")
+        if direct:
+            return await generate(str(sorted(data.items())))
+        return await client.generate_admin_market_report(data)
+
+    async def chat(message):
+        if direct:
+            return await generate(message)
+        return await client.chat_with_market_analyst(message, CONTEXT)
+
+    backend.calls = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(report(i) for i in range(burst)))
+    burst_ms = (time.perf_counter() - start) * 1000.0
+    burst_calls = backend.calls
+
+    rng = random.Random(5)
+    backend.calls = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        await chat(_phrasing(rng, rng.randrange(distinct)))
+    chat_ms = (time.perf_counter() - start) * 1000.0
+    return [burst_calls, burst_ms, backend.calls, chat_ms / requests]
+
+
+async def _bench(delay: float, burst: int, requests: int, distinct: int) -> None:
+    from app.services.gemini_client import GeminiClient, StubBackend
+
+    uncached = GeminiClient(StubBackend(delay))
+    cached = GeminiClient(StubBackend(delay))
+    rows = [
+        ["uncached", *await _scenario(uncached, True, burst, requests, distinct)],
+        ["cached", *await _scenario(cached, False, burst, requests, distinct)],
+    ]
+    print(f"\n{burst} simultaneous reports, {requests} chats over {distinct} phrasings "
+          f"(stub latency {delay * 1000:.0f} ms)\n")
+    print_table(["client", "report calls", "burst ms", "chat calls", "ms/chat"], rows)
+    print(f"\ncache: {cached.cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--distinct", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(_bench(args.delay, args.burst, args.requests, args.distinct))
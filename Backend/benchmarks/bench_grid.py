@@ -0,0 +1,51 @@
+"""PettingZoo grid search wall time, serial vs worker processes.
+
+Runs the same grid (default: the API's 8 amounts x 7 frequencies x 5 seeds)
+serially and with each `--workers` count, and checks that every parallel
+result is identical to the serial one.
+
+    python -m benchmarks.bench_grid [--seeds 5] [--workers 2 4 0]
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+from benchmarks._common import BACKEND_DIR, print_table
+
+sys.path.insert(0, os.path.abspath(os.path.join(BACKEND_DIR, "..")))
+
+from simulation.config import GridSearchConfig  # noqa: E402
+from simulation.runner import run_grid_search  # noqa: E402
+
+AMOUNTS = [25.0, 50.0, 75.0, 100.0, 125.0, 150.0, 200.0, 300.0]
+FREQUENCIES = [1, 2, 3, 5, 7, 10, 14]
+
+
+def main(seeds: int, worker_counts: list[int]) -> None:
+    base = GridSearchConfig(token_amounts=AMOUNTS, token_frequencies=FREQUENCIES, num_seeds=seeds)
+    runs = len(AMOUNTS) * len(FREQUENCIES) * seeds
+
+    rows, reference, serial_s = [], None, None
+    for workers in [1, *worker_counts]:
+        grid = copy.copy(base)
+        grid.workers = workers
+        start = time.perf_counter()
+        result = run_grid_search(grid)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference, serial_s = result, elapsed
+        label = "serial" if workers == 1 else f"{workers or os.cpu_count()} workers"
+        rows.append([label, elapsed, runs / elapsed, serial_s / elapsed, result == reference])
+
+    print(f"\n{runs} runs on {os.cpu_count()} CPUs\n")
+    print_table(["mode", "seconds", "runs/s", "speedup", "identical"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seeds", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 0])
+    args = parser.parse_args()
+    main(args.seeds, args.workers)
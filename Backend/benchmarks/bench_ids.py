@@ -0,0 +1,88 @@
+"""Index size and join latency with text vs binary id storage.
+
+Loads the GMU dataset (14-day import plus bookings and limit orders, as in
+bench_indexes) once per `MARKET_ID_STORAGE` mode, then reports the on-disk
+size of the tables and of their indexes (from SQLite's `dbstat`) and times
+the join-heavy paths: listing auctions, booking checks and repricing.
+
+Each mode runs in its own process because the storage is fixed when the
+schema is compiled.
+
+    python -m benchmarks.bench_ids [--repeat 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+
+from benchmarks._common import BACKEND_DIR, print_table
+
+MODES = ("text", "binary")
+JOIN_CASES = {
+    "GET /api/auctions/?resource_id": "list auctions",
+    "POST /api/auctions/{id}/bid (booking checks)": "booking checks",
+    "POST /api/simulation/time/advance-hour (repricing)": "repricing",
+}
+
+
+async def _child(repeat: int) -> dict:
+    from benchmarks import bench_indexes
+    from sqlalchemy import text
+
+    from app.database import engine, init_db
+
+    await init_db()
+    await bench_indexes._populate(random.Random(7))
+    async with engine.connect() as conn:
+        sizes = dict((await conn.execute(text(
+            "SELECT CASE WHEN s.name IN (SELECT name FROM sqlite_master WHERE type = 'table') "
+            "THEN 'table' ELSE 'index' END AS kind, SUM(s.pgsize) "
+            "FROM dbstat s WHERE s.name NOT LIKE 'sqlite_%' OR s.name LIKE 'sqlite_autoindex%' GROUP BY kind"
+        ))).all())
+    timings = await bench_indexes._measure(repeat, random.Random(11))
+    await engine.dispose()
+    return {
+        "table_bytes": sizes.get("table", 0),
+        "index_bytes": sizes.get("index", 0),
+        "timings": {label: timings[name] for name, label in JOIN_CASES.items()},
+    }
+
+
+def _run_mode(mode: str, repeat: int) -> dict:
+    env = dict(os.environ, MARKET_ID_STORAGE=mode)
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_ids", "--child", "--repeat", str(repeat)],
+        cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(repeat: int) -> None:
+    results = {mode: _run_mode(mode, repeat) for mode in MODES}
+
+    mib = 1024 * 1024
+    print("\nOn-disk size (MiB)\n")
+    print_table(["storage", "tables", "indexes"], [
+        [mode, r["table_bytes"] / mib, r["index_bytes"] / mib] for mode, r in results.items()
+    ])
+
+    print("\nJoin latency (ms)\n")
+    rows = []
+    for label in JOIN_CASES.values():
+        t, b = results["text"]["timings"][label], results["binary"]["timings"][label]
+        rows.append([label, t["median_ms"], b["median_ms"], t["p95_ms"], b["p95_ms"]])
+    print_table(["path", "median text", "median binary", "p95 text", "p95 binary"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args.repeat))))
+    else:
+        main(args.repeat)
@@ -0,0 +1,103 @@
+"""Chunked, vectorized CSV import vs the row-by-row loop it replaced.
+
+Writes synthetic room-schedule CSVs (more rooms, buildings and weeks than
+the GMU file) and reports rows/sec for learning the demand aggregates and
+for the end-to-end `process_import` into a fresh SQLite database. The row loop is only timed up to --legacy-max rows.
+
+    python -m benchmarks.bench_import [--rows 100000 1000000] [--legacy-max 200000]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks._common import print_table, use_temp_database
+
+use_temp_database("import")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.database import async_session, init_db  # noqa: E402
+from app.services.import_service import learn_import_stats, process_import, read_csv_chunks  # noqa: E402
+
+TIMES = [f"{h:02d}:{m:02d}" for h in range(8, 22) for m in (0, 30)]
+
+
+def _write_csv(rows: int, path: str, rng: np.random.Generator) -> None:
+    rooms = max(1, rows // (len(TIMES) * 120))  # ~120 days of history per room
+    room = np.arange(rows) % rooms
+    slot = np.arange(rows) // rooms
+    pd.DataFrame({
+        "Building": [f"Building {r % 25}" for r in room],
+        "Room Name": [f"Room {r}" for r in room],
+        "Capacity": rng.integers(2, 120, size=rooms)[room],
+        "Date": [(date(2026, 1, 5) + timedelta(days=int(d))).isoformat() for d in slot // len(TIMES)],
+        "Time": [TIMES[t] for t in slot % len(TIMES)],
+        "Status": np.where(rng.random(rows) < 0.4, "Booked", "Available"),
+    }).to_csv(path, index=False)
+
+
+def _legacy_learn(path: str) -> int:
+    """The per-row aggregation `_process_import` did before (whole file in memory)."""
+    df = pd.read_csv(path)
+    unique_resources, schedule_pattern, location_demand, time_demand = {}, set(), {}, {}
+    for _, row in df.iterrows():
+        loc, name = row["Building"], row["Room Name"]
+        date_obj = datetime.strptime(row["Date"], "%Y-%m-%d")
+        time_str = row["Time"]
+        is_booked = str(row["Status"]).lower() == "booked"
+        unique_resources.setdefault((name, loc), {"capacity": int(row["Capacity"])})
+        day_of_week = date_obj.weekday()
+        schedule_pattern.add((day_of_week, time_str))
+        stats = location_demand.setdefault(loc, {"total": 0, "booked": 0})
+        stats["total"] += 1
+        stats["booked"] += is_booked
+        stats = time_demand.setdefault((day_of_week, int(time_str.split(":")[0])), {"total": 0, "booked": 0})
+        stats["total"] += 1
+        stats["booked"] += is_booked
+    return len(df)
+
+
+def _rows_per_sec(fn, rows: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - start)
+
+
+async def _import(path: str) -> dict:
+    async with async_session() as db:
+        for table in ("auctions", "time_slots", "resources"):
+            await db.execute(text(f"DELETE FROM {table}"))
+        result = await process_import(read_csv_chunks(path), db, seed=0)
+        await db.commit()
+    return result
+
+
+async def main(sizes: list[int], legacy_max: int) -> None:
+    await init_db()
+    rng = np.random.default_rng(0)
+    tmp_dir = tempfile.mkdtemp(prefix="market_bench_csv_")
+    rows_out = []
+    for n in sizes:
+        path = os.path.join(tmp_dir, f"rooms_{n}.csv")
+        _write_csv(n, path, rng)
+
+        if n <= legacy_max:
+            rows_out.append([n, "learn: iterrows", _rows_per_sec(lambda: _legacy_learn(path), n)])
+        rows_out.append([n, "learn: chunked groupby", _rows_per_sec(lambda: learn_import_stats(read_csv_chunks(path)), n)])
+
+        result = await _import(path)
+        rows_out.append([n, f"import ({result['time_slots_created']} slots)", result["rows_per_sec"]])
+    print_table(["csv_rows", "path", "rows_per_sec"], rows_out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=200_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.legacy_max))
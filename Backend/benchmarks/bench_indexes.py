@@ -0,0 +1,198 @@
+"""Per-endpoint latency with and without the declared secondary indexes.
+
+Loads the 14-day GMU import into a temporary SQLite database, adds agents,
+bookings and pending limit orders, then times the hot query paths once with
+every secondary index dropped and once with them in place.
+
+    python -m benchmarks.bench_indexes [--repeat 20]
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from benchmarks._common import (
+    gmu_csv_path,
+    print_table,
+    summarize,
+    time_async,
+    use_temp_database,
+)
+
+use_temp_database("indexes")
+
+from fastapi import Response  # noqa: E402
+from sqlalchemy import insert, select, text  # noqa: E402
+
+from app.database import Base, async_session, engine, init_db  # noqa: E402
+from app.models import (  # noqa: E402
+    AdminConfig,
+    Agent,
+    Auction,
+    Bid,
+    BidStatus,
+    Booking,
+    LimitOrder,
+    LimitOrderStatus,
+    Resource,
+    TimeSlot,
+)
+from app.routers import auctions as auctions_router  # noqa: E402
+from app.routers import market as market_router  # noqa: E402
+from app.services.import_service import process_import, read_csv_chunks  # noqa: E402
+from app.services.auction_engine import get_auction_engine  # noqa: E402
+from app.services.booking_service import create_booking_from_bid  # noqa: E402
+from app.services.pricing_service import recalculate_prices  # noqa: E402
+
+NUM_AGENTS = 300
+NUM_BOOKINGS = 3000
+NUM_LIMIT_ORDERS = 6000
+
+
+async def _populate(rng: random.Random) -> None:
+    async with async_session() as db:
+        await process_import(read_csv_chunks(gmu_csv_path()), db)
+        await db.commit()
+
+        slot_ids = (await db.execute(select(TimeSlot.id))).scalars().all()
+        agents = [
+            {"id": str(uuid.uuid4()), "name": f"Bench_{i}", "token_balance": 10_000.0, "max_bookings": 1000}
+            for i in range(NUM_AGENTS)
+        ]
+        await db.execute(insert(Agent), agents)
+
+        booked = rng.sample(slot_ids, NUM_BOOKINGS)
+        bids, bookings = [], []
+        for slot_id in booked:
+            agent_id = rng.choice(agents)["id"]
+            bid_id = str(uuid.uuid4())
+            bids.append({
+                "id": bid_id,
+                "auction_id": str(uuid.uuid4()),
+                "agent_id": agent_id,
+                "amount": 10.0,
+                "status": BidStatus.ACCEPTED,
+            })
+            bookings.append({
+                "id": str(uuid.uuid4()),
+                "time_slot_id": slot_id,
+                "agent_id": agent_id,
+                "bid_id": bid_id,
+            })
+        await db.execute(insert(Bid), bids)
+        await db.execute(insert(Booking), bookings)
+
+        orders = [
+            {
+                "id": str(uuid.uuid4()),
+                "agent_id": rng.choice(agents)["id"],
+                "time_slot_id": rng.choice(slot_ids),
+                "max_price": round(rng.uniform(1.0, 40.0), 2),
+                "status": LimitOrderStatus.PENDING,
+            }
+            for _ in range(NUM_LIMIT_ORDERS)
+        ]
+        await db.execute(insert(LimitOrder), orders)
+        await db.commit()
+
+
+async def _set_indexes(present: bool) -> None:
+    async with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if present:
+                    await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index.name} ON {table.name} "
+                                            f"({', '.join(c.name for c in index.columns)})"))
+                else:
+                    await conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+        await conn.execute(text("ANALYZE"))
+
+
+async def _measure(repeat: int, rng: random.Random) -> dict[str, dict]:
+    async with async_session() as db:
+        resource_ids = (await db.execute(select(Resource.id))).scalars().all()
+        auction_rows = (await db.execute(select(Auction.id).limit(500))).scalars().all()
+        agent_ids = (await db.execute(select(Agent.id).where(Agent.name.like("Bench_%")))).scalars().all()
+        config = await db.scalar(select(AdminConfig).where(AdminConfig.id == 1))
+        sim_date = config.current_simulation_date
+
+    async def list_auctions():
+        async with async_session() as db:
+            await auctions_router.list_auctions(
+                Response(), status="active", resource_id=rng.choice(resource_ids),
+                start_date=sim_date, end_date=sim_date + timedelta(days=3),
+                limit=None, cursor=None, fields=None, db=db,
+            )
+
+    async def resource_schedule():
+        async with async_session() as db:
+            await market_router.get_resource_schedule(
+                rng.choice(resource_ids), start_date=None, end_date=None, limit=None, offset=0, db=db,
+            )
+
+    async def tick():
+        async with async_session() as db:
+            auction = await db.get(Auction, rng.choice(auction_rows))
+            await get_auction_engine(auction.auction_type).tick(auction, db)
+            await db.rollback()
+
+    async def booking_checks():
+        async with async_session() as db:
+            auction = await db.get(Auction, rng.choice(auction_rows))
+            bid = Bid(
+                id=str(uuid.uuid4()), auction_id=auction.id, agent_id=rng.choice(agent_ids),
+                amount=auction.current_price, is_group_bid=False, status=BidStatus.ACCEPTED,
+            )
+            try:
+                await create_booking_from_bid(auction, bid, db)
+            except Exception:
+                pass
+            await db.rollback()
+
+    async def reprice():
+        async with async_session() as db:
+            await recalculate_prices(db, sim_date + timedelta(hours=1))
+            await db.rollback()
+
+    cases = [
+        ("GET /api/auctions/?resource_id", list_auctions, repeat),
+        ("GET /api/market/resources/{id}/schedule", resource_schedule, repeat),
+        ("POST /api/auctions/{id}/tick", tick, repeat),
+        ("POST /api/auctions/{id}/bid (booking checks)", booking_checks, repeat),
+        ("POST /api/simulation/time/advance-hour (repricing)", reprice, max(3, repeat // 5)),
+    ]
+    return {name: summarize(await time_async(fn, repeat=n)) for name, fn, n in cases}
+
+
+async def main(repeat: int) -> None:
+    rng = random.Random(7)
+    await init_db()
+    await _populate(rng)
+
+    await _set_indexes(present=False)
+    before = await _measure(repeat, random.Random(11))
+    await _set_indexes(present=True)
+    after = await _measure(repeat, random.Random(11))
+
+    rows = []
+    for name in before:
+        b, a = before[name], after[name]
+        rows.append([
+            name, b["median_ms"], a["median_ms"], b["p95_ms"], a["p95_ms"],
+            f"{b['median_ms'] / a['median_ms']:.1f}x" if a["median_ms"] else "-",
+        ])
+    print(f"\nGMU 14-day import + {NUM_BOOKINGS} bookings, {NUM_LIMIT_ORDERS} limit orders "
+          f"({datetime.now():%Y-%m-%d %H:%M})\n")
+    print_table(
+        ["endpoint", "median before", "median after", "p95 before", "p95 after", "speedup"],
+        rows,
+    )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,122 @@
+"""Event-loop blocking and failure handling of the Patriot AI client.
+
+Starts a local stub of the Patriot AI endpoint (streams an SSE answer after
+`--delay` seconds, answers 503 to a `--fail-rate` share of requests) and
+fires `--calls` concurrent chat requests from one event loop, first the old
+way (blocking `requests.post` inside the coroutine) and then through the
+async client. A ticker coroutine records how late the loop wakes up while
+they run; that lag is what every other request on the server would see.
+
+    python -m benchmarks.bench_patriot [--calls 16] [--delay 0.2] [--fail-rate 0.2]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks._common import print_table
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.2
+    fail_rate = 0.0
+    rng = random.Random(3)
+    rng_lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay)
+        with self.rng_lock:
+            fail = self.rng.random() < self.fail_rate
+        if fail:
+            body = b"upstream busy"
+            self.send_response(503)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        body = "".join(
+            f"data: {json.dumps({'answer': word + ' '})}\n\n" for word in "stub answer from patriot ai".split()
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def _run(label: str, call, calls: int) -> list:
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append((time.perf_counter() - start - 0.01) * 1000.0)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    answers = await asyncio.gather(*(call(f"question {i}") for i in range(calls)))
+    wall = (time.perf_counter() - start) * 1000.0
+    done.set()
+    await tick
+    ok = sum(1 for a in answers if a.startswith("stub answer"))
+    return [label, wall, max(lags), sorted(lags)[len(lags) // 2], f"{ok}/{calls}"]
+
+
+async def _bench(url: str, calls: int) -> None:
+    import requests
+
+    from app.services.patriot_ai_client import PatriotAIClient, SESSION_ID
+
+    client = PatriotAIClient()
+
+    async def legacy(question):
+        # What the handlers did before: a blocking POST on the event loop, no retries
+        response = requests.post(url, headers=client.headers, json={
+            "question": question, "session": {"sessionIdentifier": SESSION_ID},
+        }, timeout=90)
+        if response.status_code != 200:
+            return ""
+        return "".join(
+            json.loads(line[5:])["answer"] for line in response.text.splitlines() if line.startswith("data:")
+        )
+
+    rows = [await _run("requests (blocking)", legacy, calls)]
+    rows.append(await _run("async client", client.chat, calls))
+    await client.aclose()
+    print(f"\n{calls} concurrent chat calls (ms)\n")
+    print_table(["client", "wall", "max loop lag", "median loop lag", "answered"], rows)
+    print(f"\nasync client retries: {client.retries}")
+
+
+def main(calls: int, delay: float, fail_rate: float) -> None:
+    _StubHandler.delay, _StubHandler.fail_rate = delay, fail_rate
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/chat"
+    os.environ["MARKET_PATRIOT_AI_URL"] = url
+    os.environ.setdefault("MARKET_PATRIOT_AI_RETRY_BACKOFF_SEC", "0.05")
+    try:
+        asyncio.run(_bench(url, calls))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=16)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--fail-rate", type=float, default=0.2)
+    args = parser.parse_args()
+    main(args.calls, args.delay, args.fail_rate)
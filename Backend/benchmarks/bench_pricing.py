@@ -0,0 +1,206 @@
+"""Batch pricing kernel vs the per-slot Python formula it replaced.
+
+Kernel-only timings run on synthetic slot columns at 10k, 100k and 1M
+slots; the end-to-end timings build a SQLite catalog of that many slots and
+time `recalculate_prices` including the bulk UPDATE/INSERT write-back, then
+compare a full pass with an incremental pass one simulated hour later.
+
+    python -m benchmarks.bench_pricing [--sizes 10000 100000 1000000] [--db-sizes 10000 100000]
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from benchmarks._common import print_table, summarize, time_async, time_sync, use_temp_database
+
+use_temp_database("pricing")
+
+import numpy as np  # noqa: E402
+from sqlalchemy import delete, insert, update  # noqa: E402
+
+from app.database import async_session, engine, init_db  # noqa: E402
+from app.models import AdminConfig, Auction, Resource, TimeSlot, TimeSlotStatus  # noqa: E402
+from app.services.pricing_service import (  # noqa: E402
+    price_kernel,
+    recalculate_prices,
+    slot_time_columns,
+    time_popularity_table,
+)
+
+NOW = datetime(2026, 2, 14, 9, 0)
+LOCATIONS = ["Fenwick Library", "Johnson Center", "Horizon Hall", "Exploratory Hall", "Innovation Hall"]
+CONFIG = SimpleNamespace(
+    capacity_weight=1.0, location_weight=1.0, time_of_day_weight=1.0, day_of_week_weight=1.0,
+    global_price_modifier=1.0, lead_time_sensitivity=1.0,
+    current_simulation_date=NOW,
+    location_popularity={loc: round(0.3 + 0.1 * i, 2) for i, loc in enumerate(LOCATIONS)},
+    time_popularity={f"{d}-{h}": round(((d * 24 + h) % 10) / 10, 2) for d in range(5) for h in range(8, 22)},
+)
+
+
+def _synthetic_columns(n: int, rng: np.random.Generator) -> dict:
+    return {
+        "capacity": rng.integers(2, 120, size=n).astype(np.float64),
+        "location": rng.integers(0, len(LOCATIONS), size=n),
+        "start": [NOW + timedelta(minutes=30 * int(k)) for k in rng.integers(0, 48 * 7, size=n)],
+    }
+
+
+def _scalar_prices(cols: dict, noise: np.ndarray) -> list[float]:
+    """The per-slot formula recalculate_prices used before the kernel."""
+    loc_pop, time_pop = CONFIG.location_popularity, CONFIG.time_popularity
+    out = []
+    for i, start in enumerate(cols["start"]):
+        dow, hour = start.weekday(), start.hour
+        loc_score = float(loc_pop.get(LOCATIONS[cols["location"][i]], 0.5))
+        time_key = f"{dow}-{hour}"
+        hist_time_pop = float(time_pop.get(time_key, 0.5))
+        if time_key not in time_pop:
+            hour_score = max(0.2, 1.0 - (abs(hour - 14) / 10.0))
+        else:
+            hour_score = hist_time_pop
+        cap_score = min(cols["capacity"][i], 100) / 100.0
+        days_out = max(0, (start - NOW).total_seconds() / 86400.0)
+        lead_score = 1.0 + (CONFIG.lead_time_sensitivity * (1.1 - min(1.0, days_out / 30.0)))
+        base_demand = (
+            (cap_score * CONFIG.capacity_weight * 0.5)
+            + (loc_score * CONFIG.location_weight * 2.0)
+            + (hour_score * CONFIG.time_of_day_weight * 2.5)
+            + (hist_time_pop * CONFIG.day_of_week_weight * 1.5)
+        ) / 5.0
+        price = 15.0 * CONFIG.global_price_modifier * lead_score * base_demand * (1.0 + noise[i])
+        out.append(max(5.0, min(price, 500.0)))
+    return out
+
+
+def _kernel_prices(cols: dict, seed: int) -> np.ndarray:
+    loc_scores = np.array([CONFIG.location_popularity[loc] for loc in LOCATIONS])
+    dow, hour, days_out = slot_time_columns(cols["start"], NOW)
+    return price_kernel(
+        capacity=cols["capacity"],
+        location_score=loc_scores[cols["location"]],
+        day_of_week=dow,
+        hour=hour,
+        days_out=days_out,
+        time_pop_table=time_popularity_table(CONFIG.time_popularity),
+        config=CONFIG,
+        rng=np.random.default_rng(seed),
+    )
+
+
+def bench_kernel(sizes: list[int]) -> None:
+    rows = []
+    for n in sizes:
+        cols = _synthetic_columns(n, np.random.default_rng(0))
+        noise = np.random.default_rng(1).uniform(-0.05, 0.05, size=n)
+
+        # Same seed -> same noise draws, so both paths must agree exactly
+        kernel = _kernel_prices(cols, seed=1)
+        scalar = _scalar_prices(cols, noise)
+        assert np.allclose(kernel, scalar, rtol=0, atol=1e-9), "kernel diverged from scalar formula"
+        assert np.array_equal(kernel, _kernel_prices(cols, seed=1)), "seeded runs must be identical"
+
+        repeat = 5 if n <= 100_000 else 2
+        scalar_t = summarize(time_sync(lambda: _scalar_prices(cols, noise), repeat=repeat, warmup=0))
+        kernel_t = summarize(time_sync(lambda: _kernel_prices(cols, seed=1), repeat=repeat))
+        rows.append([
+            f"{n:,}", scalar_t["median_ms"], kernel_t["median_ms"],
+            f"{scalar_t['median_ms'] / kernel_t['median_ms']:.0f}x",
+        ])
+    print("\nPricing kernel (compute only, includes datetime -> column conversion)\n")
+    print_table(["slots", "per-slot python ms", "numpy kernel ms", "speedup"], rows)
+
+
+async def _build_catalog(n: int) -> None:
+    async with async_session() as db:
+        for model in (Auction, TimeSlot, Resource, AdminConfig):
+            await db.execute(delete(model))
+        db.add(AdminConfig(
+            id=1, current_simulation_date=NOW,
+            location_popularity=CONFIG.location_popularity, time_popularity=CONFIG.time_popularity,
+        ))
+        rooms_per_location = 20
+        resources = [
+            {"id": str(uuid.uuid4()), "name": f"{loc} {k}", "location": loc,
+             "capacity": random.randint(2, 120), "resource_type": "room"}
+            for loc in LOCATIONS for k in range(rooms_per_location)
+        ]
+        await db.execute(insert(Resource), resources)
+
+        # Spread n slots over the 7-day window, all already in auction
+        slots, auctions = [], []
+        for i in range(n):
+            start = NOW + timedelta(minutes=30 * ((i // len(resources)) % (48 * 7)))
+            slot_id = str(uuid.uuid4())
+            slots.append({"id": slot_id, "resource_id": resources[i % len(resources)]["id"],
+                          "start_time": start, "end_time": start + timedelta(minutes=30),
+                          "status": TimeSlotStatus.IN_AUCTION})
+            if i % 10:  # leave every tenth slot without an auction to exercise the INSERT
+                auctions.append({"id": str(uuid.uuid4()), "time_slot_id": slot_id, "start_price": 10.0,
+                                 "current_price": 10.0, "min_price": 1.0, "price_step": 1.0,
+                                 "tick_interval_sec": 10.0})
+        for i in range(0, n, 20_000):
+            await db.execute(insert(TimeSlot), slots[i:i + 20_000])
+        for i in range(0, len(auctions), 20_000):
+            await db.execute(insert(Auction), auctions[i:i + 20_000])
+        await db.commit()
+
+
+async def bench_db(sizes: list[int]) -> None:
+    await init_db()
+    rows = []
+    for n in sizes:
+        await _build_catalog(n)
+
+        async def run():
+            async with async_session() as db:
+                await recalculate_prices(db, NOW, seed=42)
+                await db.rollback()
+
+        t = summarize(await time_async(run, repeat=3, warmup=1))
+        rows.append([f"{n:,}", t["median_ms"], f"{n / (t['median_ms'] / 1000):,.0f}"])
+    print("\nrecalculate_prices end to end (SQLite, read + bulk write-back)\n")
+    print_table(["slots", "median ms", "slots/sec"], rows)
+
+    rows = []
+    for n in sizes:
+        await _build_catalog(n)
+        async with async_session() as db:
+            await recalculate_prices(db, NOW, seed=42)
+            await db.execute(update(AdminConfig).values(current_simulation_date=NOW + timedelta(hours=1)))
+            await db.commit()
+
+        repriced = []
+
+        async def full():
+            async with async_session() as db:
+                await recalculate_prices(db, NOW + timedelta(hours=1), seed=42)
+                await db.rollback()
+
+        async def incremental():
+            async with async_session() as db:
+                repriced.append(await recalculate_prices(db, NOW + timedelta(hours=1), seed=42, incremental=True))
+                await db.rollback()
+
+        full_t = summarize(await time_async(full, repeat=3, warmup=1))
+        inc_t = summarize(await time_async(incremental, repeat=3, warmup=1))
+        rows.append([
+            f"{n:,}", f"{repriced[-1]:,}", full_t["median_ms"], inc_t["median_ms"],
+            f"{full_t['median_ms'] / inc_t['median_ms']:.0f}x",
+        ])
+    print("\nOne simulated hour later: full window vs incremental (stale slots only)\n")
+    print_table(["slots", "repriced", "full ms", "incremental ms", "speedup"], rows)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--db-sizes", type=int, nargs="*", default=[10_000, 100_000])
+    args = parser.parse_args()
+    bench_kernel(args.sizes)
+    if args.db_sizes:
+        asyncio.run(bench_db(args.db_sizes))
@@ -0,0 +1,129 @@
+"""Set-based simulation reset vs the ORM loop it replaced.
+
+Builds a catalog of N slots (each with an auction, a price tick and some
+bookings and limit orders) and times `POST /api/simulation/reset` against
+the previous implementation, which loaded every slot and agent as an ORM
+object and built one auction dict per slot in Python.
+
+    python -m benchmarks.bench_reset [--sizes 10000 100000] [--repeat 3]
+"""
+import argparse
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+from benchmarks._common import print_table, summarize, time_async, use_temp_database
+
+use_temp_database("reset")
+
+from sqlalchemy import delete, insert, select, text  # noqa: E402
+
+from app.database import async_session, init_db  # noqa: E402
+from app.models import (  # noqa: E402
+    AdminConfig,
+    Agent,
+    AgentPreference,
+    Auction,
+    AuctionStatus,
+    Bid,
+    Booking,
+    GroupBidMember,
+    LimitOrder,
+    PriceHistory,
+    Resource,
+    TimeSlot,
+    TimeSlotStatus,
+    Transaction,
+)
+from app.routers.simulation import reset_simulation  # noqa: E402
+
+NUM_AGENTS = 500
+ROOMS = 100
+START = datetime(2026, 2, 15, 9, 0)
+
+
+async def _populate(n: int) -> None:
+    async with async_session() as db:
+        for table in ("limit_orders", "bookings", "bids", "price_history", "auctions", "time_slots", "resources", "agents", "admin_config"):
+            await db.execute(text(f"DELETE FROM {table}"))
+        db.add(AdminConfig(id=1, current_simulation_date=START))
+        resources = [{"id": str(uuid.uuid4()), "name": f"Room {i}", "location": f"Building {i % 10}",
+                      "capacity": 10 + i % 50, "resource_type": "room"} for i in range(ROOMS)]
+        await db.execute(insert(Resource), resources)
+        agents = [{"id": str(uuid.uuid4()), "name": f"Bench_{i}", "token_balance": 37.0, "max_bookings": 10}
+                  for i in range(NUM_AGENTS)]
+        await db.execute(insert(Agent), agents)
+
+        slots, auctions = [], []
+        for i in range(n):
+            start = START + timedelta(minutes=30 * (i // ROOMS))
+            slot_id = str(uuid.uuid4())
+            slots.append({"id": slot_id, "resource_id": resources[i % ROOMS]["id"], "start_time": start,
+                          "end_time": start + timedelta(minutes=30), "status": TimeSlotStatus.BOOKED})
+            auctions.append({"id": str(uuid.uuid4()), "time_slot_id": slot_id, "auction_type": "dutch",
+                             "start_price": 20.0, "current_price": 12.0, "min_price": 5.0, "price_step": 1.0,
+                             "tick_interval_sec": 10.0, "status": AuctionStatus.COMPLETED})
+        for i in range(0, n, 5000):
+            await db.execute(insert(TimeSlot), slots[i:i + 5000])
+            await db.execute(insert(Auction), auctions[i:i + 5000])
+        await db.execute(insert(PriceHistory), [
+            {"id": str(uuid.uuid4()), "auction_id": a["id"], "time_slot_id": a["time_slot_id"], "price": 12.0}
+            for a in auctions[: n // 2]
+        ])
+        await db.commit()
+
+
+async def _legacy_reset() -> None:
+    """The ORM-object reset that /api/simulation/reset did before."""
+    async with async_session() as db:
+        config = (await db.execute(select(AdminConfig))).scalar_one_or_none()
+        default_balance = config.token_starting_amount if config else 100.0
+        config.current_simulation_date = START
+        for model in (GroupBidMember, LimitOrder, Booking, PriceHistory, Transaction, Bid, Auction, AgentPreference):
+            await db.execute(delete(model))
+        for agent in (await db.execute(select(Agent))).scalars().all():
+            agent.token_balance = default_balance
+        auctions = []
+        for slot in (await db.execute(select(TimeSlot))).scalars().all():
+            slot.status = TimeSlotStatus.IN_AUCTION
+            slot.priced_version = None
+            auctions.append({
+                "id": str(uuid.uuid4()), "time_slot_id": slot.id, "auction_type": "dutch",
+                "start_price": config.dutch_start_price, "current_price": config.dutch_start_price,
+                "min_price": config.dutch_min_price, "price_step": config.dutch_price_step,
+                "tick_interval_sec": config.dutch_tick_interval_sec, "created_at": START,
+                "status": AuctionStatus.ACTIVE,
+            })
+        if auctions:
+            await db.execute(insert(Auction), auctions)
+        await db.commit()
+
+
+async def _set_based_reset() -> None:
+    async with async_session() as db:
+        await reset_simulation(db)
+
+
+async def _auction_count() -> int:
+    async with async_session() as db:
+        return (await db.execute(text("SELECT COUNT(*) FROM auctions WHERE status = 'ACTIVE'"))).scalar()
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    await init_db()
+    rows = []
+    for n in sizes:
+        await _populate(n)
+        for name, fn in (("orm loop", _legacy_reset), ("set-based", _set_based_reset)):
+            stats = summarize(await time_async(fn, repeat=repeat, warmup=1))
+            assert await _auction_count() == n
+            rows.append([n, name, stats["median_ms"], stats["p95_ms"]])
+    print_table(["slots", "reset", "median_ms", "p95_ms"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
@@ -0,0 +1,56 @@
+"""Tick loop run time of the pure Python simulation engine in
+high-utilization markets.
+
+These are the markets where most of the loop used to be wasted: rooms sell
+out early in the day, many agents cannot afford or do not want anything
+at the current price, and the rest keep scanning sold auctions. Reports
+the median time of one 14-day run over `--seeds` seeds, and the mean
+utilization and stability score as a sanity check on the outcome.
+
+    python -m benchmarks.bench_sim_loop [--seeds 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from benchmarks._common import BACKEND_DIR, print_table
+
+sys.path.insert(0, os.path.abspath(os.path.join(BACKEND_DIR, "..")))
+
+from simulation.config import SimulationConfig  # noqa: E402
+from simulation.environment import run_environment_fast  # noqa: E402
+from simulation.metrics import compute_metrics  # noqa: E402
+
+SCENARIOS = {
+    "default (30 agents x 5 rooms)": dict(num_agents=30, num_rooms=5),
+    "crowded (300 x 10)": dict(num_agents=300, num_rooms=10),
+    "crowded (1000 x 20)": dict(num_agents=1000, num_rooms=20),
+    "low tokens (300 x 30, 20/week)": dict(num_agents=300, num_rooms=30, token_amount=20.0),
+    "exam weeks (300 x 30, days 0-14)": dict(num_agents=300, num_rooms=30, high_demand_days=[(0, 14)]),
+}
+
+
+def main(seeds: int) -> None:
+    rows = []
+    for label, params in SCENARIOS.items():
+        times, utilization, scores = [], [], []
+        for seed in range(seeds):
+            config = SimulationConfig(seed=seed, **params)
+            start = time.perf_counter()
+            state = run_environment_fast(config)
+            times.append((time.perf_counter() - start) * 1000.0)
+            metrics = compute_metrics(state, config.num_agents)
+            utilization.append(metrics.utilization_rate)
+            scores.append(metrics.stability_score)
+        rows.append([label, statistics.median(times), statistics.mean(utilization), statistics.mean(scores)])
+    print(f"\nrun_environment_fast, {seeds} seeds\n")
+    print_table(["scenario", "median ms/run", "utilization", "stability score"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.seeds)
@@ -0,0 +1,149 @@
+"""Per-auction Dutch ticks vs `DutchAuctionEngine.tick_batch`.
+
+Builds N active Dutch auctions (one per slot) with pending limit orders on a
+fraction of them, then times one simulation round ticked auction by auction
+and in one batch. Both paths start from the same database file and must end
+in the same state: prices, history row count and the set of filled orders.
+
+    python -m benchmarks.bench_tick [--sizes 1000 10000 30000]
+"""
+import argparse
+import asyncio
+import random
+import shutil
+import uuid
+from datetime import datetime, timedelta
+
+from benchmarks._common import print_table, use_temp_database
+
+DB_PATH = use_temp_database("tick")
+
+from sqlalchemy import delete, func, insert, select  # noqa: E402
+
+from app.database import async_session, engine, init_db  # noqa: E402
+from app.models import (  # noqa: E402
+    Agent,
+    Auction,
+    AuctionStatus,
+    Bid,
+    Booking,
+    LimitOrder,
+    LimitOrderStatus,
+    PriceHistory,
+    Resource,
+    TimeSlot,
+    TimeSlotStatus,
+    Transaction,
+)
+from app.services.auction_engine import get_auction_engine  # noqa: E402
+from app.services.order_book import order_book  # noqa: E402
+
+START = datetime(2026, 2, 16, 9, 0)
+NUM_AGENTS = 200
+ORDER_FRACTION = 0.05
+
+
+async def _build(n: int, rng: random.Random) -> None:
+    async with async_session() as db:
+        for model in (Transaction, Booking, LimitOrder, Bid, PriceHistory, Auction, TimeSlot, Resource, Agent):
+            await db.execute(delete(model))
+
+        resources = [
+            {"id": str(uuid.uuid4()), "name": f"Room {k}", "location": "Bench Hall",
+             "capacity": 4, "resource_type": "room"}
+            for k in range(100)
+        ]
+        await db.execute(insert(Resource), resources)
+        agents = [
+            {"id": str(uuid.uuid4()), "name": f"Bench_{i}", "token_balance": 500.0, "max_bookings": 1000}
+            for i in range(NUM_AGENTS)
+        ]
+        await db.execute(insert(Agent), agents)
+
+        slots, auctions, orders = [], [], []
+        for i in range(n):
+            slot_id = str(uuid.uuid4())
+            start = START + timedelta(minutes=30 * (i // len(resources)))
+            slots.append({"id": slot_id, "resource_id": resources[i % len(resources)]["id"],
+                          "start_time": start, "end_time": start + timedelta(minutes=30),
+                          "status": TimeSlotStatus.IN_AUCTION})
+            price = round(rng.uniform(10, 40), 2)
+            auctions.append({"id": str(uuid.uuid4()), "time_slot_id": slot_id, "auction_type": "dutch",
+                             "status": AuctionStatus.ACTIVE, "start_price": price * 1.6,
+                             "current_price": price, "min_price": rng.choice([price - 5, price]),
+                             "price_step": 2.0, "tick_interval_sec": 10.0})
+            if rng.random() < ORDER_FRACTION:
+                for k in range(rng.randint(1, 3)):
+                    orders.append({"id": str(uuid.uuid4()), "agent_id": rng.choice(agents)["id"],
+                                   "time_slot_id": slot_id, "max_price": round(price + rng.uniform(-6, 4), 2),
+                                   "status": LimitOrderStatus.PENDING,
+                                   "created_at": START - timedelta(seconds=len(orders))})
+        for table, rows in ((TimeSlot, slots), (Auction, auctions), (LimitOrder, orders)):
+            for i in range(0, len(rows), 10_000):
+                await db.execute(insert(table), rows[i:i + 10_000])
+        await db.commit()
+
+
+async def _per_auction_round() -> None:
+    async with async_session() as db:
+        # Same auction order as the batch so order-dependent fills line up
+        active = (await db.execute(
+            select(Auction).where(Auction.status == AuctionStatus.ACTIVE).order_by(Auction.id)
+        )).scalars().all()
+        for auction in active:
+            await get_auction_engine(auction.auction_type).tick(auction, db)
+        await db.commit()
+
+
+async def _batch_round() -> None:
+    async with async_session() as db:
+        await get_auction_engine("dutch").tick_batch(db, "dutch")
+        await db.commit()
+
+
+async def _snapshot() -> tuple:
+    async with async_session() as db:
+        prices = (await db.execute(select(Auction.id, Auction.current_price).order_by(Auction.id))).all()
+        history = await db.scalar(select(func.count()).select_from(PriceHistory))
+        filled = (await db.execute(
+            select(LimitOrder.id).where(LimitOrder.status == LimitOrderStatus.EXECUTED).order_by(LimitOrder.id)
+        )).scalars().all()
+        balance = await db.scalar(select(func.sum(Agent.token_balance)))
+    return prices, history, filled, round(balance, 6)
+
+
+async def _timed_round(fn, template: str) -> tuple[float, tuple]:
+    await engine.dispose()
+    shutil.copyfile(template, DB_PATH)
+    order_book.clear()  # The file changed under the process-wide book
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await fn()
+    elapsed = (loop.time() - start) * 1000.0
+    return elapsed, await _snapshot()
+
+
+async def main(sizes: list[int]) -> None:
+    await init_db()
+    template = DB_PATH + ".template"
+    rows = []
+    for n in sizes:
+        await _build(n, random.Random(n))
+        await engine.dispose()
+        shutil.copyfile(DB_PATH, template)
+
+        loop_ms, loop_state = await _timed_round(_per_auction_round, template)
+        batch_ms, batch_state = await _timed_round(_batch_round, template)
+        assert loop_state == batch_state, "batch tick diverged from per-auction ticks"
+
+        rows.append([f"{n:,}", f"{len(loop_state[2]):,}", loop_ms, batch_ms, f"{loop_ms / batch_ms:.0f}x"])
+    print("\nOne simulation round of Dutch ticks (SQLite, includes commit)\n")
+    print_table(["auctions", "orders filled", "per-auction ms", "batch ms", "speedup"], rows)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 30_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
@@ -0,0 +1,89 @@
+"""Simulation engine run time, pure Python reference vs NumPy, and an
+equivalence check between the two.
+
+Times one run of each engine per market size (the reference engine only up
+to `--reference-limit` agents x rooms; it grows with agents x auctions x
+ticks). With `--check`, runs both engines over `--seeds` seeds on small
+and medium markets and compares the mean of every metric: the difference
+must stay within four standard errors. Exits non-zero if any metric fails.
+
+    python -m benchmarks.bench_vectorized [--reference-limit 10000]
+    python -m benchmarks.bench_vectorized --check [--seeds 30]
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+from benchmarks._common import BACKEND_DIR, print_table
+
+sys.path.insert(0, os.path.abspath(os.path.join(BACKEND_DIR, "..")))
+
+from simulation.config import SimulationConfig  # noqa: E402
+from simulation.environment import run_environment_fast  # noqa: E402
+from simulation.metrics import compute_metrics  # noqa: E402
+from simulation.vectorized import run_environment_vectorized  # noqa: E402
+
+SIZES = [(30, 5), (300, 30), (1000, 100), (10000, 500)]
+CHECK_SIZES = [(30, 5), (200, 20)]
+METRICS = [
+    "stability_score", "avg_satisfaction", "preference_match_rate", "avg_consumer_surplus",
+    "access_rate", "utilization_rate", "price_volatility", "gini_coefficient", "supply_demand_ratio",
+]
+
+
+def _timed(fn, config):
+    start = time.perf_counter()
+    state = fn(config)
+    return time.perf_counter() - start, compute_metrics(state, config.num_agents)
+
+
+def bench(reference_limit: int) -> None:
+    rows = []
+    for agents, rooms in SIZES:
+        config = SimulationConfig(num_agents=agents, num_rooms=rooms)
+        vec_s, vec_m = _timed(run_environment_vectorized, config)
+        if agents * rooms <= reference_limit:
+            ref_s, ref_m = _timed(run_environment_fast, config)
+            rows.append([f"{agents} x {rooms}", ref_s, vec_s, ref_s / vec_s,
+                         ref_m.stability_score, vec_m.stability_score])
+        else:
+            rows.append([f"{agents} x {rooms}", "-", vec_s, "-", "-", vec_m.stability_score])
+    print("\nOne 14-day run (seconds)\n")
+    print_table(["agents x rooms", "reference", "vectorized", "speedup", "score ref", "score vec"], rows)
+
+
+def check(seeds: int) -> bool:
+    ok = True
+    for agents, rooms in CHECK_SIZES:
+        runs = {"ref": [], "vec": []}
+        for seed in range(seeds):
+            config = SimulationConfig(num_agents=agents, num_rooms=rooms, seed=seed)
+            runs["ref"].append(compute_metrics(run_environment_fast(config), agents))
+            runs["vec"].append(compute_metrics(run_environment_vectorized(config), agents))
+
+        rows = []
+        for name in METRICS:
+            ref = [getattr(m, name) for m in runs["ref"]]
+            vec = [getattr(m, name) for m in runs["vec"]]
+            diff = statistics.mean(vec) - statistics.mean(ref)
+            se = math.sqrt((statistics.variance(ref) + statistics.variance(vec)) / seeds)
+            passed = abs(diff) <= 4 * se + 1e-9
+            ok &= passed
+            rows.append([name, statistics.mean(ref), statistics.mean(vec), diff, se, "ok" if passed else "FAIL"])
+        print(f"\n{agents} agents x {rooms} rooms, {seeds} seeds\n")
+        print_table(["metric", "mean ref", "mean vec", "diff", "std err", ""], rows)
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reference-limit", type=int, default=10000)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--seeds", type=int, default=30)
+    args = parser.parse_args()
+    if args.check:
+        sys.exit(0 if check(args.seeds) else 1)
+    bench(args.reference_limit)
@@ -27,6 +27,33 @@ if "split_status" not in bcols:
     c.execute('ALTER TABLE bookings ADD COLUMN split_status TEXT DEFAULT "none"')
     print("  Added: split_status")
 
+# Check and add missing time_slots columns (incremental repricing)
+tcols = [r[1] for r in c.execute("PRAGMA table_info(time_slots)").fetchall()]
+print(f"Current time_slots columns: {tcols}")
+
+if "priced_version" not in tcols:
+    c.execute("ALTER TABLE time_slots ADD COLUMN priced_version INTEGER")
+    print("  Added: priced_version")
+if "priced_lead_bucket" not in tcols:
+    c.execute("ALTER TABLE time_slots ADD COLUMN priced_lead_bucket INTEGER")
+    print("  Added: priced_lead_bucket")
+
+# Check and add missing admin_config columns (config cache version)
+acols = [r[1] for r in c.execute("PRAGMA table_info(admin_config)").fetchall()]
+print(f"Current admin_config columns: {acols}")
+
+if "version" not in acols:
+    c.execute("ALTER TABLE admin_config ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+    print("  Added: version")
+
+# Check and add missing auctions columns (clock tick guard)
+aucols = [r[1] for r in c.execute("PRAGMA table_info(auctions)").fetchall()]
+print(f"Current auctions columns: {aucols}")
+
+if "last_ticked_at" not in aucols:
+    c.execute("ALTER TABLE auctions ADD COLUMN last_ticked_at FLOAT")
+    print("  Added: last_ticked_at")
+
 conn.commit()
 conn.close()
 print("Migration complete!")
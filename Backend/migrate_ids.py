@@ -0,0 +1,100 @@
+"""Convert an existing SQLite database between text and binary id storage.
+
+Rebuilds the database with the current schema, with every primary and
+foreign key column (the `IdType` columns) stored as the target form:
+16-byte binary UUIDs or 36-character strings. Other columns are copied
+as-is. Stop the server first; the original file is kept as `<db>.bak`.
+Re-running against a database that is already converted is a no-op copy.
+
+    python migrate_ids.py [path/to/market.db] [--to binary|text]
+
+Then run the server with `MARKET_ID_STORAGE` set to the same value.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import uuid
+
+parser = argparse.ArgumentParser()
+parser.add_argument("db_path", nargs="?", default="market.db")
+parser.add_argument("--to", choices=["binary", "text"], default="binary")
+args = parser.parse_args()
+
+# The schema is built for the target storage, so pick it before importing the models
+os.environ["MARKET_ID_STORAGE"] = args.to
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.utils import IdType  # noqa: E402
+import app.models  # noqa: E402,F401 — register all models with SQLAlchemy
+
+BATCH_ROWS = 10_000
+
+
+def convert(value):
+    if value is None:
+        return None
+    if args.to == "binary":
+        return value if isinstance(value, bytes) else uuid.UUID(value).bytes
+    return str(uuid.UUID(bytes=value)) if isinstance(value, bytes) else value
+
+
+if not os.path.exists(args.db_path):
+    sys.exit(f"No database at {args.db_path}")
+
+tmp_path = args.db_path + ".ids.tmp"
+if os.path.exists(tmp_path):
+    os.remove(tmp_path)
+target_engine = create_engine(f"sqlite:///{tmp_path}")
+Base.metadata.create_all(target_engine)
+target_engine.dispose()
+
+source = sqlite3.connect(args.db_path, timeout=30)
+source.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+target = sqlite3.connect(tmp_path)
+target.execute("PRAGMA foreign_keys = OFF")
+try:
+    existing_tables = {row[0] for row in source.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            print(f"Skipping {table.name}: table does not exist yet")
+            continue
+        source_columns = [row[1] for row in source.execute(f"PRAGMA table_info({table.name})")]
+        dropped = [name for name in source_columns if name not in table.c]
+        if dropped:
+            print(f"  {table.name}: not copying unknown columns {', '.join(dropped)}")
+        columns = [name for name in source_columns if name in table.c]
+        id_positions = [i for i, name in enumerate(columns) if isinstance(table.c[name].type, IdType)]
+
+        column_list = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        rows_in = source.execute(f"SELECT {column_list} FROM {table.name}")
+        copied = 0
+        while batch := rows_in.fetchmany(BATCH_ROWS):
+            if id_positions:
+                batch = [list(row) for row in batch]
+                for row in batch:
+                    for i in id_positions:
+                        row[i] = convert(row[i])
+            target.executemany(f"INSERT INTO {table.name} ({column_list}) VALUES ({placeholders})", batch)
+            copied += len(batch)
+        print(f"  {table.name}: {copied} rows, {len(id_positions)} id columns")
+    target.commit()
+    target.execute("ANALYZE")
+    target.commit()
+except (ValueError, sqlite3.Error) as e:
+    target.close()
+    source.close()
+    os.remove(tmp_path)
+    sys.exit(f"Migration failed, database left unchanged: {e}")
+target.close()
+source.close()
+
+os.replace(args.db_path, args.db_path + ".bak")
+for suffix in ("-wal", "-shm"):
+    if os.path.exists(args.db_path + suffix):
+        os.remove(args.db_path + suffix)
+os.replace(tmp_path, args.db_path)
+print(f"Migration complete! Ids are now {args.to}; the original is at {args.db_path}.bak")
@@ -0,0 +1,37 @@
+"""Add the secondary indexes declared on the models to an existing database.
+
+`create_all` only builds indexes for tables it creates, so databases made
+before the indexes were declared need this once. Safe to re-run: indexes
+that already exist are skipped.
+
+    python migrate_indexes.py [path/to/market.db]
+"""
+import sys
+
+from sqlalchemy import create_engine, inspect
+
+from app.database import Base
+import app.models  # noqa: F401 — register all models with SQLAlchemy
+
+db_path = sys.argv[1] if len(sys.argv) > 1 else "market.db"
+engine = create_engine(f"sqlite:///{db_path}", connect_args={"timeout": 30})
+
+with engine.begin() as conn:
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            print(f"Skipping {table.name}: table does not exist yet")
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name in existing:
+                continue
+            index.create(conn)
+            print(f"  Added: {index.name}")
+
+    # Refresh planner statistics so the new indexes are picked up
+    conn.exec_driver_sql("ANALYZE")
+
+engine.dispose()
+print("Migration complete!")
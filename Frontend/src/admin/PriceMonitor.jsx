@@ -29,13 +29,33 @@ export default function PriceMonitor() {
   }, [selectedResource?.id])
 
   useEffect(() => {
-    if (selectedAuction) {
-      api.getPriceHistory(selectedAuction.id)
+    if (!selectedAuction) {
+      setPriceHistory([])
+      return
+    }
+    const auctionId = selectedAuction.id
+    const fetchHistory = () => {
+      api.getPriceHistory(auctionId)
         .then(setPriceHistory)
         .catch(() => setPriceHistory([]))
-    } else {
-      setPriceHistory([])
     }
+    fetchHistory()
+
+    // Append ticks as they are pushed; re-fetch after a reconnect or missed events
+    let reconnecting = false
+    const stream = api.streamMarket({ auction_id: auctionId })
+    stream.addEventListener('open', () => {
+      if (reconnecting) fetchHistory()
+      reconnecting = true
+    })
+    stream.addEventListener('dropped', fetchHistory)
+    stream.addEventListener('snapshot_restored', fetchHistory)
+    stream.addEventListener('price', (e) => {
+      const { price } = JSON.parse(e.data)
+      setPriceHistory((prev) => [...prev, { auction_id: auctionId, price, recorded_at: new Date().toISOString() }])
+      setSelectedAuction((a) => (a && a.id === auctionId ? { ...a, current_price: price } : a))
+    })
+    return () => stream.close()
   }, [selectedAuction?.id])
 
   const formatDateTime = (isoStr) => {
@@ -65,8 +65,16 @@ const api = {
   // Market
   getMarketState: () => request('/market/state'),
   getMarketPriceHistory: (limit = 100) => request(`/market/price-history?limit=${limit}`),
-  getResourceSchedule: (id) => request(`/market/resources/${id}/schedule`),
+  getResourceSchedule: (id, params = {}) => {
+    const qs = new URLSearchParams(params).toString();
+    return request(`/market/resources/${id}/schedule${qs ? `?${qs}` : ''}`);
+  },
   getResourcePriceHistory: (id) => request(`/resources/${id}/price-history`),
+  // Server-sent events (price, booking, clock, ...); filter with { resource_id, auction_id }
+  streamMarket: (params = {}) => {
+    const qs = new URLSearchParams(params).toString();
+    return new EventSource(`${BASE}/market/stream${qs ? `?${qs}` : ''}`);
+  },
 
   // Admin
   getConfig: () => request('/admin/config'),
@@ -91,6 +99,18 @@ const api = {
   // Admin Resources
   importResources: (formData) => request('/admin/import-resources', { method: 'POST', body: formData }),
   resetAndLoadDefaults: () => request('/admin/reset-and-load-defaults', { method: 'POST' }),
+  // Pass background=true to get an import job back instead of waiting
+  importResourcesInBackground: (formData) => request('/admin/import-resources?background=true', { method: 'POST', body: formData }),
+  getImportJobs: () => request('/admin/import-jobs'),
+  getImportJob: (jobId) => request(`/admin/import-jobs/${jobId}`),
+  cancelImportJob: (jobId) => request(`/admin/import-jobs/${jobId}/cancel`, { method: 'POST' }),
+  resumeImportJob: (jobId) => request(`/admin/import-jobs/${jobId}/resume`, { method: 'POST' }),
+
+  // Database snapshots (SQLite)
+  getSnapshots: () => request('/admin/snapshots'),
+  createSnapshot: (name, overwrite = false) => request('/admin/snapshots', { method: 'POST', body: JSON.stringify({ name, overwrite }) }),
+  restoreSnapshot: (name) => request(`/admin/snapshots/${encodeURIComponent(name)}/restore`, { method: 'POST' }),
+  deleteSnapshot: (name) => request(`/admin/snapshots/${encodeURIComponent(name)}`, { method: 'DELETE' }),
 
   // God Mode (ML Models)
   autoPopulateMarket: (data) => request('/god/auto-populate', { method: 'POST', body: JSON.stringify(data) }),
@@ -44,11 +44,16 @@ export default function Layout() {
       }
     }
     window.addEventListener('simulation-reset', handleUpdate)
-    // Poll every 5s just in case
-    const interval = setInterval(fetchDate, 5000)
+    // Clock changes are pushed by the server; re-sync on (re)connect
+    const stream = api.streamMarket()
+    stream.addEventListener('open', fetchDate)
+    stream.addEventListener('snapshot_restored', fetchDate)
+    stream.addEventListener('clock', (e) => {
+      setSimDate(new Date(JSON.parse(e.data).current_simulation_date))
+    })
     return () => {
       window.removeEventListener('simulation-reset', handleUpdate)
-      clearInterval(interval)
+      stream.close()
     }
   }, [])
 
@@ -23,7 +23,10 @@ def generate_agents(config: SimulationConfig, rng: random.Random) -> List[SimAge
         count = round(profile.share * config.num_agents)
         for _ in range(count):
             preferred_time = _weighted_choice(list(range(len(time_weights))), time_weights, rng)
-            preferred_location = _weighted_choice(list(range(num_locations)), loc_weights, rng)
+            # No rooms, nothing to prefer (and no draw): such markets have no auctions
+            preferred_location = (
+                _weighted_choice(list(range(num_locations)), loc_weights, rng) if num_locations else 0
+            )
             budget_sensitivity = rng.uniform(*profile.budget_sensitivity_range)
             urgency = rng.uniform(*profile.urgency_range)
             base_value = rng.uniform(*profile.base_value_range)
@@ -41,8 +44,9 @@ def generate_agents(config: SimulationConfig, rng: random.Random) -> List[SimAge
     return agents
 
 
-def compute_utility(agent: SimAgent, auction: SimAuction, is_high_demand: bool) -> float:
-    """Compute willingness-to-pay for an auction slot."""
+def utility_factor(agent: SimAgent, auction: SimAuction, is_high_demand: bool) -> float:
+    """The part of the willingness-to-pay that is fixed for the day: everything
+    but the booking need, which changes as the agent books."""
     # Location preference multiplier
     if auction.location_index == agent.preferred_location:
         location_mult = 1.0
@@ -61,21 +65,56 @@ def compute_utility(agent: SimAgent, auction: SimAuction, is_high_demand: bool)
     # High-demand multiplier (exam periods increase WTP)
     high_demand_mult = 1.4 if is_high_demand else 1.0
 
-    # Booking need: agents with fewer bookings want rooms more
-    booking_need = max(1.0, 1.5 - 0.1 * len(agent.bookings))
+    return agent.base_value * location_mult * time_mult * urgency_mult * high_demand_mult
+
+
+def booking_need(agent: SimAgent) -> float:
+    """Booking need: agents with fewer bookings want rooms more."""
+    return max(1.0, 1.5 - 0.1 * len(agent.bookings))
 
-    wtp = agent.base_value * location_mult * time_mult * urgency_mult * high_demand_mult * booking_need
-    return wtp
+
+def day_utility_factors(
+    agents: List[SimAgent], auctions: List[SimAuction], is_high_demand: bool,
+) -> List[List[float]]:
+    """`utility_factor` for every agent (by id) x auction (by position) of a day.
+
+    Built once when the day's auctions open, so bidding only looks up a
+    factor and multiplies in the booking need. An agent has at most four
+    distinct factors (location and time match or not), so each is computed
+    once per agent.
+    """
+    table: List[List[float]] = [[] for _ in agents]
+    for agent in agents:
+        by_match = {}
+        row = table[agent.id]
+        for auction in auctions:
+            match = (auction.location_index == agent.preferred_location,
+                     auction.time_index == agent.preferred_time)
+            factor = by_match.get(match)
+            if factor is None:
+                factor = by_match[match] = utility_factor(agent, auction, is_high_demand)
+            row.append(factor)
+    return table
+
+
+def compute_utility(agent: SimAgent, auction: SimAuction, is_high_demand: bool) -> float:
+    """Compute willingness-to-pay for an auction slot."""
+    return utility_factor(agent, auction, is_high_demand) * booking_need(agent)
 
 
 def should_bid(agent: SimAgent, auction: SimAuction, is_high_demand: bool) -> bool:
     """Decide if agent should bid at the current auction price."""
+    return bids_at(agent, auction, utility_factor(agent, auction, is_high_demand))
+
+
+def bids_at(agent: SimAgent, auction: SimAuction, factor: float) -> bool:
+    """`should_bid` given the agent's `utility_factor` for the auction."""
     if auction.completed:
         return False
     if agent.balance < auction.current_price:
         return False
 
-    wtp = compute_utility(agent, auction, is_high_demand)
+    wtp = factor * booking_need(agent)
 
     # Budget sensitivity scales down WTP (sensitive agents wait for lower prices)
     adjusted_wtp = wtp * (1.0 - 0.5 * agent.budget_sensitivity)
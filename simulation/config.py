@@ -68,6 +68,9 @@ class SimulationConfig:
     # Random seed
     seed: int = 42
 
+    # "fast": pure Python reference engine; "vectorized": NumPy engine for large markets
+    engine: str = "fast"
+
 
 @dataclass
 class GridSearchConfig:
@@ -79,3 +82,7 @@ class GridSearchConfig:
 
     num_seeds: int = 3  # runs per combo for averaging
     base_seed: int = 42
+
+    # Parallelism: 1 runs serially in-process, 0 uses one worker process per CPU
+    workers: int = 1
+    chunksize: int = 0  # runs handed to a worker at a time; 0 picks one from the run count
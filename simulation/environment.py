@@ -10,7 +10,7 @@ from gymnasium import spaces
 from pettingzoo import AECEnv
 from pettingzoo.utils import agent_selector
 
-from .agents import compute_utility, generate_agents, should_bid
+from .agents import bids_at, booking_need, day_utility_factors, generate_agents
 from .config import SimulationConfig
 from .market_state import (
     MarketState, SimAuction, SimBooking, SimRoom, SimTimeSlot,
@@ -50,6 +50,7 @@ class RoomMarketEnv(AECEnv):
         self._current_day = 0
         self._current_tick = 0
         self._day_auctions: List[SimAuction] = []
+        self._day_factors: List[List[float]] = []  # utility_factor per agent x day auction
         self._agent_selector = None
         self.agent_selection = None
 
@@ -102,6 +103,7 @@ class RoomMarketEnv(AECEnv):
                 self.state.total_slots_offered += 1
 
         self.state.daily_auctions[day] = auctions
+        self._day_factors = day_utility_factors(self._sim_agents, auctions, self._is_high_demand(day))
         return auctions
 
     @functools.lru_cache(maxsize=None)
@@ -248,11 +250,11 @@ class RoomMarketEnv(AECEnv):
         self.state.daily_utilization[day] = booked / total if total > 0 else 0.0
 
         # Unmet demand: agents who had balance and preferences but didn't book today
-        is_hd = self._is_high_demand(day)
         wanted_count = 0
         for sa in self._sim_agents:
-            for auction in day_auctions:
-                if not auction.completed and should_bid(sa, auction, is_hd):
+            factors = self._day_factors[sa.id]
+            for i, auction in enumerate(day_auctions):
+                if not auction.completed and bids_at(sa, auction, factors[i]):
                     wanted_count += 1
                     break
         self.state.daily_unmet_demand[day] = wanted_count
@@ -288,8 +290,10 @@ class RoomMarketEnv(AECEnv):
 def run_environment_fast(config: SimulationConfig) -> MarketState:
     """Fast-path runner that bypasses PettingZoo AEC machinery.
 
-    Produces identical market outcomes to run_environment() but skips numpy
-    observations, agent_selector, string agent IDs, and reward tracking.
+    Same market rules as run_environment() but skips numpy observations,
+    agent_selector, string agent IDs, and reward tracking. Sold auctions and
+    agents that cannot afford or do not want anything at the current prices
+    sit out of each tick's shuffles and scans.
     """
     rng = random.Random(config.seed)
 
@@ -345,66 +349,92 @@ def run_environment_fast(config: SimulationConfig) -> MarketState:
 
         day_auctions = create_day_auctions(day)
         is_hd = is_high_demand(day)
+        day_factors = day_utility_factors(sim_agents, day_auctions, is_hd)
+        best_factors = [max(row, default=0.0) for row in day_factors]
+
+        # Unsold auctions (positions in day_auctions) and agents that can still
+        # afford the floor price. Both only shrink during a day; sold auctions
+        # and broke agents drop out of the loops below.
+        active = list(range(len(day_auctions)))
+        bidders = [sa for sa in sim_agents if sa.balance >= config.auction_min_price]
 
         for tick in range(config.max_ticks):
-            # Shuffle agent order each tick to avoid bias
-            agent_order = list(sim_agents)
+            if not active:
+                break
+
+            # Only agents that can afford, and would pay, the cheapest open
+            # price take a turn. Shuffle their order each tick to avoid bias.
+            cheapest = min(day_auctions[i].current_price for i in active)
+            agent_order = [
+                sa for sa in bidders
+                if sa.balance >= cheapest
+                and cheapest <= best_factors[sa.id] * booking_need(sa) * (1.0 - 0.5 * sa.budget_sensitivity)
+            ]
             rng.shuffle(agent_order)
+            went_broke = False
 
             for sa in agent_order:
-                # Find a bid — shuffle auction indices to avoid bias
-                indices = list(range(len(day_auctions)))
+                # should_bid, unrolled: the agent's factors, need and
+                # sensitivity are fixed until it books, which ends its turn
+                factors = day_factors[sa.id]
+                need = booking_need(sa)
+                sensitivity = 1.0 - 0.5 * sa.budget_sensitivity
+                balance = sa.balance
+                # Find a bid — shuffle the open auctions to avoid bias
+                indices = list(active)
                 rng.shuffle(indices)
                 for i in indices:
                     auction = day_auctions[i]
-                    if should_bid(sa, auction, is_hd):
+                    price = auction.current_price
+                    if not auction.completed and balance >= price and price <= factors[i] * need * sensitivity:
                         # Process bid
                         state.total_bids_attempted += 1
-                        if not auction.completed and sa.balance >= auction.current_price:
-                            sa.balance -= auction.current_price
-                            auction.completed = True
-                            auction.winner_id = sa.id
-                            auction.clearing_price = auction.current_price
-                            sa.bookings.append(auction.slot_id)
-                            wtp = compute_utility(sa, auction, is_hd)
-                            state.bookings.append(SimBooking(
-                                agent_id=sa.id,
-                                slot_id=auction.slot_id,
-                                price=auction.current_price,
-                                day=day,
-                                preferred_time_match=auction.time_index == sa.preferred_time,
-                                preferred_location_match=auction.location_index == sa.preferred_location,
-                                consumer_surplus=wtp - auction.current_price,
-                            ))
-                            state.total_slots_booked += 1
-                            if day not in state.daily_clearing_prices:
-                                state.daily_clearing_prices[day] = []
-                            state.daily_clearing_prices[day].append(auction.current_price)
+                        sa.balance -= price
+                        auction.completed = True
+                        auction.winner_id = sa.id
+                        auction.clearing_price = price
+                        sa.bookings.append(auction.slot_id)
+                        wtp = factors[i] * booking_need(sa)
+                        state.bookings.append(SimBooking(
+                            agent_id=sa.id,
+                            slot_id=auction.slot_id,
+                            price=price,
+                            day=day,
+                            preferred_time_match=auction.time_index == sa.preferred_time,
+                            preferred_location_match=auction.location_index == sa.preferred_location,
+                            consumer_surplus=wtp - price,
+                        ))
+                        state.total_slots_booked += 1
+                        if day not in state.daily_clearing_prices:
+                            state.daily_clearing_prices[day] = []
+                        state.daily_clearing_prices[day].append(price)
+                        went_broke |= sa.balance < config.auction_min_price
                         break
 
-            # Check if all auctions are done
-            if all(a.completed for a in day_auctions):
-                break
+            active = [i for i in active if not day_auctions[i].completed]
+            if went_broke:
+                bidders = [sa for sa in bidders if sa.balance >= config.auction_min_price]
 
             # Drop prices on active auctions
-            for auction in day_auctions:
-                if not auction.completed:
-                    auction.current_price = max(
-                        auction.min_price,
-                        auction.current_price - auction.price_step,
-                    )
-                    auction.tick += 1
+            for i in active:
+                auction = day_auctions[i]
+                auction.current_price = max(
+                    auction.min_price,
+                    auction.current_price - auction.price_step,
+                )
+                auction.tick += 1
 
         # End-of-day metrics
-        booked = sum(1 for a in day_auctions if a.completed)
         total = len(day_auctions)
+        booked = total - len(active)
         state.daily_utilization[day] = booked / total if total > 0 else 0.0
 
         # Unmet demand
         wanted_count = 0
         for sa in sim_agents:
-            for auction in day_auctions:
-                if not auction.completed and should_bid(sa, auction, is_hd):
+            factors = day_factors[sa.id]
+            for i in active:
+                if bids_at(sa, day_auctions[i], factors[i]):
                     wanted_count += 1
                     break
         state.daily_unmet_demand[day] = wanted_count
@@ -427,7 +457,7 @@ def run_environment(config: SimulationConfig) -> MarketState:
 
         agent_idx = int(agent.split("_")[1])
         sa = env._sim_agents[agent_idx]
-        is_hd = env._is_high_demand(env._current_day)
+        factors = env._day_factors[sa.id]
 
         # Rule-based action selection
         action = 0  # default: pass
@@ -436,7 +466,7 @@ def run_environment(config: SimulationConfig) -> MarketState:
         env.rng.shuffle(indices)
         for i in indices:
             auction = env._day_auctions[i]
-            if should_bid(sa, auction, is_hd):
+            if bids_at(sa, auction, factors[i]):
                 action = i + 1  # 1-indexed
                 break
 
@@ -1,17 +1,29 @@
 """Simulation runner: single runs and grid search."""
 
 import copy
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .config import GridSearchConfig, SimulationConfig
 from .environment import run_environment, run_environment_fast
 from .metrics import StabilityMetrics, compute_metrics
+from .market_state import MarketState
+from .vectorized import run_environment_vectorized
+
+
+def _run_environment(config: SimulationConfig) -> MarketState:
+    if config.engine == "vectorized":
+        return run_environment_vectorized(config)
+    return run_environment_fast(config)
 
 
 def run_single_simulation(config: SimulationConfig) -> Tuple[StabilityMetrics, Dict[str, Any]]:
     """Run a single simulation and return metrics + daily detail."""
-    state = run_environment_fast(config)
+    state = _run_environment(config)
     metrics = compute_metrics(state, config.num_agents)
 
     daily_detail = {
@@ -29,7 +41,8 @@ def run_grid_search(
     """Run grid search over token_amounts x token_frequencies.
 
     Uses the fast-path runner (bypasses PettingZoo overhead) for each run.
-    With ~0.13s per run, 280 runs complete in ~36s serially.
+    With ~0.13s per run, 280 runs complete in ~36s serially; set
+    `grid_config.workers` to spread them over worker processes (same results).
 
     Returns dict with:
       - best: {token_amount, token_frequency, stability_score, metrics}
@@ -37,48 +50,50 @@ def run_grid_search(
       - heatmap: {amounts, frequencies, scores} for chart
     """
     all_results: List[Dict[str, Any]] = []
-    total_combos = len(grid_config.token_amounts) * len(grid_config.token_frequencies)
-    total_runs = total_combos * grid_config.num_seeds
-    completed_runs = 0
+    combos = [
+        (amount, freq)
+        for amount in grid_config.token_amounts
+        for freq in grid_config.token_frequencies
+    ]
+    run_configs = []
+    for amount, freq in combos:
+        for seed_offset in range(grid_config.num_seeds):
+            cfg = copy.copy(grid_config.base_config)
+            cfg.token_amount = amount
+            cfg.token_frequency = freq
+            cfg.seed = grid_config.base_seed + seed_offset
+            run_configs.append(cfg)
+    total_runs = len(run_configs)
 
     # Report 0 progress immediately so the UI sees the job is active
     if progress_callback:
         progress_callback(0.0)
 
-    for amount in grid_config.token_amounts:
-        for freq in grid_config.token_frequencies:
-            seed_metrics: List[StabilityMetrics] = []
-
-            for seed_offset in range(grid_config.num_seeds):
-                cfg = copy.copy(grid_config.base_config)
-                cfg.token_amount = amount
-                cfg.token_frequency = freq
-                cfg.seed = grid_config.base_seed + seed_offset
-
-                state = run_environment_fast(cfg)
-                metrics = compute_metrics(state, cfg.num_agents)
-                seed_metrics.append(metrics)
-
-                completed_runs += 1
-                if progress_callback:
-                    progress_callback(completed_runs / total_runs)
-
-            # Average metrics across seeds
-            avg = _average_metrics(seed_metrics)
-
-            all_results.append({
-                "token_amount": amount,
-                "token_frequency": freq,
-                "stability_score": avg.stability_score,
-                "avg_satisfaction": avg.avg_satisfaction,
-                "preference_match_rate": avg.preference_match_rate,
-                "access_rate": avg.access_rate,
-                "utilization_rate": avg.utilization_rate,
-                "price_volatility": avg.price_volatility,
-                "gini_coefficient": avg.gini_coefficient,
-                "supply_demand_ratio": avg.supply_demand_ratio,
-                "unmet_demand": avg.unmet_demand,
-            })
+    run_metrics: List[StabilityMetrics] = []
+    for metrics in _run_all(run_configs, grid_config.workers, grid_config.chunksize):
+        run_metrics.append(metrics)
+        if progress_callback:
+            progress_callback(len(run_metrics) / total_runs)
+
+    for i, (amount, freq) in enumerate(combos):
+        seed_metrics = run_metrics[i * grid_config.num_seeds:(i + 1) * grid_config.num_seeds]
+
+        # Average metrics across seeds
+        avg = _average_metrics(seed_metrics)
+
+        all_results.append({
+            "token_amount": amount,
+            "token_frequency": freq,
+            "stability_score": avg.stability_score,
+            "avg_satisfaction": avg.avg_satisfaction,
+            "preference_match_rate": avg.preference_match_rate,
+            "access_rate": avg.access_rate,
+            "utilization_rate": avg.utilization_rate,
+            "price_volatility": avg.price_volatility,
+            "gini_coefficient": avg.gini_coefficient,
+            "supply_demand_ratio": avg.supply_demand_ratio,
+            "unmet_demand": avg.unmet_demand,
+        })
 
     # Sort by stability score (lower = better)
     all_results.sort(key=lambda r: r["stability_score"])
@@ -117,6 +132,33 @@ def run_grid_search(
     }
 
 
+def _run_one(config: SimulationConfig) -> StabilityMetrics:
+    state = _run_environment(config)
+    return compute_metrics(state, config.num_agents)
+
+
+def _run_all(run_configs: List[SimulationConfig], workers: int, chunksize: int):
+    """Yield the metrics of each run, in the order of `run_configs`.
+
+    Every run seeds its own RNGs from `config.seed`, so fanning them out
+    over worker processes gives exactly the serial results. Workers are
+    spawned rather than forked: the API server calls this from a thread.
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(run_configs))
+    if workers <= 1:
+        for cfg in run_configs:
+            yield _run_one(cfg)
+        return
+
+    # A few chunks per worker keeps IPC low and still balances uneven runs
+    chunksize = chunksize or max(1, math.ceil(len(run_configs) / (workers * 4)))
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        yield from pool.map(_run_one, run_configs, chunksize=chunksize)
+
+
 def _average_metrics(metrics_list: List[StabilityMetrics]) -> StabilityMetrics:
     """Average a list of StabilityMetrics."""
     n = len(metrics_list)
@@ -0,0 +1,59 @@
+"""The NumPy engine against the reference engine.
+
+Runs use different random draws, so the engines are compared in
+distribution: over a handful of seeds every metric's mean must agree
+within four standard errors. `benchmarks/bench_vectorized.py --check` runs
+the same comparison with more seeds and a larger market.
+
+    python -m pytest simulation/test_vectorized.py
+"""
+
+import math
+import statistics
+
+from .config import SimulationConfig
+from .environment import run_environment_fast
+from .metrics import compute_metrics
+from .vectorized import run_environment_vectorized
+
+SEEDS = range(12)
+METRICS = [
+    "stability_score", "avg_satisfaction", "preference_match_rate", "avg_consumer_surplus",
+    "access_rate", "utilization_rate", "price_volatility", "gini_coefficient", "supply_demand_ratio",
+]
+
+
+def test_metrics_match_reference_in_distribution():
+    runs = {"ref": [], "vec": []}
+    for seed in SEEDS:
+        config = SimulationConfig(num_agents=30, num_rooms=5, seed=seed)
+        runs["ref"].append(compute_metrics(run_environment_fast(config), config.num_agents))
+        runs["vec"].append(compute_metrics(run_environment_vectorized(config), config.num_agents))
+
+    for name in METRICS:
+        ref = [getattr(m, name) for m in runs["ref"]]
+        vec = [getattr(m, name) for m in runs["vec"]]
+        diff = statistics.mean(vec) - statistics.mean(ref)
+        se = math.sqrt((statistics.variance(ref) + statistics.variance(vec)) / len(SEEDS))
+        assert abs(diff) <= 4 * se + 1e-9, f"{name}: reference {statistics.mean(ref):.4f}, vectorized {statistics.mean(vec):.4f}"
+
+
+def test_same_seed_is_reproducible():
+    config = SimulationConfig(num_agents=30, num_rooms=5, seed=3)
+    first = run_environment_vectorized(config)
+    second = run_environment_vectorized(config)
+    assert first.bookings == second.bookings
+    assert first.daily_unmet_demand == second.daily_unmet_demand
+
+
+def test_market_without_auctions_records_empty_days():
+    for config in (SimulationConfig(num_rooms=0), SimulationConfig(slots_per_room_per_day=0)):
+        state = run_environment_vectorized(config)
+        reference = run_environment_fast(config)
+        assert state.bookings == []
+        assert state.total_slots_offered == 0
+        assert state.daily_utilization == reference.daily_utilization
+        assert state.daily_unmet_demand == reference.daily_unmet_demand
+        assert {day: len(a) for day, a in state.daily_auctions.items()} == {
+            day: len(a) for day, a in reference.daily_auctions.items()
+        }
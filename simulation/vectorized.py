@@ -0,0 +1,223 @@
+"""NumPy engine for the market simulation.
+
+Same market rules as `run_environment_fast`, with agents and auctions held
+as column arrays instead of dataclasses:
+
+- Once per day the full agents x auctions bid threshold matrix (the
+  `should_bid` WTP, scaled by budget sensitivity, before booking need) is
+  built from the agents' preference matches.
+- Each tick every agent that can afford and wants at least one open
+  auction picks one of those at random, like the reference agent taking the
+  first eligible auction in its shuffled order. Where several agents pick
+  the same auction, the one earliest in that tick's seeded agent order wins.
+  The others pick again among the auctions still open until every agent has
+  booked or has nothing left it wants.
+
+The draws differ from the reference engine's, so single runs do not match
+it exactly, but metrics agree in distribution over seeds
+(`test_vectorized.py`; `benchmarks/bench_vectorized.py --check` runs the
+larger comparison). The agent population is the
+same for a given seed.
+"""
+
+import random
+
+import numpy as np
+
+from .agents import generate_agents
+from .config import SimulationConfig
+from .market_state import MarketState, SimAuction, SimBooking, SimRoom, SimTimeSlot
+
+
+def run_environment_vectorized(config: SimulationConfig) -> MarketState:
+    """Run a full simulation with the NumPy engine and return the market state."""
+    sim_agents = generate_agents(config, random.Random(config.seed))
+    rng = np.random.default_rng(config.seed)
+
+    num_agents = len(sim_agents)
+    pref_time = np.array([a.preferred_time for a in sim_agents], dtype=np.int64)
+    pref_loc = np.array([a.preferred_location for a in sim_agents], dtype=np.int64)
+    urgency = np.array([a.urgency for a in sim_agents])
+    budget_sensitivity = np.array([a.budget_sensitivity for a in sim_agents])
+    base_value = np.array([a.base_value for a in sim_agents])
+    agent_value = base_value * (0.7 + 0.6 * urgency)  # compute_utility without match/demand/need terms
+    bid_scale = agent_value * (1.0 - 0.5 * budget_sensitivity)
+    balance = np.full(num_agents, float(config.token_amount))
+    booking_counts = np.zeros(num_agents, dtype=np.int64)
+
+    state = MarketState()
+    for i in range(config.num_rooms):
+        state.rooms.append(SimRoom(id=i, name=f"Room_{i}", location_index=i))
+
+    # Auction layout of every day: room-major, time slots within a room
+    slots_per_room = config.slots_per_room_per_day
+    num_auctions = config.num_rooms * slots_per_room
+    auction_loc = np.repeat(np.arange(config.num_rooms), slots_per_room)
+    auction_time = np.tile(np.arange(slots_per_room), config.num_rooms)
+
+    if num_auctions == 0:
+        # Nothing to sell: empty days, as the reference engine records them
+        for day in range(config.max_days):
+            state.daily_auctions[day] = []
+            state.daily_utilization[day] = 0.0
+            state.daily_unmet_demand[day] = 0
+        return state
+
+    # Location and time preference multipliers, fixed for the whole run
+    loc_match = pref_loc[:, None] == auction_loc[None, :]
+    time_match = pref_time[:, None] == auction_time[None, :]
+    pref_mult = np.where(loc_match, np.float32(1.0), np.float32(0.5))
+    pref_mult *= np.where(time_match, np.float32(1.0), np.float32(0.6))
+    bid_wtp = np.empty_like(pref_mult)
+
+    def is_high_demand(day: int) -> bool:
+        for start, end in config.high_demand_days:
+            if start <= day <= end:
+                return True
+        return False
+
+    def eligibility(ask: np.ndarray):
+        """Agents that would bid on some open auction right now, and their
+        agents x auctions mask of the auctions they would bid on. `ask` is
+        the current price of open auctions and infinity for closed ones."""
+        if not is_open.any():
+            return np.empty(0, dtype=np.int64), np.empty((0, num_auctions), dtype=bool)
+        need = np.maximum(1.0, 1.5 - 0.1 * booking_counts).astype(np.float32)
+        ask32 = ask.astype(np.float32)
+        # Rule out agents whose best slot of the day is still too dear for them
+        # before touching the matrix; early in the day that is nearly everyone
+        open_asks = ask[is_open]
+        p_min, p_max = open_asks.min(), open_asks.max()
+        rows = np.flatnonzero((row_max * need >= ask32.min()) & (balance >= p_min))
+        wtp = bid_wtp if rows.size == num_agents else bid_wtp[rows]
+        eligible = wtp * need[rows, None] >= ask32
+        # Only agents who cannot afford every open auction need the per-auction check
+        short = np.flatnonzero(balance[rows] < p_max)
+        if short.size:
+            eligible[short] &= balance[rows[short], None] >= ask
+        wanting = eligible.any(axis=1)
+        return rows[wanting], eligible[wanting]
+
+    for day in range(config.max_days):
+        # Token allocation (day 0 got the initial allocation above)
+        if day > 0 and day % config.token_frequency == 0:
+            balance += config.token_amount
+
+        is_hd = is_high_demand(day)
+        demand_mult = 1.4 if is_hd else 1.0
+        np.multiply(pref_mult, (bid_scale * demand_mult).astype(np.float32)[:, None], out=bid_wtp)
+        row_max = bid_wtp.max(axis=1)
+
+        price = np.full(num_auctions, float(config.auction_start_price))
+        ticks = np.zeros(num_auctions, dtype=np.int64)
+        is_open = np.ones(num_auctions, dtype=bool)
+        winner = np.full(num_auctions, -1, dtype=np.int64)
+        day_bookings = []  # (agents, auctions, need) arrays per resolution round
+
+        for tick in range(config.max_ticks):
+            rows, eligible = eligibility(np.where(is_open, price, np.inf))
+            priority = rng.random(num_agents)  # This tick's agent order
+
+            while rows.size:
+                counts = eligible.sum(axis=1)
+                wanting = counts > 0
+                if not wanting.all():
+                    rows, eligible, counts = rows[wanting], eligible[wanting], counts[wanting]
+                    if not rows.size:
+                        break
+
+                # Uniform pick among each agent's eligible auctions
+                nth = (rng.random(rows.size) * counts).astype(np.int64)
+                picks = (np.cumsum(eligible, axis=1, dtype=np.int32) > nth[:, None]).argmax(axis=1)
+
+                # Earliest agent in this tick's order wins each contested auction
+                order = np.lexsort((priority[rows], picks))
+                sorted_picks = picks[order]
+                first = np.ones(order.size, dtype=bool)
+                first[1:] = sorted_picks[1:] != sorted_picks[:-1]
+                won = order[first]
+
+                agents, auctions = rows[won], picks[won]
+                paid = price[auctions]
+                balance[agents] -= paid
+                booking_counts[agents] += 1
+                # Surplus uses the WTP after the booking counts, as in the reference engine
+                day_bookings.append((agents, auctions, np.maximum(1.0, 1.5 - 0.1 * booking_counts[agents])))
+                is_open[auctions] = False
+                winner[auctions] = agents
+                state.total_bids_attempted += won.size
+                state.total_slots_booked += won.size
+
+                eligible[:, auctions] = False
+                still_looking = np.ones(rows.size, dtype=bool)
+                still_looking[won] = False
+                rows, eligible = rows[still_looking], eligible[still_looking]
+
+            if not is_open.any():
+                break
+
+            # Drop prices on active auctions
+            price[is_open] = np.maximum(config.auction_min_price, price[is_open] - config.auction_price_step)
+            ticks[is_open] += 1
+
+        _record_day(state, config, day, demand_mult, price, ticks, winner, day_bookings,
+                    agent_value, pref_loc, pref_time, auction_loc, auction_time)
+
+        # End-of-day metrics
+        booked = int((winner >= 0).sum())
+        state.daily_utilization[day] = booked / num_auctions if num_auctions > 0 else 0.0
+        state.daily_unmet_demand[day] = eligibility(np.where(is_open, price, np.inf))[0].size
+
+    return state
+
+
+def _record_day(state, config, day, demand_mult, price, ticks, winner, day_bookings,
+                agent_value, pref_loc, pref_time, auction_loc, auction_time) -> None:
+    """Materialize the day's slots, auctions and bookings as in the reference engine."""
+    first_slot = state.slot_id_counter + 1
+    auctions = []
+    for j in range(price.size):
+        slot_id = state.next_slot_id()
+        room_id = int(auction_loc[j])
+        state.slots[slot_id] = SimTimeSlot(id=slot_id, room_id=room_id, day=day, time_index=int(auction_time[j]))
+        completed = bool(winner[j] >= 0)
+        auctions.append(SimAuction(
+            id=state.next_auction_id(),
+            slot_id=slot_id,
+            room_id=room_id,
+            day=day,
+            time_index=int(auction_time[j]),
+            location_index=room_id,
+            start_price=config.auction_start_price,
+            min_price=config.auction_min_price,
+            price_step=config.auction_price_step,
+            current_price=float(price[j]),
+            completed=completed,
+            winner_id=int(winner[j]) if completed else None,
+            clearing_price=float(price[j]) if completed else None,
+            tick=int(ticks[j]),
+        ))
+    state.daily_auctions[day] = auctions
+    state.total_slots_offered += price.size
+
+    if not day_bookings:
+        return
+    agents = np.concatenate([b[0] for b in day_bookings])
+    cols = np.concatenate([b[1] for b in day_bookings])
+    need = np.concatenate([b[2] for b in day_bookings])
+    time_ok = auction_time[cols] == pref_time[agents]
+    loc_ok = auction_loc[cols] == pref_loc[agents]
+    wtp = agent_value[agents] * np.where(loc_ok, 1.0, 0.5) * np.where(time_ok, 1.0, 0.6) * demand_mult * need
+    paid = price[cols]
+    for a, j, p, t_ok, l_ok, w in zip(agents.tolist(), cols.tolist(), paid.tolist(),
+                                     time_ok.tolist(), loc_ok.tolist(), wtp.tolist()):
+        state.bookings.append(SimBooking(
+            agent_id=a,
+            slot_id=first_slot + j,
+            price=p,
+            day=day,
+            preferred_time_match=t_ok,
+            preferred_location_match=l_ok,
+            consumer_surplus=w - p,
+        ))
+    state.daily_clearing_prices[day] = paid.tolist()